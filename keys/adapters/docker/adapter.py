@@ -1,6 +1,6 @@
 import shutil
 import subprocess
-from typing import Any
+from typing import Any, Callable
 
 
 def _version(command: list[str]) -> str | None:
@@ -11,13 +11,14 @@ def _version(command: list[str]) -> str | None:
         return None
 
 
-def detect() -> dict[str, Any]:
+def detect(version: Callable[[str], str | None] | None = None) -> dict[str, Any]:
+    version = version or (lambda binary: _version([binary, "--version"]))
     docker_path = shutil.which("docker")
     return {
         "name": "docker",
         "available": docker_path is not None,
         "details": {
-            "docker": _version(["docker", "--version"]) if docker_path else None,
+            "docker": version("docker") if docker_path else None,
         },
     }
 
@@ -1,6 +1,6 @@
 import shutil
 import subprocess
-from typing import Any
+from typing import Any, Callable
 
 
 def _version(command: list[str]) -> str | None:
@@ -11,7 +11,8 @@ def _version(command: list[str]) -> str | None:
         return None
 
 
-def detect() -> dict[str, Any]:
+def detect(version: Callable[[str], str | None] | None = None) -> dict[str, Any]:
+    version = version or (lambda binary: _version([binary, "--version"]))
     node_path = shutil.which("node")
     npm_path = shutil.which("npm")
     tsc_path = shutil.which("tsc")
@@ -19,9 +20,9 @@ def detect() -> dict[str, Any]:
         "name": "node-typescript",
         "available": node_path is not None and npm_path is not None,
         "details": {
-            "node": _version(["node", "--version"]) if node_path else None,
-            "npm": _version(["npm", "--version"]) if npm_path else None,
-            "tsc": _version(["tsc", "--version"]) if tsc_path else None,
+            "node": version("node") if node_path else None,
+            "npm": version("npm") if npm_path else None,
+            "tsc": version("tsc") if tsc_path else None,
         },
     }
 
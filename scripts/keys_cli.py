@@ -1,4 +1,6 @@
 import argparse
+import importlib
+import inspect
 import json
 import os
 import shutil
@@ -14,6 +16,8 @@ CATALOG_PATH = Path("keys/catalog.json")
 CONFIG_PATH = Path("keys/keys.config.json")
 SCHEMA_PATH = Path("keys/catalog.schema.json")
 ADAPTERS_PATH = Path("keys/adapters")
+# Optional: present in the Keys repo, absent when only keys/ and this script are vendored
+TOOLS_PATH = Path(__file__).resolve().parent.parent / "tools"
 
 
 def load_json(path: Path) -> dict[str, Any]:
@@ -245,6 +249,16 @@ def write_keys_report(report: dict[str, Any], output_root: Path) -> tuple[Path,
     return json_path, md_path
 
 
+def import_keys_indexer(module: str) -> Any | None:
+    """``keys_indexer.<module>`` from the repo's tools/, or None if it is not available."""
+    if TOOLS_PATH.is_dir() and str(TOOLS_PATH) not in sys.path:
+        sys.path.insert(0, str(TOOLS_PATH))
+    try:
+        return importlib.import_module(f"keys_indexer.{module}")
+    except ImportError:
+        return None
+
+
 def run_entry(entry: dict[str, Any], profile: dict[str, Any]) -> dict[str, Any]:
     entry_type = entry["type"]
     output_root = resolve_output_root(profile)
@@ -267,6 +281,27 @@ def run_entry(entry: dict[str, Any], profile: dict[str, Any]) -> dict[str, Any]:
     raise ValueError(f"Unsupported entry type: {entry_type}")
 
 
+def record_entry_run(entry: dict[str, Any], result: dict[str, Any], source: str) -> None:
+    execution_log = import_keys_indexer("execution_log")
+    extractors = import_keys_indexer("extractors")
+    if execution_log is None or extractors is None:
+        return
+    repo_root = Path.cwd()
+    try:
+        artifact_id = extractors.artifact_id_for_path(repo_root, Path(entry["path"]))
+    except ValueError:
+        artifact_id = entry["id"]
+    execution_log.record_execution(
+        repo_root,
+        artifact_id,
+        result["status"] == "success",
+        source,
+        duration_ms=result.get("duration_seconds", 0.0) * 1000,
+        error=result.get("error"),
+        details={"entry": entry["id"], "output_path": result.get("output_path")},
+    )
+
+
 def run_verification(entry: dict[str, Any], profile: dict[str, Any]) -> dict[str, Any]:
     if profile["network_policy"] == "deny" and entry["requires_network"]:
         raise RuntimeError("Network usage is blocked by the selected profile")
@@ -314,6 +349,7 @@ def command_run(args: argparse.Namespace) -> int:
         raise ValueError(f"Entry not found: {args.entry_id}")
 
     run_result = run_entry(entry, profile)
+    record_entry_run(entry, run_result["result"], "keys_cli run")
     report = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "summary": {"command": "run", "entry": entry["id"], "status": run_result["result"]["status"]},
@@ -370,9 +406,15 @@ def command_doctor(args: argparse.Namespace) -> int:
     profile = get_profile(config, profile_name)
     allowed = profile["allowed_adapters"]
     adapters = load_adapters(allowed)
+    toolchain = import_keys_indexer("toolchain")
+    probe = toolchain.default_toolchain_probe() if toolchain else None
     checks = []
     for adapter in adapters:
-        detection = adapter["module"].detect()
+        detect = adapter["module"].detect
+        if probe and "version" in inspect.signature(detect).parameters:
+            detection = detect(version=probe.version)
+        else:
+            detection = detect()
         checks.append(detection)
     report = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -422,21 +464,61 @@ def command_export(args: argparse.Namespace) -> int:
     if entry is None:
         raise ValueError(f"Entry not found: {args.entry_id}")
     output_path = Path(args.output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as archive:
-        archive.write(CATALOG_PATH, arcname="catalog.json")
-        archive.write(SCHEMA_PATH, arcname="catalog.schema.json")
-        entry_path = Path(entry["path"])
-        if entry_path.is_dir():
-            for file in entry_path.rglob("*"):
-                if file.is_file():
-                    archive.write(file, arcname=str(Path(entry["id"]) / file.relative_to(entry_path)))
-        else:
-            archive.write(entry_path, arcname=str(Path(entry["id"]) / entry_path.name))
+    entry_path = Path(entry["path"])
+    files = [("catalog.json", CATALOG_PATH), ("catalog.schema.json", SCHEMA_PATH)]
+    if entry_path.is_dir():
+        for file in sorted(entry_path.rglob("*")):
+            if file.is_file():
+                files.append((f"{entry['id']}/{file.relative_to(entry_path).as_posix()}", file))
+    else:
+        files.append((f"{entry['id']}/{entry_path.name}", entry_path))
+    if args.format == "dir":
+        return export_directory(entry, files, output_path)
+
+    pack_writer = import_keys_indexer("pack_writer")
+    compression = import_keys_indexer("compression")
+    if pack_writer is None or compression is None:
+        # Standalone script: plain deflate zip
+        if args.compression != "deflate":
+            raise ValueError("--compression needs tools/keys_indexer; only deflate is available")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for arcname, source in files:
+                archive.write(source, arcname=arcname)
+    else:
+        policy = compression.CompressionPolicy.from_spec(args.compression, workers=args.compress_workers)
+        with pack_writer.PackZipWriter(output_path, "", policy=policy) as archive:
+            archive.add_all([pack_writer.PackMember(path, source=source) for path, source in files])
     print(f"Exported pack to {output_path}")
     return 0
 
 
+def export_directory(entry: dict[str, Any], files: list[tuple[str, Path]], output_path: Path) -> int:
+    # Reflinks make this near-instant for large entries. Never hardlink: editing
+    # the exported copy would change the catalog sources.
+    if output_path.exists() and any(output_path.iterdir()):
+        raise ValueError(f"Export directory is not empty: {output_path}")
+    staging = import_keys_indexer("staging")
+    if staging is None:
+        staged = {}
+        for path, source in files:
+            (output_path / path).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, output_path / path)
+            staged[path] = "copy"
+        methods = {"copy": len(staged)}
+    else:
+        staged = {path: staging.stage_file(source, output_path / path, staging.COPY_ON_WRITE_METHODS) for path, source in files}
+        methods = staging.method_counts(staged)
+    manifest = {
+        "entry_id": entry["id"],
+        "files": staged,
+        "staging": {"methods": methods},
+    }
+    (output_path / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    print(f"Exported pack directory to {output_path} ({manifest['staging']['methods']})")
+    return 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Keys CLI")
     parser.add_argument("--catalog", default=str(CATALOG_PATH))
@@ -480,6 +562,18 @@ def build_parser() -> argparse.ArgumentParser:
     export_parser = subparsers.add_parser("export", help="Export a pack archive")
     export_parser.add_argument("entry_id")
     export_parser.add_argument("--output", required=True)
+    export_parser.add_argument(
+        "--compression",
+        default="deflate",
+        help="METHOD[:LEVEL]: store, deflate, bzip2, lzma or zstd (Python 3.14+); needs tools/keys_indexer except for deflate",
+    )
+    export_parser.add_argument("--compress-workers", type=int, default=4)
+    export_parser.add_argument(
+        "--format",
+        choices=["zip", "dir"],
+        default="zip",
+        help="zip archive, or a directory staged by reflink/copy",
+    )
     export_parser.set_defaults(func=command_export)
 
     return parser
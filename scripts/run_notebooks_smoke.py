@@ -1,6 +1,7 @@
 import argparse
 import json
 import os
+import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,6 +10,11 @@ import nbformat
 from nbclient import NotebookClient
 from nbclient.exceptions import CellExecutionError
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from keys_indexer.execution_log import record_execution
+from keys_indexer.extractors import artifact_id_for_path
+
 NOTEBOOKS = [
     Path("keys-assets/jupyter-keys/jupyter-eda-workflows/notebooks/eda_workflow.ipynb"),
     Path(
@@ -118,6 +124,15 @@ def main() -> int:
         notebook_output_dir = args.output_root / notebook.stem / timestamp
         result = execute_notebook(notebook, notebook_output_dir, args.timeout)
         results.append(result)
+        record_execution(
+            Path.cwd(),
+            artifact_id_for_path(Path.cwd(), notebook),
+            result["status"] == "success",
+            "notebook smoke",
+            duration_ms=result["duration_seconds"] * 1000,
+            error=result["error"],
+            details={"output_path": result["output_path"]},
+        )
 
     report_paths = write_report(results, args.output_root)
     print(f"Smoke report JSON: {report_paths[0]}")
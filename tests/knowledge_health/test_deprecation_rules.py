@@ -0,0 +1,43 @@
+"""Deprecation rule packs evaluated against the symbol index."""
+
+from pathlib import Path
+
+import pytest
+
+from tools.knowledge_health.deprecation_rules import BUILTIN_RULE_PACKS, evaluate
+from tools.knowledge_health.symbol_index import SymbolCache
+
+
+def _rule_ids(source: str) -> list[str]:
+    symbols = SymbolCache().symbols(Path("artifact.py"), source)
+    return [hit.rule.id for hit in evaluate(symbols, BUILTIN_RULE_PACKS)]
+
+
+@pytest.mark.parametrize("source, rule_id", [
+    ("import pandas as pd\ndf = pd.read_csv('a.csv')\ndf = df.append({'a': 1}, ignore_index=True)\n", "pandas-append"),
+    ("import pandas as pd\ndf = pd.DataFrame()\ndf.append(other)\n", "pandas-append"),
+    ("import pandas as pd\nframe = pd.concat([a, b])\nframe.append(c)\n", "pandas-append"),
+    ("import pandas as pd\n\ndef total(df: pd.DataFrame):\n    return df.append(extra)\n", "pandas-append"),
+    ("from pandas import Series\ns = Series([1, 2])\nfor k, v in s.iteritems():\n    pass\n", "pandas-iteritems"),
+])
+def test_dataframe_and_series_methods_are_flagged(source: str, rule_id: str):
+    assert _rule_ids(source) == [rule_id]
+
+
+@pytest.mark.parametrize("source", [
+    # Plain lists derived from pandas values
+    "import pandas as pd\ndf = pd.read_csv('a.csv')\ncols = df.columns.tolist()\ncols.append('total')\n",
+    "import pandas as pd\nrecs = pd.read_csv('a.csv').to_dict('records')\nrecs.append({'a': 1})\n",
+    "import pandas as pd\nnames = list(pd.read_csv('a.csv'))\nnames.append('b')\n",
+    # Mentions outside code
+    "import pandas as pd\n# df.append(row) was removed\nnote = 'use concat instead of df.append'\n",
+])
+def test_list_append_and_text_are_not_flagged(source: str):
+    assert _rule_ids(source) == []
+
+
+def test_rule_hit_lines():
+    source = "import pandas as pd\n\ndf = pd.read_csv('a.csv')\ndf.append(x)\n"
+    symbols = SymbolCache().symbols(Path("artifact.py"), source)
+    [hit] = evaluate(symbols, BUILTIN_RULE_PACKS)
+    assert (hit.pack.label, hit.symbol, hit.lines) == ("pandas@2.2", "pandas.read_csv().append", [4])
@@ -0,0 +1,106 @@
+"""The fused report pipeline must match the separate index, health and drift runs."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tools.keys_indexer.indexer import KeysIndexer
+from tools.knowledge_health.drift_detector import DriftDetector
+from tools.knowledge_health.health_monitor import HealthMonitor
+from tools.knowledge_health.index_repository import IndexRepository
+from tools.knowledge_health.pipeline import run_fused_scan
+
+# Wall-clock fields, set when a check runs rather than from the tree
+# (first_seen too, on a fresh state; it is carried forward by later runs)
+_TIMESTAMPS = {"detected_at", "first_seen", "last_checked", "last_assessed", "last_health_check", "last_updated"}
+
+_RUNBOOK = """# Deploy runbook
+
+## Prerequisites
+
+Access to the deploy host.
+
+## Steps
+
+1. Pull the release branch.
+2. Run the migrations.
+3. Restart the service.
+"""
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setenv("KEYS_HASH_CACHE", ":memory:")
+    root = tmp_path / "repo"
+    _write(root / "scripts" / "clean.py", (
+        '"""Clean the sales export."""\n'
+        "import pandas as pd\n\n"
+        "df = pd.read_csv('sales.csv')\n"
+        "df = df.append({'total': 0}, ignore_index=True)\n"
+    ))
+    _write(root / "scripts" / "report.py", '"""Print a report."""\nimport sys\n\nprint(sys.argv)\n')
+    _write(root / "docs" / "deploy_runbook.md", _RUNBOOK)
+    _write(root / "docs" / "deploy_runbook_v2.md", _RUNBOOK + "4. Check the dashboards.\n")
+    _write(root / "templates" / "config.json", json.dumps({"name": "demo", "version": 1}))
+    return root
+
+
+def _normalise(value):
+    if isinstance(value, dict):
+        return {k: _normalise(v) for k, v in value.items() if k not in _TIMESTAMPS}
+    if isinstance(value, list):
+        return [_normalise(v) for v in value]
+    return value
+
+
+def _report(metrics: dict, alerts: list) -> dict:
+    return _normalise({
+        "metrics": {artifact_id: m.to_dict() for artifact_id, m in metrics.items()},
+        "alerts": [a.to_dict() for a in alerts],
+    })
+
+
+def _components(root: Path, out: Path) -> tuple[IndexRepository, HealthMonitor, DriftDetector]:
+    index = IndexRepository(out / "keys_index" / "kb_index.json")
+    monitor = HealthMonitor(root, index=index, state_path=out / "health_state.json")
+    detector = DriftDetector(root, index=index, symbol_cache_path=out / "symbol_index.json")
+    return index, monitor, detector
+
+
+def test_fused_scan_matches_separate_runs(repo: Path, tmp_path: Path):
+    index, monitor, detector = _components(repo, tmp_path / "separate")
+    indexer = KeysIndexer(repo, output_dir=index.path.parent)
+    indexer.index(validate=True)
+    indexer.save_index()
+    metrics = monitor.check_all_health()
+    expected = _report(metrics, detector.detect_all_drift(metrics))
+
+    index, monitor, detector = _components(repo, tmp_path / "fused")
+    metrics, alerts = run_fused_scan(KeysIndexer(repo, output_dir=index.path.parent), monitor, detector)
+
+    assert metrics
+    assert any(a.drift_type.value == "deprecated_api" for a in alerts)
+    assert _report(metrics, alerts) == expected
+
+
+def test_fused_scan_keeps_incremental_state(repo: Path, tmp_path: Path):
+    index, monitor, detector = _components(repo, tmp_path)
+    first, _ = run_fused_scan(KeysIndexer(repo, output_dir=index.path.parent), monitor, detector)
+
+    assert monitor.state_path.exists()
+    assert monitor.recomputed == set(first)
+
+    index, monitor, detector = _components(repo, tmp_path)
+    second, _ = run_fused_scan(KeysIndexer(repo, output_dir=index.path.parent), monitor, detector)
+
+    assert monitor.recomputed == set()
+    assert {k: m.first_seen for k, m in second.items()} == {k: m.first_seen for k, m in first.items()}
+    assert monitor.score_matrix is not None
+    scores, _ = monitor.rescore(monitor.config)
+    assert len(scores) == len(second)
@@ -0,0 +1,154 @@
+"""Checkpointing for long-running indexing and validation runs."""
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import tempfile
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def default_file_mode() -> int:
+    """Mode of a newly created file under the process umask.
+
+    ``tempfile.mkstemp`` always creates files as 0600; temp files renamed
+    into place are chmod-ed to this so outputs stay readable like any other.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def atomic_write_json(path: Path, data: Any, indent: int | None = 2) -> None:
+    """Write JSON to a temp file in the same directory and rename it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            os.chmod(tmp_name, default_file_mode())
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def git_head(repo_root: Path) -> str:
+    """Return the current HEAD commit of the repository, or "" if unavailable."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            cwd=repo_root,
+        )
+        return result.stdout.strip() if result.returncode == 0 else ""
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return ""
+
+
+def run_fingerprint(repo_root: Path, config: dict[str, Any]) -> str:
+    """Fingerprint a run by repository HEAD and run configuration."""
+    payload = json.dumps(
+        {"head": git_head(repo_root), "config": config},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RunCheckpoint:
+    """Persist per-item progress so an interrupted run can resume.
+
+    Completed items are stored by key together with the payload needed to
+    rebuild their result. The checkpoint is written atomically every
+    ``flush_every`` records and is discarded on load if the run fingerprint
+    (repo HEAD + config) no longer matches.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path, fingerprint: str, flush_every: int = 25):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self.flush_every = max(1, flush_every)
+        self._entries: dict[str, Any] = {}
+        self._pending = 0
+
+    def load(self) -> int:
+        """Load a previous checkpoint; returns the number of resumable entries."""
+        if not self.path.exists():
+            return 0
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.path}: {e}")
+            return 0
+
+        if data.get("version") != self.VERSION or data.get("fingerprint") != self.fingerprint:
+            logger.info(f"Checkpoint {self.path} is stale (HEAD or config changed), starting over")
+            self.clear()
+            return 0
+
+        self._entries = data.get("entries", {})
+        logger.info(f"Resuming from checkpoint with {len(self._entries)} completed items")
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        return self._entries.get(key)
+
+    def items(self):
+        return self._entries.items()
+
+    def record(self, key: str, payload: Any) -> bool:
+        """Record a completed item; returns True if this triggered a flush."""
+        self._entries[key] = payload
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+            return True
+        return False
+
+    def flush(self) -> None:
+        """Atomically write the checkpoint to disk."""
+        atomic_write_json(
+            self.path,
+            {
+                "version": self.VERSION,
+                "fingerprint": self.fingerprint,
+                "updated_at": datetime.now().isoformat(),
+                "entries": self._entries,
+            },
+            indent=None,
+        )
+        self._pending = 0
+
+    def clear(self) -> None:
+        """Remove the checkpoint once a run has completed."""
+        self._entries = {}
+        self._pending = 0
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
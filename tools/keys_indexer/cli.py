@@ -5,10 +5,14 @@ import logging
 import sys
 from pathlib import Path
 
+from .compression import CompressionPolicy, available_methods
 from .indexer import KeysIndexer
+from .integrity import verify_packs
 from .models import ArtifactType
+from .readylayer import ReadyLayerAdapter
 from .repro_generator import ReproPackGenerator
 from .validator import ArtifactValidator
+from .venv_cache import VenvCache, pack_environments
 
 
 def setup_logging(verbose: bool = False):
@@ -20,6 +24,136 @@ def setup_logging(verbose: bool = False):
     )
 
 
+def generate_repro_packs(args: argparse.Namespace, artifacts: list) -> int:
+    """Generate reproduction packs, print a summary and return the number of failed packs."""
+    print("\nGenerating reproduction packs...")
+    generator = ReproPackGenerator(
+        repo_root=args.repo_root,
+        output_dir=args.repro_dir,
+        keep_staging=args.keep_staging,
+        force=args.force_repro,
+        object_store=args.object_store,
+        compression=args.compression,
+    )
+    packs = generator.generate_all(
+        artifacts,
+        runnable_only=True,
+        jobs=args.repro_jobs,
+    )
+    print(f"Generated {len(packs)} reproduction packs ({len(generator.unchanged)} unchanged)")
+    for artifact_id, pack_path in packs.items():
+        print(f"  {artifact_id}: {pack_path}")
+    if generator.failures:
+        print(f"\n  Failed: {len(generator.failures)}")
+        for artifact_id, error in generator.failures.items():
+            print(f"  {artifact_id}: {error}")
+    return len(generator.failures)
+
+
+def verify_repro_packs(args: argparse.Namespace) -> int:
+    """Verify repro packs in parallel and print one line per pack."""
+    pack_paths = args.verify_pack
+    if not pack_paths:
+        packs_dir = args.repro_dir or args.repo_root / "outputs" / "repro_packs"
+        pack_paths = sorted(packs_dir.glob("*_repro.zip")) + sorted(packs_dir.glob("*_repro.json"))
+    if not pack_paths:
+        print("No repro packs found to verify")
+        return 1
+    
+    results = verify_packs(pack_paths, quick=args.quick_verify, jobs=args.verify_jobs)
+    failed = [r for r in results if not r.ok]
+    for result in results:
+        status = "OK" if result.ok else f"FAILED ({result.error})"
+        print(f"  {result.path}: {status}")
+    print(f"Verified {len(results)} packs: {len(results) - len(failed)} ok, {len(failed)} failed")
+    return 1 if failed else 0
+
+
+def manage_venv_cache(args: argparse.Namespace) -> int:
+    """Prewarm and/or garbage-collect the shared repro virtualenv cache."""
+    packs_dir = args.repro_dir or args.repo_root / "outputs" / "repro_packs"
+    cache = VenvCache(root=args.venv_cache, wheelhouse=args.wheelhouse)
+    failed = 0
+    
+    if args.venv_prewarm:
+        print(f"Prewarming virtualenvs in {cache.root} (wheelhouse: {cache.wheelhouse})")
+        for key, status in cache.prewarm(packs_dir).items():
+            print(f"  {key}: {status}")
+            failed += status.startswith("failed")
+    
+    if args.venv_gc:
+        referenced = set(pack_environments(packs_dir))
+        removed = cache.gc(referenced=referenced, max_age_days=args.venv_max_age_days)
+        print(f"Removed {len(removed)} cached virtualenvs from {cache.root}")
+        for key in removed:
+            print(f"  {key}")
+    
+    return 1 if failed else 0
+
+
+def print_readiness(adapter: ReadyLayerAdapter, readiness: dict) -> int:
+    """Print the readiness summary and return 1 if critical assets are not ready."""
+    is_ready, failures = adapter.check_critical(readiness)
+    print(f"\nReadiness: {readiness['overall_status']}")
+    for category, data in readiness["categories"].items():
+        print(f"  {category}: {data['readiness_score']}% ({data['runnable']}/{data['total']} runnable, {data['status']})")
+    for failure in failures:
+        print(f"  - {failure}")
+    return 0 if is_ready else 1
+
+
+def write_readiness(args: argparse.Namespace, indexer: KeysIndexer, artifacts: list) -> int:
+    """Write a full ReadyLayer readiness report for ``artifacts``."""
+    adapter = ReadyLayerAdapter(args.repo_root, packs_dir=args.repro_dir)
+    readiness = adapter.convert(artifacts)
+    output_path = adapter.save(readiness, indexer.output_dir / "readiness.json")
+    print(f"\nReadiness report saved to: {output_path}")
+    return print_readiness(adapter, readiness)
+
+
+def update_readiness(args: argparse.Namespace, indexer: KeysIndexer) -> int:
+    """Update the previous readiness report for just the changed paths."""
+    adapter = ReadyLayerAdapter(args.repo_root, packs_dir=args.repro_dir)
+    base_path = args.readiness_base or indexer.output_dir / "readiness.json"
+    previous = adapter.load(base_path)
+    if previous is None:
+        print(f"Error: No readiness report at {base_path}. Run with --readiness first.")
+        return 1
+    
+    changed = indexer.index_paths(args.readiness_changed)
+    indexer.validate(changed)
+    
+    # Artifacts whose file was deleted (or stopped being an artifact) drop out
+    changed_paths = set()
+    for path in map(Path, args.readiness_changed):
+        if path.is_absolute():
+            try:
+                path = path.relative_to(args.repo_root)
+            except ValueError:
+                continue
+        changed_paths.add(str(path))
+    changed_ids = {artifact.id for artifact in changed}
+    removed_ids = [
+        entry["id"] for entry in previous["artifacts"]
+        if entry["path"] in changed_paths and entry["id"] not in changed_ids
+    ]
+    
+    readiness, delta = adapter.convert_incremental(previous, changed, removed_ids)
+    output_path = adapter.save(readiness, indexer.output_dir / "readiness.json")
+    delta_path = adapter.save_delta(delta, indexer.output_dir / "readiness_delta.json")
+    print(f"Updated readiness for {len(changed)} changed and {len(removed_ids)} removed artifacts")
+    print(f"  Report: {output_path}")
+    print(f"  Delta: {delta_path}")
+    print(f"  Status: {delta['overall_status']['before']} -> {delta['overall_status']['after']}")
+    for artifact_id in delta["newly_broken"]:
+        print(f"  Newly broken: {artifact_id}")
+    for artifact_id in delta["fixed"]:
+        print(f"  Fixed: {artifact_id}")
+    for category, change in delta["categories"].items():
+        print(f"  {category}: {change['before']} -> {change['after']} ({change['change']:+})")
+    return print_readiness(adapter, readiness)
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -67,11 +201,17 @@ def main():
     
     parser.add_argument(
         "--no-dry-run",
-        action="store_true",
+        action="store_false",
         dest="dry_run",
         help="Actually execute code during validation (USE WITH CAUTION)",
     )
     
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted --index/--validate-only run from its checkpoint",
+    )
+    
     parser.add_argument(
         "--query",
         type=str,
@@ -96,6 +236,123 @@ def main():
         help="Directory for reproduction packs (default: <repo-root>/outputs/repro_packs)",
     )
     
+    parser.add_argument(
+        "--repro-jobs",
+        type=int,
+        default=1,
+        help="Generate reproduction packs on N worker processes (0 = one per CPU, default: 1)",
+    )
+    
+    parser.add_argument(
+        "--keep-staging",
+        action="store_true",
+        help="Also keep the unzipped pack directory next to each reproduction pack zip",
+    )
+    
+    parser.add_argument(
+        "--force-repro",
+        action="store_true",
+        help="Rebuild reproduction packs even if their inputs are unchanged",
+    )
+    
+    parser.add_argument(
+        "--object-store",
+        action="store_true",
+        help="Store pack contents once in <repro-dir>/objects and write thin pack manifests instead of zips",
+    )
+    
+    parser.add_argument(
+        "--materialize",
+        nargs="+",
+        metavar="ARTIFACT_ID",
+        help="Rebuild standalone zips from object-store pack manifests",
+    )
+    
+    parser.add_argument(
+        "--compression",
+        default="deflate",
+        metavar="METHOD[:LEVEL]",
+        help=f"Compression for pack zips ({', '.join(available_methods())}; default: deflate)",
+    )
+    
+    parser.add_argument(
+        "--compress-workers",
+        type=int,
+        default=4,
+        help="Threads used to compress large pack members (default: 4)",
+    )
+    
+    parser.add_argument(
+        "--verify-pack",
+        nargs="*",
+        type=Path,
+        metavar="PACK",
+        help="Verify repro pack zips/manifests against their Merkle manifest (default: all packs in --repro-dir)",
+    )
+    
+    parser.add_argument(
+        "--quick-verify",
+        action="store_true",
+        help="With --verify-pack, only check zip CRC-32s instead of re-hashing with SHA-256",
+    )
+    
+    parser.add_argument(
+        "--verify-jobs",
+        type=int,
+        default=0,
+        help="Verify packs on N threads (0 = one per CPU, default: 0)",
+    )
+    
+    parser.add_argument(
+        "--venv-prewarm",
+        action="store_true",
+        help="Build the shared virtualenv for every dependency set used by the repro packs",
+    )
+    
+    parser.add_argument(
+        "--venv-gc",
+        action="store_true",
+        help="Remove cached virtualenvs no pack references or unused for --venv-max-age-days",
+    )
+    
+    parser.add_argument(
+        "--venv-cache",
+        type=Path,
+        help="Virtualenv cache directory (default: $KEYS_VENV_CACHE or ~/.cache/keys/venvs)",
+    )
+    
+    parser.add_argument(
+        "--wheelhouse",
+        type=Path,
+        help="Local wheel directory for offline installs (default: $KEYS_WHEELHOUSE or ~/.cache/keys/wheels)",
+    )
+    
+    parser.add_argument(
+        "--venv-max-age-days",
+        type=float,
+        default=30,
+        help="With --venv-gc, also remove environments unused for this many days (default: 30)",
+    )
+    
+    parser.add_argument(
+        "--readiness",
+        action="store_true",
+        help="Write a ReadyLayer readiness report for the indexed artifacts (exit 1 if not ready)",
+    )
+    
+    parser.add_argument(
+        "--readiness-changed",
+        nargs="+",
+        metavar="PATH",
+        help="Update the previous readiness report for only these changed files and write a delta report",
+    )
+    
+    parser.add_argument(
+        "--readiness-base",
+        type=Path,
+        help="Previous readiness report for --readiness-changed (default: <output-dir>/readiness.json)",
+    )
+    
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -111,11 +368,40 @@ def main():
     args = parser.parse_args()
     setup_logging(args.verbose)
     
+    try:
+        args.compression = CompressionPolicy.from_spec(args.compression, workers=args.compress_workers)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    if args.materialize:
+        generator = ReproPackGenerator(
+            repo_root=args.repo_root,
+            output_dir=args.repro_dir,
+            compression=args.compression,
+        )
+        failed = 0
+        for artifact_id in args.materialize:
+            try:
+                print(f"  {artifact_id}: {generator.materialize(artifact_id)}")
+            except (OSError, ValueError) as e:
+                print(f"  {artifact_id}: Error: {e}")
+                failed += 1
+        return 1 if failed else 0
+    
+    if args.verify_pack is not None:
+        return verify_repro_packs(args)
+    
+    if args.venv_prewarm or args.venv_gc:
+        return manage_venv_cache(args)
+    
     indexer = KeysIndexer(
         repo_root=args.repo_root,
         output_dir=args.output_dir,
     )
     
+    if args.readiness_changed:
+        return update_readiness(args, indexer)
+    
     if args.validate_only:
         # Load existing index and validate
         artifacts = indexer.load_index()
@@ -126,9 +412,10 @@ def main():
         print(f"Validating {len(artifacts)} artifacts...")
         validator = ArtifactValidator(
             repo_root=args.repo_root,
-            dry_run=not args.no_dry_run if args.dry_run else True,
+            dry_run=args.dry_run,
+            output_dir=indexer.output_dir,
         )
-        results = validator.validate_all(artifacts)
+        results = validator.validate_all(artifacts, resume=args.resume)
         
         # Save updated index with validation status
         indexer.save_index()
@@ -147,11 +434,16 @@ def main():
         print(f"  Broken: {broken}")
         print(f"\nReport saved to: {report_path}")
         
-        return 0
+        pack_failures = generate_repro_packs(args, artifacts) if args.generate_repro else 0
+        
+        if args.readiness:
+            return write_readiness(args, indexer, artifacts) or (1 if pack_failures else 0)
+        
+        return 1 if pack_failures else 0
     
     if args.index or (not args.query and not args.validate_only):
         # Default action: index everything
-        artifacts = indexer.index(validate=args.validate)
+        artifacts = indexer.index(validate=args.validate, resume=args.resume)
         output_path = indexer.save_index()
         print(f"Indexed {len(artifacts)} artifacts")
         print(f"Index saved to: {output_path}")
@@ -165,16 +457,12 @@ def main():
             if results["issues"]:
                 print(f"\n  Issues found: {len(results['issues'])}")
         
-        if args.generate_repro:
-            print("\nGenerating reproduction packs...")
-            generator = ReproPackGenerator(
-                repo_root=args.repo_root,
-                output_dir=args.repro_dir,
-            )
-            packs = generator.generate_all(indexer.artifacts, runnable_only=True)
-            print(f"Generated {len(packs)} reproduction packs")
-            for artifact_id, pack_path in packs.items():
-                print(f"  {artifact_id}: {pack_path}")
+        pack_failures = generate_repro_packs(args, indexer.artifacts) if args.generate_repro else 0
+        
+        if args.readiness:
+            return write_readiness(args, indexer, indexer.artifacts) or (1 if pack_failures else 0)
+        if pack_failures:
+            return 1
     
     if args.query:
         # Load existing index and query
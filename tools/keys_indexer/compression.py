@@ -0,0 +1,151 @@
+"""Compression policy for reproduction pack and export archives."""
+
+import hashlib
+import zlib
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+# Formats whose payload is already compressed; deflating them again only burns CPU
+ALREADY_COMPRESSED_SUFFIXES = frozenset({
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".zst", ".7z", ".rar", ".whl", ".jar",
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".heic",
+    ".woff", ".woff2", ".mp3", ".mp4", ".m4a", ".mov", ".webm", ".ogg",
+    ".pdf", ".parquet", ".npz", ".docx", ".xlsx", ".pptx",
+})
+
+METHODS = {
+    "store": zipfile.ZIP_STORED,
+    "deflate": zipfile.ZIP_DEFLATED,
+    "bzip2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA,
+}
+# Zstandard zip entries need Python 3.14+
+if hasattr(zipfile, "ZIP_ZSTANDARD"):
+    METHODS["zstd"] = zipfile.ZIP_ZSTANDARD
+
+# Methods whose zip framing is a bare compressed stream we can produce off-thread
+_PRECOMPRESSIBLE = {zipfile.ZIP_DEFLATED}
+
+
+def available_methods() -> list[str]:
+    """Compression methods usable with this Python's zipfile module."""
+    available = []
+    for name, compress_type in METHODS.items():
+        try:
+            zipfile._check_compression(compress_type)
+        except (RuntimeError, NotImplementedError):
+            continue
+        available.append(name)
+    return available
+
+
+@dataclass(frozen=True)
+class CompressionPolicy:
+    """How archive members are compressed.
+
+    ``method`` is one of ``available_methods()``; ``level`` is passed through
+    to the compressor (``None`` uses its default). Members with an
+    already-compressed suffix are always stored. Source members of at least
+    ``parallel_threshold`` bytes are compressed on ``workers`` threads ahead
+    of being written (deflate only).
+    """
+    method: str = "deflate"
+    level: int | None = None
+    workers: int = 4
+    parallel_threshold: int = 4 * 1024 * 1024
+
+    def __post_init__(self):
+        if self.method not in METHODS:
+            raise ValueError(
+                f"Unknown compression method '{self.method}' "
+                f"(available: {', '.join(available_methods())})"
+            )
+        if self.method not in available_methods():
+            raise ValueError(f"Compression method '{self.method}' is not supported by this Python")
+
+    @classmethod
+    def from_spec(cls, spec: str, **kwargs) -> "CompressionPolicy":
+        """Parse ``method`` or ``method:level`` (e.g. ``deflate:9``, ``store``)."""
+        method, _, level = spec.partition(":")
+        try:
+            return cls(method=method.strip().lower(), level=int(level) if level else None, **kwargs)
+        except ValueError as e:
+            raise ValueError(f"Invalid compression spec '{spec}': {e}") from None
+
+    def __str__(self) -> str:
+        return self.method if self.level is None else f"{self.method}:{self.level}"
+
+    def compression_for(self, path: str) -> tuple[int, int | None]:
+        """Return (compress_type, compresslevel) for a member path."""
+        if PurePosixPath(path).suffix.lower() in ALREADY_COMPRESSED_SUFFIXES:
+            return zipfile.ZIP_STORED, None
+        return METHODS[self.method], self.level
+
+    def precompressible(self, path: str, size: int) -> bool:
+        """Whether a member should be compressed on the thread pool."""
+        compress_type, _ = self.compression_for(path)
+        return (
+            self.workers > 1
+            and size >= self.parallel_threshold
+            and compress_type in _PRECOMPRESSIBLE
+        )
+
+
+def precompress_file(path: Path, compresslevel: int | None, chunk_size: int) -> tuple[str, int, int, bytes]:
+    """Deflate a file exactly as zipfile would; returns (sha256, crc32, size, payload).
+
+    zlib and hashlib release the GIL on large buffers, so this scales across threads.
+    """
+    level = zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    h = hashlib.sha256()
+    crc = 0
+    size = 0
+    parts = []
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            parts.append(compressor.compress(chunk))
+    parts.append(compressor.flush())
+    return h.hexdigest(), crc, size, b"".join(parts)
+
+
+def raw_write_supported(zf: zipfile.ZipFile) -> bool:
+    """Whether ``write_precompressed`` can be used with this zipfile implementation."""
+    return (
+        getattr(zf, "_seekable", False)
+        and all(
+            hasattr(zf, name)
+            for name in ("fp", "filelist", "NameToInfo", "start_dir", "_writecheck", "_writing", "_allowZip64")
+        )
+    )
+
+
+def write_precompressed(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, crc: int, size: int, payload: bytes) -> None:
+    """Append an already-compressed member to an open zip.
+
+    zipfile has no public API for this, so it mirrors what ``ZipFile.open(..., "w")``
+    does for a seekable file. Check ``raw_write_supported`` first.
+    """
+    if zf._writing:
+        raise ValueError("Can't write to the ZIP file while another write handle is open")
+    zinfo.flag_bits = 0
+    zinfo.CRC = crc
+    zinfo.file_size = size
+    zinfo.compress_size = len(payload)
+    # Same zip64 decision ZipFile.open makes from the declared size
+    zip64 = size * 1.05 > zipfile.ZIP64_LIMIT or len(payload) > zipfile.ZIP64_LIMIT
+    if zip64 and not zf._allowZip64:
+        raise zipfile.LargeZipFile("Filesize would require ZIP64 extensions")
+    zf.fp.seek(zf.start_dir)
+    zinfo.header_offset = zf.fp.tell()
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    zf.fp.write(zinfo.FileHeader(zip64))
+    zf.fp.write(payload)
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+    zf.start_dir = zf.fp.tell()
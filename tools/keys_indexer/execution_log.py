@@ -0,0 +1,202 @@
+"""Append-only execution log shared by runners, the smoke suite and the scheduler."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Runs kept per artifact in bulk summaries (matches ExecutionHistory.to_dict)
+HISTORY_LIMIT = 10
+
+
+def default_log_path(repo_root: Path) -> Path:
+    """``$KEYS_EXECUTION_LOG`` or ``<repo_root>/outputs/execution_logs/executions.sqlite``."""
+    override = os.environ.get("KEYS_EXECUTION_LOG")
+    return Path(override) if override else Path(repo_root) / "outputs" / "execution_logs" / "executions.sqlite"
+
+
+class ExecutionLogStore:
+    """Execution records for all artifacts in one SQLite database (WAL mode).
+
+    Every run is appended to ``executions``; the same transaction updates a
+    per-artifact row in ``summaries``, so the latest summary for every
+    artifact is a single query. WAL lets several processes (``keys_cli
+    run``, the notebook smoke runner, the revalidation scheduler) append
+    while others read.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    def __reduce__(self):
+        return (ExecutionLogStore, (self.path,))
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS executions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                artifact_id TEXT NOT NULL,
+                source TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                success INTEGER NOT NULL,
+                duration_ms REAL NOT NULL,
+                error TEXT NOT NULL,
+                details TEXT
+            );
+            CREATE INDEX IF NOT EXISTS executions_by_artifact ON executions (artifact_id, id);
+            CREATE TABLE IF NOT EXISTS summaries (
+                artifact_id TEXT PRIMARY KEY,
+                total_attempts INTEGER NOT NULL,
+                successful_runs INTEGER NOT NULL,
+                failed_runs INTEGER NOT NULL,
+                last_success TEXT,
+                last_failure TEXT,
+                last_error_message TEXT NOT NULL,
+                total_duration_ms REAL NOT NULL
+            );
+            """
+        )
+        return conn
+
+    def append(
+        self,
+        artifact_id: str,
+        success: bool,
+        source: str,
+        duration_ms: float = 0.0,
+        error: str | None = None,
+        details: dict[str, Any] | None = None,
+        started_at: datetime | None = None,
+    ) -> None:
+        """Record one execution and fold it into the artifact's summary."""
+        started = (started_at or datetime.now()).isoformat()
+        error = error or ""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT INTO executions (artifact_id, source, started_at, success, duration_ms, error, details)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (artifact_id, source, started, int(success), duration_ms, error,
+                     json.dumps(details, default=str) if details else None),
+                )
+                self._conn.execute(
+                    """
+                    INSERT INTO summaries VALUES (?, 1, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (artifact_id) DO UPDATE SET
+                        total_attempts = total_attempts + 1,
+                        successful_runs = successful_runs + excluded.successful_runs,
+                        failed_runs = failed_runs + excluded.failed_runs,
+                        last_success = COALESCE(excluded.last_success, last_success),
+                        last_failure = COALESCE(excluded.last_failure, last_failure),
+                        last_error_message = CASE WHEN excluded.failed_runs
+                            THEN excluded.last_error_message ELSE last_error_message END,
+                        total_duration_ms = total_duration_ms + excluded.total_duration_ms
+                    """,
+                    (
+                        artifact_id,
+                        int(success),
+                        int(not success),
+                        started if success else None,
+                        None if success else started,
+                        "" if success else error,
+                        duration_ms,
+                    ),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def summaries(self, history_limit: int = HISTORY_LIMIT) -> dict[str, dict[str, Any]]:
+        """Latest summary for every artifact, with its ``history_limit`` most recent runs.
+
+        Two queries in total regardless of how many artifacts there are. The
+        dicts have the same keys as the legacy ``<artifact_id>.json`` logs.
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM summaries").fetchall()
+            recent = self._conn.execute(
+                """
+                SELECT artifact_id, source, started_at, success, duration_ms, error FROM (
+                    SELECT *, ROW_NUMBER() OVER (PARTITION BY artifact_id ORDER BY id DESC) AS n
+                    FROM executions
+                ) WHERE n <= ? ORDER BY artifact_id, id
+                """,
+                (history_limit,),
+            ).fetchall()
+
+        result = {row[0]: _summary_dict(row) for row in rows}
+        for artifact_id, source, started, success, duration_ms, error in recent:
+            if artifact_id in result:
+                result[artifact_id]["execution_history"].append(
+                    _run_dict(source, started, success, duration_ms, error)
+                )
+        return result
+
+    def summary(self, artifact_id: str, history_limit: int = HISTORY_LIMIT) -> dict[str, Any] | None:
+        """Summary for one artifact, or None if it has never run."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM summaries WHERE artifact_id = ?", (artifact_id,)).fetchone()
+            recent = self._conn.execute(
+                "SELECT source, started_at, success, duration_ms, error FROM executions"
+                " WHERE artifact_id = ? ORDER BY id DESC LIMIT ?",
+                (artifact_id, history_limit),
+            ).fetchall()
+        if row is None:
+            return None
+        summary = _summary_dict(row)
+        summary["execution_history"] = [_run_dict(*run) for run in reversed(recent)]
+        return summary
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _summary_dict(row: tuple) -> dict[str, Any]:
+    _, total, successful, failed, last_success, last_failure, last_error, total_duration = row
+    return {
+        "total_attempts": total,
+        "successful_runs": successful,
+        "failed_runs": failed,
+        "last_success": last_success,
+        "last_failure": last_failure,
+        "last_error_message": last_error,
+        "average_duration_ms": total_duration / total if total else 0.0,
+        "execution_history": [],
+    }
+
+
+def _run_dict(source: str, started: str, success: int, duration_ms: float, error: str) -> dict[str, Any]:
+    return {
+        "timestamp": started,
+        "success": bool(success),
+        "source": source,
+        "duration_ms": duration_ms,
+        "error": error or None,
+    }
+
+
+def record_execution(repo_root: Path, artifact_id: str, success: bool, source: str, **kwargs: Any) -> None:
+    """Append to the repo's default store, logging instead of failing the caller."""
+    try:
+        store = ExecutionLogStore(default_log_path(repo_root))
+        try:
+            store.append(artifact_id, success, source, **kwargs)
+        finally:
+            store.close()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Could not record execution of {artifact_id}: {e}")
@@ -5,9 +5,22 @@ import re
 from pathlib import Path
 from typing import Any
 
-import nbformat
-
+from .fingerprint import minhash
 from .models import ArtifactType, Dependency, KnowledgeArtifact, RunnableStatus
+from .scan import ScannedFile, read_file
+
+
+def artifact_id_for_path(repo_root: Path, path: Path) -> str:
+    """Artifact ID for a file under ``repo_root`` (or a path already relative to it)."""
+    path = Path(path)
+    try:
+        path = path.relative_to(repo_root)
+    except ValueError:
+        if path.is_absolute():
+            raise
+    parts = list(path.parts)
+    parts[-1] = Path(parts[-1]).stem  # Remove extension
+    return "_".join(parts).replace("-", "_").lower()
 
 
 class ArtifactExtractor:
@@ -17,28 +30,53 @@ class ArtifactExtractor:
         self.repo_root = repo_root
         self._dependency_cache: dict[str, list[Dependency]] = {}
     
-    def extract(self, path: Path) -> KnowledgeArtifact | None:
-        """Extract metadata from an artifact file."""
-        if not path.exists():
+    def extract(self, path: Path, scanned: ScannedFile | None = None) -> KnowledgeArtifact | None:
+        """Extract metadata from an artifact file.
+        
+        ``scanned`` supplies the file's contents if it has already been read.
+        """
+        if scanned is None and not path.exists():
             return None
         
         suffix = path.suffix.lower()
+        if suffix not in [".ipynb", ".md", ".py", ".ts", ".js", ".json", ".yaml", ".yml"]:
+            return None
+        
+        # Read once here, so the fingerprint below reuses the extractor's read
+        if scanned is None:
+            scanned = read_file(path)
         
         if suffix == ".ipynb":
-            return self._extract_notebook(path)
+            artifact = self._extract_notebook(path, scanned)
         elif suffix == ".md":
-            return self._extract_runbook(path)
+            artifact = self._extract_runbook(path, scanned)
         elif suffix == ".py":
-            return self._extract_script(path)
-        elif suffix in [".ts", ".js", ".json", ".yaml", ".yml"]:
-            return self._extract_template(path)
+            artifact = self._extract_script(path, scanned)
+        else:
+            artifact = self._extract_template(path, scanned)
         
-        return None
+        artifact.content_fingerprint = minhash(self._fingerprint_text(scanned))
+        return artifact
     
-    def _extract_notebook(self, path: Path) -> KnowledgeArtifact:
-        """Extract metadata from Jupyter notebook."""
+    def _fingerprint_text(self, scanned: ScannedFile) -> str:
+        """Text to fingerprint: notebook cell sources (not outputs or metadata), else the whole file."""
+        if scanned.parsed is not None and hasattr(scanned.parsed, "cells"):
+            return "\n".join(cell.source for cell in scanned.parsed.cells)
+        return scanned.text()
+    
+    def _read_text(self, path: Path, scanned: ScannedFile | None) -> str:
+        if scanned is not None:
+            return scanned.text()
         with open(path, "r", encoding="utf-8") as f:
-            nb = nbformat.read(f, as_version=4)
+            return f.read()
+    
+    def _extract_notebook(self, path: Path, scanned: ScannedFile | None = None) -> KnowledgeArtifact:
+        """Extract metadata from Jupyter notebook."""
+        import nbformat
+        
+        nb = nbformat.reads(self._read_text(path, scanned), as_version=4)
+        if scanned is not None:
+            scanned.parsed = nb
         
         title = "Untitled Notebook"
         purpose = ""
@@ -109,10 +147,9 @@ class ArtifactExtractor:
             tags=["notebook", language],
         )
     
-    def _extract_runbook(self, path: Path) -> KnowledgeArtifact:
+    def _extract_runbook(self, path: Path, scanned: ScannedFile | None = None) -> KnowledgeArtifact:
         """Extract metadata from runbook (markdown)."""
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = self._read_text(path, scanned)
         
         title = path.stem.replace("-", " ").title()
         purpose = ""
@@ -173,10 +210,9 @@ class ArtifactExtractor:
             tags=["runbook", "operational"],
         )
     
-    def _extract_script(self, path: Path) -> KnowledgeArtifact:
+    def _extract_script(self, path: Path, scanned: ScannedFile | None = None) -> KnowledgeArtifact:
         """Extract metadata from Python script."""
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = self._read_text(path, scanned)
         
         title = path.stem.replace("_", " ").title()
         purpose = ""
@@ -227,10 +263,9 @@ class ArtifactExtractor:
             tags=["script", "executable"],
         )
     
-    def _extract_template(self, path: Path) -> KnowledgeArtifact:
+    def _extract_template(self, path: Path, scanned: ScannedFile | None = None) -> KnowledgeArtifact:
         """Extract metadata from template files."""
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = self._read_text(path, scanned)
         
         title = path.stem.replace("-", " ").title()
         suffix = path.suffix.lower()
@@ -283,9 +318,7 @@ class ArtifactExtractor:
     
     def _generate_id(self, path: Path) -> str:
         """Generate unique ID from path."""
-        parts = list(path.relative_to(self.repo_root).parts)
-        parts[-1] = Path(parts[-1]).stem  # Remove extension
-        return "_".join(parts).replace("-", "_").lower()
+        return artifact_id_for_path(self.repo_root, path)
     
     def load_declared_dependencies(self, requirements_path: Path) -> list[Dependency]:
         """Load dependencies from requirements.txt or similar."""
@@ -0,0 +1,102 @@
+"""Content fingerprints for near-duplicate detection.
+
+Each artifact's text is split into overlapping word shingles
+(``SHINGLE_SIZE`` words) and summarised as a MinHash signature of
+``NUM_BINS`` 32-bit values, using one-permutation hashing: every shingle is
+hashed once, its low bits pick a bin and its high bits compete for the bin's
+minimum. Empty bins are filled from the next non-empty bin (rotation
+densification), so signatures of small documents stay comparable. The
+fraction of equal bins between two signatures estimates the Jaccard
+similarity of their shingle sets.
+
+Fingerprints are stored in the index as hex strings; documents too short to
+fingerprint meaningfully get an empty string.
+"""
+
+import re
+import zlib
+
+NUM_BINS = 64
+SHINGLE_SIZE = 5
+MIN_TOKENS = 50
+
+_MASK64 = (1 << 64) - 1
+_BASE = 0x100000001B3
+_EMPTY = -1
+_DENSIFY_STEP = 0x9E3779B9
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _mix64(h: int) -> int:
+    """MurmurHash3 finalizer, spreading the rolling hash over all 64 bits."""
+    h ^= h >> 33
+    h = (h * 0xFF51AFD7ED558CCD) & _MASK64
+    h ^= h >> 33
+    h = (h * 0xC4CEB9FE1A85EC53) & _MASK64
+    h ^= h >> 33
+    return h
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_SIZE) -> set[int]:
+    """64-bit hashes of the lowercased word ``size``-grams of ``text``."""
+    return _shingle_hashes(_TOKEN_RE.findall(text.lower()), size)
+
+
+def _shingle_hashes(words: list[str], size: int) -> set[int]:
+    token_hashes: dict[str, int] = {}
+    tokens = [token_hashes.setdefault(word, zlib.crc32(word.encode("utf-8")) + 1) for word in words]
+    if not tokens:
+        return set()
+    if len(tokens) < size:
+        size = len(tokens)
+
+    # Polynomial rolling hash over each window, so every shingle costs O(1)
+    top = pow(_BASE, size - 1, 1 << 64)
+    h = 0
+    for token in tokens[:size]:
+        h = (h * _BASE + token) & _MASK64
+    hashes = {_mix64(h)}
+    for old, new in zip(tokens, tokens[size:]):
+        h = ((h - old * top) * _BASE + new) & _MASK64
+        hashes.add(_mix64(h))
+    return hashes
+
+
+def minhash(text: str) -> str:
+    """MinHash signature of ``text`` as a hex string ("" if shorter than ``MIN_TOKENS`` words)."""
+    words = _TOKEN_RE.findall(text.lower())
+    if len(words) < MIN_TOKENS:
+        return ""
+
+    bins = [_EMPTY] * NUM_BINS
+    for h in _shingle_hashes(words, SHINGLE_SIZE):
+        b = h % NUM_BINS
+        value = h >> 32
+        if bins[b] == _EMPTY or value < bins[b]:
+            bins[b] = value
+
+    filled = [b for b in range(NUM_BINS) if bins[b] != _EMPTY]
+    signature = []
+    for b in range(NUM_BINS):
+        if bins[b] != _EMPTY:
+            signature.append(bins[b])
+            continue
+        # Nearest filled bin to the right (wrapping), offset by the distance
+        distance = next((f - b for f in filled if f > b), None)
+        if distance is None:
+            distance = filled[0] + NUM_BINS - b
+        signature.append((bins[(b + distance) % NUM_BINS] + distance * _DENSIFY_STEP) & 0xFFFFFFFF)
+    return "".join(f"{v:08x}" for v in signature)
+
+
+def decode(fingerprint: str) -> tuple[int, ...]:
+    """Bin values of a stored fingerprint (empty if it has none)."""
+    return tuple(int(fingerprint[i:i + 8], 16) for i in range(0, len(fingerprint), 8))
+
+
+def estimate_similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two decoded fingerprints."""
+    if not a or len(a) != len(b):
+        return 0.0
+    return sum(x == y for x, y in zip(a, b)) / len(a)
@@ -0,0 +1,162 @@
+"""Persistent content-hash cache keyed by file identity and metadata."""
+
+import atexit
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+READ_SIZE = 1024 * 1024
+
+# A file modified within this window of being hashed could change again
+# without its mtime moving (coarse timestamps), so its hash is not cached
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def default_cache_path() -> str:
+    """``$KEYS_HASH_CACHE`` or ``~/.cache/keys/file_hashes.sqlite`` (``:memory:`` disables persistence)."""
+    return os.environ.get("KEYS_HASH_CACHE") or str(Path.home() / ".cache" / "keys" / "file_hashes.sqlite")
+
+
+def hash_file(path: Path, algorithm: str = "sha256") -> str:
+    """Hash a file with 1 MiB reads into a reused buffer."""
+    h = hashlib.new(algorithm)
+    buf = bytearray(READ_SIZE)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.hexdigest()
+
+
+class FileHashCache:
+    """Cache file digests by (device, inode, size, mtime_ns).
+
+    A hit needs only a ``stat``; the file is read again only when one of the
+    four values changes. Backed by SQLite in WAL mode so the indexer, pack
+    workers and knowledge_health can share one cache across processes and
+    runs. Falls back to an in-memory database if the cache file can't be opened.
+    """
+
+    def __init__(self, path: str | Path | None = None, flush_every: int = 200):
+        self.path = str(path) if path else default_cache_path()
+        self.flush_every = flush_every
+        self.hits = 0
+        self.misses = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    def __reduce__(self):
+        # Reopen by path in other processes (e.g. repro pack workers)
+        return (FileHashCache, (self.path, self.flush_every))
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS file_hashes (
+                    dev INTEGER NOT NULL,
+                    ino INTEGER NOT NULL,
+                    algorithm TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    digest TEXT NOT NULL,
+                    PRIMARY KEY (dev, ino, algorithm)
+                )"""
+            )
+            conn.commit()
+            return conn
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Hash cache {self.path} unavailable ({e}), using an in-memory cache")
+            self.path = ":memory:"
+            return self._connect()
+
+    def lookup(self, path: Path, st: os.stat_result | None = None, algorithm: str = "sha256") -> str | None:
+        """Return the cached digest if the file is unchanged, without reading it."""
+        st = st or os.stat(path)
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT size, mtime_ns, digest FROM file_hashes WHERE dev = ? AND ino = ? AND algorithm = ?",
+                    (st.st_dev, st.st_ino, algorithm),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Hash cache lookup failed: {e}")
+            return None
+        if row and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            self.hits += 1
+            return row[2]
+        return None
+
+    def record(self, st: os.stat_result, digest: str, algorithm: str = "sha256") -> None:
+        """Remember a digest computed for the file described by ``st``."""
+        if time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS:
+            return
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?, ?, ?)",
+                    (st.st_dev, st.st_ino, algorithm, st.st_size, st.st_mtime_ns, digest),
+                )
+            except sqlite3.Error as e:
+                logger.debug(f"Hash cache write failed: {e}")
+                return
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._commit()
+
+    def digest(self, path: Path, st: os.stat_result | None = None, algorithm: str = "sha256") -> str:
+        """Return the file's digest, hashing it only on a cache miss."""
+        st = st or os.stat(path)
+        cached = self.lookup(path, st, algorithm)
+        if cached:
+            return cached
+        self.misses += 1
+        digest = hash_file(path, algorithm)
+        # Only trust the result if the file did not change while being read
+        after = os.stat(path)
+        if (after.st_size, after.st_mtime_ns) == (st.st_size, st.st_mtime_ns):
+            self.record(st, digest, algorithm)
+        return digest
+
+    def _commit(self) -> None:
+        try:
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Hash cache commit failed: {e}")
+        self._pending = 0
+
+    def flush(self) -> None:
+        with self._lock:
+            self._commit()
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+
+_default_cache: FileHashCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_hash_cache() -> FileHashCache:
+    """Process-wide shared cache at ``default_cache_path()``."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = FileHashCache()
+            atexit.register(_default_cache.flush)
+        return _default_cache
@@ -4,14 +4,24 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from collections import Counter
+from typing import Any, Iterator
 
+from .checkpoint import RunCheckpoint, run_fingerprint
 from .extractors import ArtifactExtractor
 from .models import ArtifactType, Dependency, KnowledgeArtifact, RunnableStatus
+from .scan import ScannedFile, read_file
 
 logger = logging.getLogger(__name__)
 
 
+def _matches(rel: Path, pattern: str) -> bool:
+    """Whether a repo-relative path would be found by ``repo_root.glob(pattern)``."""
+    if pattern.startswith("**/"):
+        return rel.match(pattern[3:])
+    return len(rel.parts) == len(Path(pattern).parts) and rel.match(pattern)
+
+
 class KeysIndexer:
     """Index knowledge artifacts in the repository."""
     
@@ -37,12 +47,86 @@ class KeysIndexer:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
-    def index(self, validate: bool = False) -> list[KnowledgeArtifact]:
-        """Index all knowledge artifacts in the repository."""
+    def index(self, validate: bool = False, resume: bool = False) -> list[KnowledgeArtifact]:
+        """Index all knowledge artifacts in the repository.
+        
+        With ``resume=True``, files already extracted by an interrupted run
+        (same HEAD and patterns) are restored from the checkpoint instead of
+        being re-extracted.
+        """
         logger.info(f"Starting indexing of {self.repo_root}")
         
         self.artifacts = []
+        checkpoint = self._index_checkpoint()
+        if resume:
+            checkpoint.load()
+        else:
+            checkpoint.clear()
         
+        for artifact_type, path in self._iter_paths():
+            key = f"{artifact_type.value}:{path.relative_to(self.repo_root)}"
+            if key in checkpoint:
+                data = checkpoint.get(key)
+                if data:
+                    self.artifacts.append(KnowledgeArtifact.from_dict(data))
+                continue
+            
+            artifact = self.extractor.extract(path)
+            if artifact:
+                # Load declared dependencies if available
+                self._enrich_dependencies(artifact)
+                self.artifacts.append(artifact)
+                logger.debug(f"Indexed: {artifact.id} ({artifact.title})")
+            checkpoint.record(key, artifact.to_dict() if artifact else None)
+        
+        checkpoint.clear()
+        logger.info(f"Indexed {len(self.artifacts)} artifacts")
+        
+        if validate:
+            self.validate()
+        
+        return self.artifacts
+    
+    def scan(self, validate: bool = False) -> Iterator[tuple[KnowledgeArtifact, ScannedFile]]:
+        """Index the repository as a stream, reading every file exactly once.
+        
+        Yields each extracted artifact (validated if ``validate``) together
+        with the ``ScannedFile`` it came from, so later stages can reuse the
+        bytes, stat and parsed form instead of reopening the file. Finds the
+        same artifacts as ``index``; they are also collected in
+        ``self.artifacts`` for ``save_index``. No checkpoint is kept.
+        """
+        self.artifacts = []
+        found = list(self._iter_paths())
+        # A file matching several patterns is read once and kept until its last use
+        remaining = Counter(path for _, path in found)
+        scanned_files: dict[Path, ScannedFile] = {}
+        
+        for _, path in found:
+            remaining[path] -= 1
+            scanned = scanned_files.get(path)
+            if scanned is None:
+                try:
+                    scanned = read_file(path)
+                except OSError as e:
+                    logger.warning(f"Skipping unreadable {path}: {e}")
+                    continue
+                if remaining[path]:
+                    scanned_files[path] = scanned
+            elif not remaining[path]:
+                del scanned_files[path]
+            
+            artifact = self.extractor.extract(path, scanned)
+            if not artifact:
+                continue
+            self._enrich_dependencies(artifact)
+            if validate:
+                self._validate_artifact(artifact)
+            self.artifacts.append(artifact)
+            yield artifact, scanned
+    
+    def _iter_paths(self) -> Iterator[tuple[ArtifactType, Path]]:
+        """Files matching the patterns, per type and pattern, minus excluded directories."""
         for artifact_type, patterns in self.patterns.items():
             for pattern in patterns:
                 paths = list(self.repo_root.glob(pattern))
@@ -53,20 +137,44 @@ class KeysIndexer:
                     if any(part.startswith("node_modules") or part.startswith(".") 
                            for part in path.parts):
                         continue
-                    
-                    artifact = self.extractor.extract(path)
-                    if artifact:
-                        # Load declared dependencies if available
-                        self._enrich_dependencies(artifact)
-                        self.artifacts.append(artifact)
-                        logger.debug(f"Indexed: {artifact.id} ({artifact.title})")
-        
-        logger.info(f"Indexed {len(self.artifacts)} artifacts")
-        
-        if validate:
-            self.validate()
+                    yield artifact_type, path
+    
+    def index_paths(self, paths: list[Path | str]) -> list[KnowledgeArtifact]:
+        """Extract just the given files, e.g. the ones a PR touched.
         
-        return self.artifacts
+        Paths (absolute or relative to the repo root) are filtered with the
+        same patterns and excludes as ``index``. ``self.artifacts`` is left
+        untouched; paths that are missing or not artifacts are skipped.
+        """
+        artifacts = []
+        seen = set()
+        for path in paths:
+            path = Path(path)
+            if not path.is_absolute():
+                path = self.repo_root / path
+            try:
+                rel = path.relative_to(self.repo_root)
+            except ValueError:
+                continue
+            if rel in seen or any(part.startswith("node_modules") or part.startswith(".") for part in rel.parts):
+                continue
+            seen.add(rel)
+            if not any(_matches(rel, p) for patterns in self.patterns.values() for p in patterns):
+                continue
+            
+            artifact = self.extractor.extract(path)
+            if artifact:
+                self._enrich_dependencies(artifact)
+                artifacts.append(artifact)
+        return artifacts
+    
+    def _index_checkpoint(self) -> RunCheckpoint:
+        """Checkpoint for the indexing run, keyed by HEAD and glob patterns."""
+        config = {t.value: p for t, p in self.patterns.items()}
+        return RunCheckpoint(
+            self.output_dir / ".index_checkpoint.json",
+            run_fingerprint(self.repo_root, {"stage": "index", "patterns": config}),
+        )
     
     def _enrich_dependencies(self, artifact: KnowledgeArtifact) -> None:
         """Enrich artifact with declared dependencies from requirements files."""
@@ -104,12 +212,14 @@ class KeysIndexer:
         
         artifact.dependencies = merged
     
-    def validate(self) -> dict[str, Any]:
-        """Validate indexed artifacts for reproducibility."""
+    def validate(self, artifacts: list[KnowledgeArtifact] | None = None) -> dict[str, Any]:
+        """Validate indexed artifacts (or just ``artifacts``) for reproducibility."""
         logger.info("Validating artifacts...")
+        if artifacts is None:
+            artifacts = self.artifacts
         
         results = {
-            "total": len(self.artifacts),
+            "total": len(artifacts),
             "runnable": 0,
             "partial": 0,
             "broken": 0,
@@ -117,43 +227,9 @@ class KeysIndexer:
             "issues": [],
         }
         
-        for artifact in self.artifacts:
-            issues = []
-            
-            # Check for critical fields
-            if not artifact.title or artifact.title == "Untitled Notebook":
-                issues.append("Missing or generic title")
-            
-            if not artifact.purpose:
-                issues.append("Missing purpose/description")
-            
-            # Check dependency declaration
-            if artifact.type in [ArtifactType.NOTEBOOK, ArtifactType.SCRIPT]:
-                if not artifact.dependencies:
-                    issues.append("No dependencies declared")
-                elif not any(d.source in ["declared", "lockfile"] for d in artifact.dependencies):
-                    issues.append("Only auto-detected dependencies, no lockfile")
-            
-            # Check for inputs/outputs
-            if artifact.type == ArtifactType.SCRIPT:
-                if not artifact.inputs:
-                    issues.append("Script has no declared inputs")
-                if not artifact.outputs:
-                    issues.append("Script has no declared outputs")
-            
-            # Determine runnable status
-            if not issues:
-                artifact.runnable_status = RunnableStatus.RUNNABLE
-                results["runnable"] += 1
-            elif any("broken" in i.lower() or "critical" in i.lower() for i in issues):
-                artifact.runnable_status = RunnableStatus.BROKEN
-                results["broken"] += 1
-            elif len(issues) <= 2:
-                artifact.runnable_status = RunnableStatus.PARTIAL
-                results["partial"] += 1
-            else:
-                results["unknown"] += 1
-            
+        for artifact in artifacts:
+            outcome, issues = self._validate_artifact(artifact)
+            results[outcome] += 1
             if issues:
                 results["issues"].append({
                     "artifact_id": artifact.id,
@@ -165,8 +241,48 @@ class KeysIndexer:
         
         return results
     
+    def _validate_artifact(self, artifact: KnowledgeArtifact) -> tuple[str, list[str]]:
+        """Set an artifact's runnable status; returns the outcome bucket and its issues."""
+        issues = []
+        
+        # Check for critical fields
+        if not artifact.title or artifact.title == "Untitled Notebook":
+            issues.append("Missing or generic title")
+        
+        if not artifact.purpose:
+            issues.append("Missing purpose/description")
+        
+        # Check dependency declaration
+        if artifact.type in [ArtifactType.NOTEBOOK, ArtifactType.SCRIPT]:
+            if not artifact.dependencies:
+                issues.append("No dependencies declared")
+            elif not any(d.source in ["declared", "lockfile"] for d in artifact.dependencies):
+                issues.append("Only auto-detected dependencies, no lockfile")
+        
+        # Check for inputs/outputs
+        if artifact.type == ArtifactType.SCRIPT:
+            if not artifact.inputs:
+                issues.append("Script has no declared inputs")
+            if not artifact.outputs:
+                issues.append("Script has no declared outputs")
+        
+        # Determine runnable status
+        if not issues:
+            artifact.runnable_status = RunnableStatus.RUNNABLE
+            return "runnable", issues
+        elif any("broken" in i.lower() or "critical" in i.lower() for i in issues):
+            artifact.runnable_status = RunnableStatus.BROKEN
+            return "broken", issues
+        elif len(issues) <= 2:
+            artifact.runnable_status = RunnableStatus.PARTIAL
+            return "partial", issues
+        return "unknown", issues
+    
     def save_index(self, filename: str = "kb_index.json") -> Path:
-        """Save the index to JSON file."""
+        """Save the index to JSON file, with each artifact's related neighbours (see ``related``).
+        
+        Neighbours need numpy; without it the index is saved without them.
+        """
         output_path = self.output_dir / filename
         
         index_data = {
@@ -176,6 +292,12 @@ class KeysIndexer:
             "artifact_types": {},
             "artifacts": [a.to_dict() for a in self.artifacts],
         }
+        try:
+            from .related import related_artifacts
+        except ImportError:
+            logger.warning("numpy is not installed; saving the index without related artifacts")
+        else:
+            index_data["related"] = related_artifacts(self.artifacts)
         
         # Count by type
         for artifact in self.artifacts:
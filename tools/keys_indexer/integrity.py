@@ -0,0 +1,170 @@
+"""Merkle roots and integrity verification for reproduction packs."""
+
+import hashlib
+import json
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .object_store import ObjectStore, load_pack_manifest
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def merkle_root(checksums: dict[str, str]) -> str:
+    """Merkle root over {path: sha256} with leaves sorted by path.
+
+    Leaves hash the path together with the file digest, and leaf and inner
+    nodes use distinct prefixes, so neither renames nor tree-shape tricks
+    can produce the same root. An odd node at any level is carried up.
+    """
+    level = [
+        hashlib.sha256(b"\x00" + path.encode("utf-8") + b"\x00" + bytes.fromhex(digest)).digest()
+        for path, digest in sorted(checksums.items())
+    ]
+    if not level:
+        return hashlib.sha256(b"").hexdigest()
+    while len(level) > 1:
+        paired = [
+            hashlib.sha256(b"\x01" + level[i] + level[i + 1]).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0].hex()
+
+
+@dataclass
+class PackVerification:
+    """Outcome of verifying one pack."""
+    path: str
+    ok: bool
+    merkle_root: str | None = None
+    checked: int = 0
+    error: str | None = None
+
+
+def verify_pack(pack_path: Path, quick: bool = False, store: ObjectStore | None = None) -> PackVerification:
+    """Verify a pack zip (or object-store pack manifest) against its manifest.
+
+    Checks that the manifest's Merkle root matches its checksums and that the
+    member set matches, then re-hashes members in path order, stopping at the
+    first mismatch. With ``quick`` a zip's members are only checked against
+    the CRC-32 stored in the zip itself, which is cheaper than SHA-256 but
+    does not detect a consistently rewritten member.
+    """
+    pack_path = Path(pack_path)
+    if pack_path.suffix == ".json":
+        return _verify_object_pack(pack_path, store or ObjectStore(pack_path.parent / "objects"))
+
+    result = PackVerification(path=str(pack_path), ok=False)
+    try:
+        with zipfile.ZipFile(pack_path) as zf:
+            manifest_names = [n for n in zf.namelist() if n.count("/") == 1 and n.endswith("/manifest.json")]
+            if len(manifest_names) != 1:
+                result.error = "manifest.json missing"
+                return result
+            root_name = manifest_names[0].split("/")[0]
+            manifest = json.loads(zf.read(manifest_names[0]))
+            checksums = manifest.get("checksums", {})
+            error = _check_manifest(manifest, result)
+            if error:
+                result.error = error
+                return result
+
+            members = {
+                info.filename[len(root_name) + 1:]: info
+                for info in zf.infolist()
+                if not info.is_dir() and info.filename != f"{root_name}/manifest.json"
+            }
+            if set(members) != set(checksums):
+                missing = sorted(set(checksums) - set(members))
+                extra = sorted(set(members) - set(checksums))
+                result.error = f"member set differs (missing: {missing}, unexpected: {extra})"
+                return result
+
+            for path in sorted(members):
+                h = None if quick else hashlib.sha256()
+                # zipfile validates each member's CRC-32 when it reaches EOF
+                with zf.open(members[path]) as f:
+                    for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                        if h:
+                            h.update(chunk)
+                result.checked += 1
+                if h and h.hexdigest() != checksums[path]:
+                    result.error = f"checksum mismatch: {path}"
+                    return result
+    except (OSError, ValueError, zipfile.BadZipFile) as e:
+        result.error = f"{type(e).__name__}: {e}"
+        return result
+
+    result.ok = True
+    return result
+
+
+def _check_manifest(manifest: dict, result: PackVerification) -> str | None:
+    checksums = manifest.get("checksums", {})
+    result.merkle_root = merkle_root(checksums)
+    recorded = manifest.get("merkle_root")
+    if recorded is None:
+        return "manifest has no merkle_root (pack predates Merkle manifests)"
+    if recorded != result.merkle_root:
+        return "merkle_root does not match manifest checksums"
+    return None
+
+
+def _verify_object_pack(manifest_path: Path, store: ObjectStore) -> PackVerification:
+    result = PackVerification(path=str(manifest_path), ok=False)
+    pack = load_pack_manifest(manifest_path)
+    if pack is None:
+        result.error = "unreadable pack manifest"
+        return result
+
+    objects = {obj["path"]: obj["sha256"] for obj in pack.get("objects", [])}
+    if "manifest.json" not in objects:
+        result.error = "manifest.json missing"
+        return result
+    try:
+        manifest = json.loads(store.path_for(objects.pop("manifest.json")).read_bytes())
+    except (OSError, ValueError) as e:
+        result.error = f"unreadable manifest.json object: {e}"
+        return result
+    error = _check_manifest(manifest, result)
+    if error:
+        result.error = error
+        return result
+    if manifest.get("checksums", {}) != objects:
+        result.error = "pack objects do not match manifest checksums"
+        return result
+
+    for path, digest in sorted(objects.items()):
+        h = hashlib.sha256()
+        try:
+            with open(store.path_for(digest), "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    h.update(chunk)
+        except OSError:
+            result.error = f"missing object for {path}"
+            return result
+        result.checked += 1
+        if h.hexdigest() != digest:
+            result.error = f"checksum mismatch: {path}"
+            return result
+
+    result.ok = True
+    return result
+
+
+def verify_packs(pack_paths: list[Path], quick: bool = False, jobs: int = 0) -> list[PackVerification]:
+    """Verify many packs concurrently (``jobs=0``: one thread per CPU).
+
+    Hashing, CRC checks and inflate all release the GIL, so threads scale.
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(pack_paths)) or 1
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(lambda path: verify_pack(path, quick=quick), pack_paths))
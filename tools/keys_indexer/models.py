@@ -46,6 +46,7 @@ class KnowledgeArtifact:
     runnable_status: RunnableStatus = RunnableStatus.UNKNOWN
     execution_count: int = 0
     tags: list[str] = field(default_factory=list)
+    content_fingerprint: str = ""  # MinHash signature (see fingerprint.py), "" if too short
     
     def to_dict(self) -> dict:
         return {
@@ -67,6 +68,7 @@ class KnowledgeArtifact:
             "runnable_status": self.runnable_status.value,
             "execution_count": self.execution_count,
             "tags": self.tags,
+            "content_fingerprint": self.content_fingerprint,
         }
     
     @classmethod
@@ -90,4 +92,5 @@ class KnowledgeArtifact:
             runnable_status=RunnableStatus(data.get("runnable_status", "unknown")),
             execution_count=data.get("execution_count", 0),
             tags=data.get("tags", []),
+            content_fingerprint=data.get("content_fingerprint", ""),
         )
@@ -0,0 +1,190 @@
+"""Content-addressed blob store shared by reproduction packs."""
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .checkpoint import atomic_write_json, default_file_mode
+from .hash_cache import FileHashCache, hash_file
+from .pack_writer import PackMember
+from .staging import COPY_ON_WRITE_METHODS, reflink, stage_file
+
+
+class ObjectStore:
+    """Store file contents once, addressed by their SHA256.
+
+    Blobs live at ``<root>/<first two hex chars>/<rest of digest>`` so that
+    identical files (boilerplate, shared requirements, shared source trees)
+    are written to disk only once no matter how many packs reference them.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, root: Path, hash_cache: FileHashCache | None = None):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.hash_cache = hash_cache
+
+    def path_for(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:]
+
+    def has(self, digest: str) -> bool:
+        return self.path_for(digest).exists()
+
+    def put_bytes(self, data: bytes) -> str:
+        """Store a blob from memory; returns its digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        if not self.has(digest):
+            self._commit(self._write_temp([data]), digest)
+        return digest
+
+    def put_file(self, path: Path) -> str:
+        """Store a file's contents; returns its digest.
+
+        Where the filesystem supports it the blob is a reflink of the source,
+        so only the hashing pass reads the data. Otherwise the file is copied
+        and hashed in the same pass. Hardlinks are never used: an in-place edit
+        of the source would silently change the blob.
+        """
+        st = os.stat(path)
+        if self.hash_cache:
+            # Unchanged file whose blob is already stored: nothing to read
+            cached = self.hash_cache.lookup(path, st)
+            if cached and self.has(cached):
+                return cached
+
+        tmp_path = self._reflink_temp(path)
+        if tmp_path is not None:
+            digest = self._commit_temp(tmp_path, hash_file(tmp_path))
+            self._remember(st, digest)
+            return digest
+
+        h = hashlib.sha256()
+
+        def chunks():
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                    h.update(chunk)
+                    yield chunk
+
+        tmp_path = self._write_temp(chunks())
+        digest = self._commit_temp(tmp_path, h.hexdigest())
+        self._remember(st, digest)
+        return digest
+
+    def _remember(self, st: os.stat_result, digest: str) -> None:
+        if self.hash_cache:
+            self.hash_cache.record(st, digest)
+
+    def _reflink_temp(self, path: Path) -> Path | None:
+        fd, tmp_name = tempfile.mkstemp(prefix=".blob.", suffix=".tmp", dir=self.root)
+        os.close(fd)
+        try:
+            reflink(path, Path(tmp_name))
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            return None
+        return Path(tmp_name)
+
+    def _commit_temp(self, tmp_path: Path, digest: str) -> str:
+        if self.has(digest):
+            tmp_path.unlink(missing_ok=True)
+        else:
+            self._commit(tmp_path, digest)
+        return digest
+
+    def _write_temp(self, chunks) -> Path:
+        fd, tmp_name = tempfile.mkstemp(prefix=".blob.", suffix=".tmp", dir=self.root)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        return Path(tmp_name)
+
+    def _commit(self, tmp_path: Path, digest: str) -> None:
+        dest = self.path_for(digest)
+        dest.parent.mkdir(exist_ok=True)
+        os.chmod(tmp_path, default_file_mode())
+        # Concurrent writers of the same blob race harmlessly: content is identical
+        os.replace(tmp_path, dest)
+
+
+class PackObjectWriter:
+    """Write pack members into an ObjectStore and record them in a thin manifest.
+
+    Mirrors the PackZipWriter interface. The thin manifest lists every member
+    in write order with its digest and mode, which is all that is needed to
+    rebuild the standalone zip later.
+    """
+
+    def __init__(
+        self,
+        store: ObjectStore,
+        manifest_path: Path,
+        root_name: str,
+        fingerprint: str,
+        staging_dir: Path | None = None,
+    ):
+        self.store = store
+        self.manifest_path = Path(manifest_path)
+        self.root_name = root_name
+        self.fingerprint = fingerprint
+        self.staging_dir = staging_dir
+        self.checksums: dict[str, str] = {}
+        self.staged: dict[str, str] = {}  # Member path -> staging method, for source members
+        self._objects: list[dict[str, Any]] = []
+
+    def __enter__(self) -> "PackObjectWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            atomic_write_json(
+                self.manifest_path,
+                {
+                    "pack": self.root_name,
+                    "fingerprint": self.fingerprint,
+                    "objects": self._objects,
+                },
+            )
+
+    def add_all(self, members: list[PackMember]) -> None:
+        for member in members:
+            self.add(member)
+
+    def add(self, member: PackMember) -> str:
+        """Store a member's contents and return its SHA256."""
+        if member.source is not None:
+            digest = self.store.put_file(member.source)
+            executable = member.executable or bool(os.stat(member.source).st_mode & stat.S_IXUSR)
+        else:
+            digest = self.store.put_bytes(member.data)
+            executable = member.executable
+
+        if self.staging_dir:
+            # Never hardlink out of the store: editing the staged file would corrupt the blob
+            staged = self.staging_dir / member.path
+            method = stage_file(self.store.path_for(digest), staged, COPY_ON_WRITE_METHODS)
+            if member.source is not None:
+                self.staged[member.path] = method
+            staged.chmod(0o755 if executable else 0o644)
+
+        self._objects.append({"path": member.path, "sha256": digest, "executable": executable})
+        self.checksums[member.path] = digest
+        return digest
+
+
+def load_pack_manifest(manifest_path: Path) -> dict[str, Any] | None:
+    """Load a thin pack manifest, or None if it is missing or unreadable."""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,118 @@
+"""Registry of generated reproduction packs, read once by ReadyLayer."""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .checkpoint import atomic_write_json
+from .models import KnowledgeArtifact
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_NAME = "registry.json"
+SCHEMA_VERSION = "1"
+
+# Validation results and derived content fingerprints, not pack inputs:
+# re-validating or re-fingerprinting must not make a pack stale
+_VOLATILE_FIELDS = ("last_verified", "runnable_status", "content_fingerprint")
+
+
+def metadata_digest(artifact: KnowledgeArtifact) -> str:
+    """Hash the indexed metadata of an artifact.
+
+    Compared against the digest recorded when its pack was built, this tells
+    whether the artifact was re-extracted with different metadata since,
+    without touching the pack or the source file.
+    """
+    data = artifact.to_dict()
+    for key in _VOLATILE_FIELDS:
+        data.pop(key, None)
+    encoded = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class PackRegistry:
+    """Map artifact id -> pack entry, stored as ``registry.json`` next to the packs.
+
+    Each entry records the pack path (relative to the packs directory), its
+    fingerprint, when it was built, the generator version and the artifact's
+    ``metadata_digest`` at that time.
+    """
+
+    def __init__(self, packs_dir: Path):
+        self.packs_dir = Path(packs_dir)
+        self.path = self.packs_dir / REGISTRY_NAME
+        self.entries: dict[str, dict[str, Any]] = {}
+
+    def load(self) -> "PackRegistry":
+        """Read the registry from disk; a missing or unreadable file is empty."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.entries = data.get("packs", {})
+        except FileNotFoundError:
+            self.entries = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable pack registry {self.path}: {e}")
+            self.entries = {}
+        return self
+
+    def get(self, artifact_id: str) -> dict[str, Any] | None:
+        return self.entries.get(artifact_id)
+
+    def has_pack(self, artifact_id: str) -> bool:
+        return artifact_id in self.entries
+
+    def is_stale(self, artifact: KnowledgeArtifact, generator_version: str | None = None) -> bool:
+        """Whether the artifact's pack predates its current metadata or generator.
+
+        Source edits that leave the indexed metadata unchanged are only caught
+        by the generator's fingerprint check on the next pack run.
+        """
+        entry = self.entries.get(artifact.id)
+        if entry is None:
+            return False
+        if generator_version and entry.get("generator_version") != generator_version:
+            return True
+        return entry.get("metadata_digest") != metadata_digest(artifact)
+
+    def update(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Merge entries in, keeping ``created_at`` for packs whose fingerprint is unchanged."""
+        for artifact_id, entry in entries.items():
+            old = self.entries.get(artifact_id)
+            if old and old.get("fingerprint") == entry.get("fingerprint") and old.get("created_at"):
+                entry = {**entry, "created_at": old["created_at"]}
+            self.entries[artifact_id] = entry
+
+    def save(self) -> Path:
+        atomic_write_json(self.path, {
+            "schema_version": SCHEMA_VERSION,
+            "updated_at": datetime.now().isoformat(),
+            "packs": dict(sorted(self.entries.items())),
+        })
+        return self.path
+
+
+def pack_entry(
+    artifact: KnowledgeArtifact,
+    pack_path: Path,
+    packs_dir: Path,
+    fingerprint: str,
+    generator_version: str,
+    created_at: datetime | None = None,
+) -> dict[str, Any]:
+    """Registry entry for a pack that was just built (or found unchanged)."""
+    try:
+        path = pack_path.relative_to(packs_dir).as_posix()
+    except ValueError:
+        path = str(pack_path)
+    return {
+        "path": path,
+        "fingerprint": fingerprint,
+        "created_at": (created_at or datetime.now()).isoformat(),
+        "generator_version": generator_version,
+        "metadata_digest": metadata_digest(artifact),
+    }
@@ -0,0 +1,168 @@
+"""Single-pass writer that streams reproduction pack members into a zip."""
+
+import hashlib
+import os
+import stat
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .checkpoint import default_file_mode
+from .compression import CompressionPolicy, precompress_file, raw_write_supported, write_precompressed
+from .staging import COPY_ON_WRITE_METHODS, stage_file
+
+
+@dataclass
+class PackMember:
+    """A file in a reproduction pack, given either as bytes or as a source path."""
+    path: str  # POSIX path relative to the pack root
+    data: bytes | None = None
+    source: Path | None = None
+    executable: bool = False
+
+
+class PackZipWriter:
+    """Write pack members straight into a zip archive.
+
+    Each member is read once: its bytes are hashed while they are streamed
+    into the archive. If a staging directory is given, source files are
+    also staged there by reflink or copy (see ``staging``).
+    The archive is written to a temp file and renamed into place on success.
+
+    Entries carry a fixed timestamp and normalized permissions, so the same
+    members added in the same order always produce a byte-identical zip.
+    Compression follows ``policy`` (deflate at the default level if omitted);
+    ``add_all`` compresses large members on a thread pool.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+    ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+    def __init__(
+        self,
+        zip_path: Path,
+        root_name: str,
+        staging_dir: Path | None = None,
+        policy: CompressionPolicy | None = None,
+        staging_methods: tuple[str, ...] = COPY_ON_WRITE_METHODS,
+    ):
+        self.zip_path = Path(zip_path)
+        self.root_name = root_name  # Top-level directory inside the zip ("" for none)
+        self.staging_dir = staging_dir
+        self.policy = policy or CompressionPolicy()
+        self.staging_methods = staging_methods
+        self.checksums: dict[str, str] = {}
+        self.staged: dict[str, str] = {}  # Member path -> staging method, for source members
+        self._tmp_path: Path | None = None
+        self._zf: zipfile.ZipFile | None = None
+
+    def __enter__(self) -> "PackZipWriter":
+        self.zip_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f".{self.zip_path.name}.", suffix=".tmp", dir=self.zip_path.parent
+        )
+        os.close(fd)
+        self._tmp_path = Path(tmp_name)
+        os.chmod(self._tmp_path, default_file_mode())
+        self._zf = zipfile.ZipFile(self._tmp_path, "w")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._zf.close()
+        if exc_type is None:
+            os.replace(self._tmp_path, self.zip_path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+    def add_all(self, members: list[PackMember]) -> None:
+        """Add members in order, compressing large source files on a thread pool.
+
+        Precompressed members are handed back in their original order, so the
+        archive is identical to adding each member with ``add``.
+        """
+        large = [
+            i for i, member in enumerate(members)
+            if member.source is not None
+            and self.policy.precompressible(member.path, os.stat(member.source).st_size)
+        ]
+        # Extra threads only add overhead on a single core
+        workers = min(self.policy.workers, os.cpu_count() or 1)
+        if not large or workers < 2 or not raw_write_supported(self._zf):
+            for member in members:
+                self.add(member)
+            return
+
+        _, level = self.policy.compression_for(members[large[0]].path)
+        upcoming = iter(large)
+        futures = {}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            def submit_next() -> None:
+                i = next(upcoming, None)
+                if i is not None:
+                    futures[i] = pool.submit(precompress_file, members[i].source, level, self.CHUNK_SIZE)
+
+            # Keep a bounded window of compressed payloads in memory
+            for _ in range(workers * 2):
+                submit_next()
+            for i, member in enumerate(members):
+                if i not in futures:
+                    self.add(member)
+                    continue
+                digest, crc, size, payload = futures.pop(i).result()
+                submit_next()
+                zinfo = self._zip_info(self._arcname(member), self._is_executable(member), member.path)
+                write_precompressed(self._zf, zinfo, crc, size, payload)
+                self.checksums[member.path] = digest
+                self._stage(member)
+
+    def add(self, member: PackMember) -> str:
+        """Stream a member into the archive and return its SHA256."""
+        arcname = self._arcname(member)
+        h = hashlib.sha256()
+        if member.source is not None:
+            zinfo = self._zip_info(arcname, self._is_executable(member), member.path)
+            zinfo.file_size = os.stat(member.source).st_size  # Lets zipfile pick zip64 up front for large files
+            with open(member.source, "rb") as src, self._zf.open(zinfo, "w") as dst:
+                for chunk in iter(lambda: src.read(self.CHUNK_SIZE), b""):
+                    h.update(chunk)
+                    dst.write(chunk)
+        else:
+            zinfo = self._zip_info(arcname, member.executable, member.path)
+            h.update(member.data)
+            self._zf.writestr(zinfo, member.data)
+
+        digest = h.hexdigest()
+        self.checksums[member.path] = digest
+        self._stage(member)
+        return digest
+
+    def _stage(self, member: PackMember) -> None:
+        """Mirror a member into the staging directory, if there is one."""
+        if not self.staging_dir:
+            return
+        staged = self.staging_dir / member.path
+        if member.source is not None:
+            self.staged[member.path] = stage_file(member.source, staged, self.staging_methods)
+        else:
+            staged.parent.mkdir(parents=True, exist_ok=True)
+            staged.write_bytes(member.data)
+            staged.chmod(0o755 if member.executable else 0o644)
+
+    def _arcname(self, member: PackMember) -> str:
+        return f"{self.root_name}/{member.path}" if self.root_name else member.path
+
+    def _is_executable(self, member: PackMember) -> bool:
+        if member.executable or member.source is None:
+            return member.executable
+        return bool(os.stat(member.source).st_mode & stat.S_IXUSR)
+
+    def _zip_info(self, arcname: str, executable: bool, path: str) -> zipfile.ZipInfo:
+        """Build a ZipInfo with a fixed timestamp, normalized mode and policy compression."""
+        zinfo = zipfile.ZipInfo(arcname, date_time=self.ZIP_EPOCH)
+        zinfo.compress_type, zinfo._compresslevel = self.policy.compression_for(path)
+        zinfo.create_system = 3  # Unix, so external_attr means the same everywhere
+        mode = 0o755 if executable else 0o644
+        zinfo.external_attr = (stat.S_IFREG | mode) << 16
+        return zinfo
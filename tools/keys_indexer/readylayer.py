@@ -6,25 +6,158 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from .models import ArtifactType, KnowledgeArtifact, RunnableStatus
+from .models import KnowledgeArtifact, RunnableStatus
+from .pack_registry import PackRegistry
+from .repro_generator import ReproPackGenerator
 
 logger = logging.getLogger(__name__)
 
+# Artifact status -> category counter it adds to (unknown only counts toward total)
+STATUS_COUNTERS = {"ready": "runnable", "degraded": "partial", "critical": "broken"}
+
+
+def _count(counts: dict[str, dict[str, int]], entry: dict[str, Any], sign: int) -> None:
+    """Add (``sign=1``) or remove (``sign=-1``) an artifact entry from category counts."""
+    category = counts.setdefault(entry["type"], {"total": 0, "runnable": 0, "partial": 0, "broken": 0})
+    category["total"] += sign
+    counter = STATUS_COUNTERS.get(entry["status"])
+    if counter:
+        category[counter] += sign
+
+
+def _category_entry(counts: dict[str, int]) -> dict[str, Any]:
+    """Readiness score and status for one category's counts."""
+    total, runnable, partial, broken = counts["total"], counts["runnable"], counts["partial"], counts["broken"]
+    if total == 0:
+        score = 100.0
+    else:
+        score = ((runnable + (partial * 0.5)) / total) * 100
+    
+    status = "ready"
+    if broken > 0:
+        status = "degraded"
+    if broken > (total * 0.2):  # >20% broken
+        status = "critical"
+    
+    return {
+        "total": total,
+        "runnable": runnable,
+        "partial": partial,
+        "broken": broken,
+        "readiness_score": round(score, 2),
+        "status": status,
+    }
+
+
+def _overall_status(categories: dict[str, dict[str, Any]]) -> str:
+    if any(data["status"] == "critical" for data in categories.values()):
+        return "not_ready"
+    return "ready"
+
 
 class ReadyLayerAdapter:
     """Convert Keys index to ReadyLayer readiness format."""
     
-    def __init__(self, repo_root: Path):
+    def __init__(self, repo_root: Path, packs_dir: Path | None = None):
         self.repo_root = repo_root
+        # Loaded once, so pack existence and staleness cost no per-artifact I/O
+        self.registry = PackRegistry(packs_dir or repo_root / "outputs" / "repro_packs").load()
     
     def convert(
         self,
         artifacts: list[KnowledgeArtifact],
         fail_on_broken: bool = True,
     ) -> dict[str, Any]:
-        """Convert artifacts to ReadyLayer readiness report."""
+        """Convert artifacts to ReadyLayer readiness report.
+        
+        Artifact entries, category counts and recommendations are built in a
+        single pass over ``artifacts``.
+        """
+        readiness = self._new_report()
+        counts: dict[str, dict[str, int]] = {}
+        
+        for artifact in artifacts:
+            entry = self._convert_artifact(artifact)
+            readiness["artifacts"].append(entry)
+            _count(counts, entry, 1)
+            
+            recommendation = self._recommendation(artifact)
+            if recommendation:
+                readiness["recommendations"].append(recommendation)
+        
+        readiness["categories"] = {
+            category: _category_entry(category_counts)
+            for category, category_counts in counts.items()
+        }
+        readiness["overall_status"] = _overall_status(readiness["categories"])
+        return readiness
+    
+    def convert_incremental(
+        self,
+        previous: dict[str, Any],
+        changed: list[KnowledgeArtifact],
+        removed_ids: list[str] | tuple[str, ...] = (),
+        fail_on_broken: bool = True,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Update a previous readiness report for changed and removed artifacts.
+        
+        Only ``changed`` is converted: each changed artifact's old entry is
+        subtracted from its category counts and the new one added, and every
+        other entry is carried over from ``previous`` as is. Returns
+        (readiness, delta), where the delta lists artifacts that became
+        broken or were fixed and the per-category score changes.
+        """
+        readiness = self._new_report()
+        counts = {
+            category: {key: data[key] for key in ("total", "runnable", "partial", "broken")}
+            for category, data in previous.get("categories", {}).items()
+        }
+        # Dicts keep insertion order, so replaced entries stay in place and new ones go last
+        entries = {entry["id"]: entry for entry in previous.get("artifacts", [])}
+        new_recommendations = []
+        transitions = []
+        added = []
+        
+        for artifact in changed:
+            entry = self._convert_artifact(artifact)
+            old = entries.get(artifact.id)
+            if old is None:
+                added.append(artifact.id)
+            else:
+                _count(counts, old, -1)
+            _count(counts, entry, 1)
+            entries[artifact.id] = entry
+            transitions.append((artifact.id, old["status"] if old else None, entry["status"]))
+            
+            recommendation = self._recommendation(artifact)
+            if recommendation:
+                new_recommendations.append(recommendation)
+        
+        removed = []
+        for artifact_id in removed_ids:
+            old = entries.pop(artifact_id, None)
+            if old is not None:
+                _count(counts, old, -1)
+                removed.append(artifact_id)
         
-        readiness = {
+        touched = {artifact.id for artifact in changed} | set(removed)
+        readiness["artifacts"] = list(entries.values())
+        readiness["recommendations"] = [
+            rec for rec in previous.get("recommendations", [])
+            if rec["artifact_id"] not in touched
+        ] + new_recommendations
+        readiness["categories"] = {
+            category: _category_entry(category_counts)
+            for category, category_counts in counts.items()
+            if category_counts["total"] > 0
+        }
+        readiness["overall_status"] = _overall_status(readiness["categories"])
+        
+        delta = self._delta(previous, readiness, transitions, added, removed)
+        return readiness, delta
+    
+    def _new_report(self) -> dict[str, Any]:
+        return {
             "schema_version": "1.0.0",
             "generated_at": datetime.now().isoformat(),
             "repository": str(self.repo_root),
@@ -33,71 +166,72 @@ class ReadyLayerAdapter:
             "artifacts": [],
             "recommendations": [],
         }
-        
-        # Group by type
-        by_type: dict[ArtifactType, list[KnowledgeArtifact]] = {}
-        for artifact in artifacts:
-            if artifact.type not in by_type:
-                by_type[artifact.type] = []
-            by_type[artifact.type].append(artifact)
-        
-        # Calculate readiness per category
-        for artifact_type, type_artifacts in by_type.items():
-            total = len(type_artifacts)
-            runnable = sum(1 for a in type_artifacts if a.runnable_status == RunnableStatus.RUNNABLE)
-            partial = sum(1 for a in type_artifacts if a.runnable_status == RunnableStatus.PARTIAL)
-            broken = sum(1 for a in type_artifacts if a.runnable_status == RunnableStatus.BROKEN)
-            
-            # Calculate readiness score
-            if total == 0:
-                score = 100.0
-            else:
-                score = ((runnable + (partial * 0.5)) / total) * 100
-            
-            category_status = "ready"
-            if broken > 0:
-                category_status = "degraded"
-            if broken > (total * 0.2):  # >20% broken
-                category_status = "critical"
-                readiness["overall_status"] = "not_ready"
-            
-            readiness["categories"][artifact_type.value] = {
-                "total": total,
-                "runnable": runnable,
-                "partial": partial,
-                "broken": broken,
-                "readiness_score": round(score, 2),
-                "status": category_status,
+    
+    def _recommendation(self, artifact: KnowledgeArtifact) -> dict[str, Any] | None:
+        """Recommendation for a non-runnable artifact, if any."""
+        if artifact.runnable_status == RunnableStatus.BROKEN:
+            return {
+                "severity": "critical",
+                "artifact_id": artifact.id,
+                "message": f"Critical knowledge asset '{artifact.title}' is broken and needs immediate attention",
+                "action": "Review and fix the artifact",
             }
+        if artifact.runnable_status == RunnableStatus.PARTIAL:
+            return {
+                "severity": "warning",
+                "artifact_id": artifact.id,
+                "message": f"Knowledge asset '{artifact.title}' has issues that may affect reproducibility",
+                "action": "Review validation warnings",
+            }
+        return None
+    
+    def _delta(
+        self,
+        previous: dict[str, Any],
+        readiness: dict[str, Any],
+        transitions: list[tuple[str, str | None, str]],
+        added: list[str],
+        removed: list[str],
+    ) -> dict[str, Any]:
+        """Compact summary of what changed between two readiness reports."""
+        score_changes = {}
+        before_categories = previous.get("categories", {})
+        for category in sorted(set(before_categories) | set(readiness["categories"])):
+            before = before_categories.get(category, {}).get("readiness_score")
+            after = readiness["categories"].get(category, {}).get("readiness_score")
+            if before != after:
+                score_changes[category] = {
+                    "before": before,
+                    "after": after,
+                    "change": round((after or 0) - (before or 0), 2),
+                }
         
-        # Convert individual artifacts
-        for artifact in artifacts:
-            artifact_ready = self._convert_artifact(artifact)
-            readiness["artifacts"].append(artifact_ready)
-            
-            # Generate recommendations for non-runnable artifacts
-            if artifact.runnable_status == RunnableStatus.BROKEN:
-                readiness["recommendations"].append({
-                    "severity": "critical",
-                    "artifact_id": artifact.id,
-                    "message": f"Critical knowledge asset '{artifact.title}' is broken and needs immediate attention",
-                    "action": "Review and fix the artifact",
-                })
-            elif artifact.runnable_status == RunnableStatus.PARTIAL:
-                readiness["recommendations"].append({
-                    "severity": "warning",
-                    "artifact_id": artifact.id,
-                    "message": f"Knowledge asset '{artifact.title}' has issues that may affect reproducibility",
-                    "action": "Review validation warnings",
-                })
-        
-        # Final status check
-        if fail_on_broken and any(
-            a["status"] == "critical" for a in readiness["categories"].values()
-        ):
-            readiness["overall_status"] = "not_ready"
-        
-        return readiness
+        return {
+            "schema_version": "1.0.0",
+            "generated_at": readiness["generated_at"],
+            "base_generated_at": previous.get("generated_at"),
+            "overall_status": {
+                "before": previous.get("overall_status"),
+                "after": readiness["overall_status"],
+            },
+            "changed": [artifact_id for artifact_id, _, _ in transitions],
+            "added": added,
+            "removed": removed,
+            "newly_broken": [
+                artifact_id for artifact_id, before, after in transitions
+                if after == "critical" and before != "critical"
+            ],
+            "fixed": [
+                artifact_id for artifact_id, before, after in transitions
+                if before == "critical" and after != "critical"
+            ],
+            "status_changes": [
+                {"id": artifact_id, "before": before, "after": after}
+                for artifact_id, before, after in transitions
+                if before != after
+            ],
+            "categories": score_changes,
+        }
     
     def _convert_artifact(self, artifact: KnowledgeArtifact) -> dict[str, Any]:
         """Convert single artifact to ReadyLayer format."""
@@ -117,7 +251,8 @@ class ReadyLayerAdapter:
             "status": status_map.get(artifact.runnable_status, "unknown"),
             "last_verified": artifact.last_verified.isoformat() if artifact.last_verified else None,
             "dependencies_declared": len(artifact.dependencies) > 0,
-            "has_repro_pack": True,  # Would check if pack exists
+            "has_repro_pack": self.registry.has_pack(artifact.id),
+            "repro_pack_stale": self.registry.is_stale(artifact, ReproPackGenerator.PACK_VERSION),
             "tags": artifact.tags,
         }
     
@@ -134,6 +269,23 @@ class ReadyLayerAdapter:
         logger.info(f"Readiness report saved to {output_path}")
         return output_path
     
+    def save_delta(self, delta: dict[str, Any], output_path: Path | None = None) -> Path:
+        """Save an incremental readiness delta next to the full report."""
+        if output_path is None:
+            output_path = self.repo_root / "outputs" / "keys_index" / "readiness_delta.json"
+        return self.save(delta, output_path)
+    
+    def load(self, path: Path | None = None) -> dict[str, Any] | None:
+        """Load a previously saved readiness report, or None if there is none."""
+        if path is None:
+            path = self.repo_root / "outputs" / "keys_index" / "readiness.json"
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load readiness report {path}: {e}")
+            return None
+    
     def check_critical(self, readiness: dict[str, Any]) -> tuple[bool, list[str]]:
         """Check if critical knowledge assets are reproducible."""
         is_ready = readiness["overall_status"] == "ready"
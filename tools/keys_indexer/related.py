@@ -0,0 +1,183 @@
+"""Related-artifact neighbours from TF-IDF over artifact metadata.
+
+Each artifact becomes a sparse TF-IDF vector over the words of its title
+and purpose plus its dependency names. Vectors are L2-normalised, so the
+dot product of two rows is their cosine similarity. The top-k neighbours
+of every artifact are found with one sparse product per chunk of rows
+(rows x postings of their terms), with chunks sized to keep the expanded
+products and the dense similarity block under ``budget`` entries.
+
+``save_index`` stores the result in ``kb_index.json`` under ``"related"``,
+so consumers look neighbours up by id instead of recomputing them.
+"""
+
+import re
+
+import numpy as np
+
+from .models import KnowledgeArtifact
+
+RELATED_TOP_K = 5
+MIN_RELATED_SIMILARITY = 0.1
+MAX_DOCUMENT_FREQUENCY = 0.5
+MIN_PRUNED_DOCUMENTS = 100
+
+_WORD_RE = re.compile(r"[a-z][a-z0-9]+")
+
+
+def artifact_terms(artifact: KnowledgeArtifact) -> list[str]:
+    """Terms of an artifact: title and purpose words, and ``dep:<name>`` per dependency."""
+    text = f"{artifact.title} {artifact.purpose}".lower()
+    terms = _WORD_RE.findall(text)
+    terms.extend(f"dep:{d.name.lower()}" for d in artifact.dependencies)
+    return terms
+
+
+def tfidf_matrix(
+    documents: list[list[str]],
+    max_df: float = MAX_DOCUMENT_FREQUENCY,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Row-normalised TF-IDF matrix in CSR form ``(indptr, indices, data)``.
+
+    Term frequencies are sublinear (``1 + log tf``) and IDF is smoothed
+    (``log((1 + n) / (1 + df)) + 1``). Terms in more than ``max_df`` of the
+    documents are dropped once there are ``MIN_PRUNED_DOCUMENTS`` or more:
+    they say little about relatedness, and each costs a product for every
+    pair of documents containing it. Documents without terms get empty rows.
+    """
+    vocabulary: dict[str, int] = {}
+    indptr = [0]
+    indices: list[int] = []
+    counts: list[int] = []
+    for terms in documents:
+        row: dict[int, int] = {}
+        for term in terms:
+            column = vocabulary.setdefault(term, len(vocabulary))
+            row[column] = row.get(column, 0) + 1
+        for column in sorted(row):
+            indices.append(column)
+            counts.append(row[column])
+        indptr.append(len(indices))
+
+    indptr_arr = np.asarray(indptr, dtype=np.int64)
+    indices_arr = np.asarray(indices, dtype=np.int64)
+    counts_arr = np.asarray(counts, dtype=np.float64)
+
+    n = len(documents)
+    df = np.bincount(indices_arr, minlength=len(vocabulary))
+    rows = np.repeat(np.arange(n), np.diff(indptr_arr))
+    keep = df[indices_arr] <= (max_df * n if n >= MIN_PRUNED_DOCUMENTS else n)
+    indices_arr, counts_arr, rows = indices_arr[keep], counts_arr[keep], rows[keep]
+    indptr_arr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=n))))
+
+    idf = np.log((1 + n) / (1 + df)) + 1
+    data = (1 + np.log(counts_arr)) * idf[indices_arr]
+    norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=n))
+    data /= norms[rows]
+    return indptr_arr, indices_arr, data
+
+
+def top_k_neighbours(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    k: int = RELATED_TOP_K,
+    min_similarity: float = MIN_RELATED_SIMILARITY,
+    budget: int = 4_000_000,
+) -> list[list[tuple[int, float]]]:
+    """Each row's ``k`` most cosine-similar other rows above ``min_similarity``, best first."""
+    n = len(indptr) - 1
+    if n == 0:
+        return []
+    row_of = np.repeat(np.arange(n), np.diff(indptr))
+
+    # Column-major copy (postings): rows containing each term, with weights
+    order = np.argsort(indices, kind="stable")
+    n_terms = int(indices.max()) + 1 if len(indices) else 0
+    col_ptr = np.concatenate(([0], np.cumsum(np.bincount(indices, minlength=n_terms))))
+    col_rows = row_of[order]
+    col_data = data[order]
+    posting_len = np.diff(col_ptr)
+
+    # Expanded products per row, to cut the rows into chunks that fit the budget
+    row_cost = np.bincount(row_of, weights=posting_len[indices], minlength=n) + n
+    cumulative = np.cumsum(row_cost)
+
+    neighbours: list[list[tuple[int, float]]] = []
+    start = 0
+    while start < n:
+        done = cumulative[start - 1] if start else 0
+        end = max(int(np.searchsorted(cumulative, done + budget, side="right")), start + 1)
+        neighbours.extend(_chunk_neighbours(
+            start, min(end, n), indptr, indices, data, row_of, col_ptr, col_rows, col_data, posting_len,
+            k, min_similarity,
+        ))
+        start = end
+    return neighbours
+
+
+def _chunk_neighbours(
+    start: int,
+    end: int,
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    row_of: np.ndarray,
+    col_ptr: np.ndarray,
+    col_rows: np.ndarray,
+    col_data: np.ndarray,
+    posting_len: np.ndarray,
+    k: int,
+    min_similarity: float,
+) -> list[list[tuple[int, float]]]:
+    """Top-k neighbours of rows ``start:end`` from their block of the similarity matrix."""
+    n = len(indptr) - 1
+    size = end - start
+    entries = np.arange(indptr[start], indptr[end])
+    terms = indices[entries]
+    lengths = posting_len[terms]
+
+    # One product per (entry in the chunk, row in the entry's term posting)
+    source = np.repeat(np.arange(len(entries)), lengths)
+    offsets = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    positions = col_ptr[terms][source] + offsets
+    flat = (row_of[entries][source] - start) * n + col_rows[positions]
+    products = data[entries][source] * col_data[positions]
+    block = np.bincount(flat, weights=products, minlength=size * n).reshape(size, n)
+    block[np.arange(size), np.arange(start, end)] = 0.0
+
+    take = min(k, n - 1)
+    if take <= 0:
+        return [[] for _ in range(size)]
+    best = np.argpartition(-block, take - 1, axis=1)[:, :take]
+    result = []
+    for r in range(size):
+        candidates = sorted(best[r].tolist(), key=lambda j: (-block[r, j], j))
+        result.append([(j, float(block[r, j])) for j in candidates if block[r, j] > min_similarity])
+    return result
+
+
+def related_artifacts(
+    artifacts: list[KnowledgeArtifact],
+    k: int = RELATED_TOP_K,
+) -> dict[str, list[list]]:
+    """``{artifact id: [[neighbour id, similarity], ...]}`` for the index.
+
+    Duplicate ids keep the entry of their first artifact, and an artifact
+    is never listed as related to its own id.
+    """
+    indptr, indices, data = tfidf_matrix([artifact_terms(a) for a in artifacts])
+    # Ask for extra neighbours in case some share the artifact's id
+    neighbours = top_k_neighbours(indptr, indices, data, k=k + 1)
+
+    related: dict[str, list[list]] = {}
+    for artifact, row in zip(artifacts, neighbours):
+        if artifact.id in related:
+            continue
+        entries = []
+        for j, similarity in row:
+            other = artifacts[j].id
+            if other != artifact.id and all(other != e[0] for e in entries):
+                entries.append([other, round(similarity, 4)])
+        related[artifact.id] = entries[:k]
+    return related
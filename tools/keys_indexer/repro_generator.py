@@ -3,24 +3,105 @@
 import hashlib
 import json
 import logging
+import os
 import shutil
+import stat
+import time
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from .compression import CompressionPolicy
+from .hash_cache import FileHashCache, default_hash_cache
+from .integrity import merkle_root
 from .models import ArtifactType, Dependency, KnowledgeArtifact, RunnableStatus
+from .object_store import ObjectStore, PackObjectWriter, load_pack_manifest
+from .pack_registry import PackRegistry, pack_entry
+from .pack_writer import PackMember, PackZipWriter
+from .staging import method_counts
+from .venv_cache import COMPLETE_MARKER, LAST_USED_MARKER, NOTEBOOK_RUNNER_REQUIREMENTS, env_key, kernel_name
 
 logger = logging.getLogger(__name__)
 
+# Per-process generator used by pool workers in ReproPackGenerator.generate_all
+_worker_generator: "ReproPackGenerator | None" = None
+
+
+def _init_pack_worker(options: dict[str, Any]) -> None:
+    global _worker_generator
+    _worker_generator = ReproPackGenerator(**options)
+
+
+def _generate_pack_worker(
+    artifact_data: dict,
+) -> tuple[str, str | None, str | None, bool, dict[str, Any] | None]:
+    """Generate one pack in a pool worker.
+    
+    Returns (artifact_id, pack_path, error, unchanged, registry entry); the
+    parent process writes the registry.
+    """
+    artifact = KnowledgeArtifact.from_dict(artifact_data)
+    try:
+        pack_path = _worker_generator.generate(artifact)
+        # Pool workers exit without running atexit hooks
+        _worker_generator.hash_cache.flush()
+        unchanged = artifact.id in _worker_generator.unchanged
+        entry = _worker_generator.registry_entries.get(artifact.id)
+        return artifact.id, str(pack_path) if pack_path else None, None, unchanged, entry
+    except Exception as e:
+        return artifact.id, None, f"{type(e).__name__}: {e}", False, None
+
 
 class ReproPackGenerator:
     """Generate reproducible execution bundles for knowledge artifacts."""
     
-    def __init__(self, repo_root: Path, output_dir: Path | None = None):
+    RUNNABLE_TYPES = [ArtifactType.NOTEBOOK, ArtifactType.SCRIPT, ArtifactType.RUNBOOK]
+    
+    # Bump when pack layout or generation logic changes, so existing packs are rebuilt
+    GENERATOR_VERSION = "4"
+    # Bump when any _generate_*_runner template changes
+    RUNNER_TEMPLATE_VERSION = "2"
+    # Recorded in the pack registry; a pack built by another version is stale
+    PACK_VERSION = f"{GENERATOR_VERSION}.{RUNNER_TEMPLATE_VERSION}"
+    
+    def __init__(
+        self,
+        repo_root: Path,
+        output_dir: Path | None = None,
+        keep_staging: bool = False,
+        force: bool = False,
+        object_store: bool = False,
+        compression: CompressionPolicy | None = None,
+        hash_cache: FileHashCache | None = None,
+    ):
         self.repo_root = repo_root
         self.output_dir = output_dir or repo_root / "outputs" / "repro_packs"
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.keep_staging = keep_staging  # Also materialize the unzipped pack directory
+        self.force = force  # Rebuild packs even when their fingerprint is unchanged
+        # Write thin pack manifests over a shared blob store instead of zips
+        self.compression = compression or CompressionPolicy()
+        self.hash_cache = hash_cache or default_hash_cache()
+        self.store = ObjectStore(self.output_dir / "objects", self.hash_cache) if object_store else None
+        self.failures: dict[str, str] = {}
+        self.unchanged: set[str] = set()
+        # Entries for packs built or found unchanged since the last save_registry()
+        self.registry_entries: dict[str, dict[str, Any]] = {}
+        self._installed_versions: dict[str, str] | None = None
+    
+    def _worker_options(self) -> dict[str, Any]:
+        """Constructor arguments needed to rebuild this generator in a worker process."""
+        return {
+            "repo_root": self.repo_root,
+            "output_dir": self.output_dir,
+            "keep_staging": self.keep_staging,
+            "force": self.force,
+            "object_store": self.store is not None,
+            "compression": self.compression,
+            "hash_cache": self.hash_cache,
+        }
     
     def generate(
         self,
@@ -28,67 +109,217 @@ class ReproPackGenerator:
         include_data_stubs: bool = True,
         dry_run: bool = False,
     ) -> Path | None:
-        """Generate a reproduction pack for an artifact."""
-        if artifact.type not in [ArtifactType.NOTEBOOK, ArtifactType.SCRIPT, ArtifactType.RUNBOOK]:
+        """Generate a reproduction pack for an artifact.
+        
+        Returns the pack zip, or with the object store enabled the thin pack
+        manifest (``<artifact_id>_repro.json``; see ``materialize``). If an
+        existing pack was built from the same inputs (same fingerprint in its
+        manifest), it is left untouched and its path is returned.
+        """
+        if artifact.type not in self.RUNNABLE_TYPES:
             logger.debug(f"Skipping {artifact.id}: not a runnable artifact")
             return None
         
-        pack_dir = self._create_pack_directory(artifact)
+        pack_name = f"{artifact.id}_repro"
+        suffix = ".json" if self.store else ".zip"
+        pack_path = self.output_dir / f"{pack_name}{suffix}"
         
         if dry_run:
-            logger.info(f"[DRY-RUN] Would create pack at: {pack_dir}")
-            return pack_dir
+            logger.info(f"[DRY-RUN] Would create pack at: {pack_path}")
+            return pack_path
         
-        # Copy source
-        self._copy_source(artifact, pack_dir)
+        sources = self._source_members(artifact)
+        lock_data = self._lock_data(artifact)
+        fingerprint = self._pack_fingerprint(artifact, sources, lock_data, include_data_stubs)
         
-        # Generate dependency lock
-        self._generate_lockfile(artifact, pack_dir)
+        if not self.force and self._existing_fingerprint(pack_path, pack_name) == fingerprint:
+            if not self.keep_staging or (self.output_dir / pack_name).is_dir():
+                logger.debug(f"Repro pack unchanged: {pack_path}")
+                self.unchanged.add(artifact.id)
+                built_at = datetime.fromtimestamp(pack_path.stat().st_mtime)
+                self._record_pack(artifact, pack_path, fingerprint, built_at)
+                return pack_path
         
-        # Generate runner script
-        self._generate_runner(artifact, pack_dir)
+        staging_dir = self._create_pack_directory(artifact)
         
-        # Create data stubs
+        members = sources + self._lockfile_members(artifact, lock_data)
+        members.extend(self._runner_members(artifact))
         if include_data_stubs:
-            self._create_data_stubs(artifact, pack_dir)
+            members.extend(self._data_stub_members(artifact))
+        members.sort(key=lambda m: m.path)
         
-        # Generate manifest
-        self._generate_manifest(artifact, pack_dir)
-        
-        # Create zip archive
-        zip_path = self._create_zip(pack_dir)
-        
-        logger.info(f"Created repro pack: {zip_path}")
+        if self.store:
+            writer = PackObjectWriter(self.store, pack_path, pack_name, fingerprint, staging_dir)
+        else:
+            writer = PackZipWriter(pack_path, pack_name, staging_dir, self.compression)
+        
+        # Stream everything in one pass; the manifest goes last so it can
+        # carry the checksums computed while writing the other members.
+        with writer:
+            writer.add_all(members)
+            staging = method_counts(writer.staged) if staging_dir else None
+            writer.add(self._manifest_member(artifact, dict(writer.checksums), fingerprint, staging))
+        
+        self._record_pack(artifact, pack_path, fingerprint)
+        logger.info(f"Created repro pack: {pack_path}")
+        return pack_path
+    
+    def _record_pack(
+        self,
+        artifact: KnowledgeArtifact,
+        pack_path: Path,
+        fingerprint: str,
+        created_at: datetime | None = None,
+    ) -> None:
+        self.registry_entries[artifact.id] = pack_entry(
+            artifact, pack_path, self.output_dir, fingerprint, self.PACK_VERSION, created_at
+        )
+    
+    def save_registry(self) -> Path:
+        """Merge the recorded pack entries into ``<output_dir>/registry.json``.
+        
+        ``generate_all`` calls this; call it after using ``generate`` directly.
+        """
+        registry = PackRegistry(self.output_dir).load()
+        registry.update(self.registry_entries)
+        path = registry.save()
+        self.registry_entries = {}
+        return path
+    
+    def materialize(self, artifact_id: str, zip_path: Path | None = None) -> Path:
+        """Rebuild the standalone zip for a pack stored in the object store.
+        
+        The result is byte-identical to the zip ``generate`` would have
+        written without the object store.
+        """
+        pack_name = f"{artifact_id}_repro"
+        manifest_path = self.output_dir / f"{pack_name}.json"
+        manifest = load_pack_manifest(manifest_path)
+        if manifest is None:
+            raise FileNotFoundError(f"No pack manifest found: {manifest_path}")
+        
+        store = self.store or ObjectStore(self.output_dir / "objects")
+        zip_path = zip_path or self.output_dir / f"{pack_name}.zip"
+        
+        with PackZipWriter(zip_path, manifest["pack"], policy=self.compression) as writer:
+            for obj in manifest["objects"]:
+                blob = store.path_for(obj["sha256"])
+                if not blob.exists():
+                    raise FileNotFoundError(f"Missing object {obj['sha256']} for {obj['path']}")
+                digest = writer.add(PackMember(obj["path"], source=blob, executable=obj["executable"]))
+                if digest != obj["sha256"]:
+                    raise ValueError(f"Corrupt object {obj['sha256']} for {obj['path']}")
+        
+        logger.info(f"Materialized repro pack: {zip_path}")
         return zip_path
     
     def generate_all(
         self,
         artifacts: list[KnowledgeArtifact],
         runnable_only: bool = True,
+        jobs: int = 1,
     ) -> dict[str, Path]:
-        """Generate packs for all artifacts."""
-        results = {}
+        """Generate packs for all artifacts.
         
+        Packs are independent, so with ``jobs > 1`` (or ``jobs=0`` for one
+        worker per CPU) they are built on a process pool. A failing pack is
+        logged and recorded in ``self.failures`` without aborting the others.
+        """
+        pending = []
         for artifact in artifacts:
             if runnable_only and artifact.runnable_status != RunnableStatus.RUNNABLE:
                 logger.debug(f"Skipping {artifact.id}: not runnable")
                 continue
-            
-            pack_path = self.generate(artifact)
-            if pack_path:
-                results[artifact.id] = pack_path
-        
-        logger.info(f"Generated {len(results)} reproduction packs")
+            if artifact.type not in self.RUNNABLE_TYPES:
+                logger.debug(f"Skipping {artifact.id}: not a runnable artifact")
+                continue
+            pending.append(artifact)
+        
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+        jobs = min(jobs, len(pending)) or 1
+        
+        self.failures = {}
+        self.unchanged = set()
+        generated: dict[str, Path] = {}
+        started = time.monotonic()
+        
+        def record(
+            done: int,
+            artifact_id: str,
+            pack_path: str | None,
+            error: str | None,
+            unchanged: bool = False,
+            entry: dict[str, Any] | None = None,
+        ) -> None:
+            if unchanged:
+                self.unchanged.add(artifact_id)
+            if entry:
+                self.registry_entries[artifact_id] = entry
+            if error:
+                self.failures[artifact_id] = error
+                logger.error(f"[{done}/{len(pending)}] Failed to generate pack for {artifact_id}: {error}")
+            elif pack_path:
+                generated[artifact_id] = Path(pack_path)
+                logger.debug(f"[{done}/{len(pending)}] {artifact_id}: {pack_path}")
+        
+        if jobs == 1:
+            for done, artifact in enumerate(pending, 1):
+                try:
+                    pack_path = self.generate(artifact)
+                    record(
+                        done,
+                        artifact.id,
+                        str(pack_path) if pack_path else None,
+                        None,
+                        artifact.id in self.unchanged,
+                        self.registry_entries.get(artifact.id),
+                    )
+                except Exception as e:
+                    record(done, artifact.id, None, f"{type(e).__name__}: {e}")
+        else:
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_pack_worker,
+                initargs=(self._worker_options(),),
+            ) as pool:
+                futures = {
+                    pool.submit(_generate_pack_worker, artifact.to_dict()): artifact.id
+                    for artifact in pending
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    try:
+                        record(done, *future.result())
+                    except Exception as e:
+                        # Worker process died (e.g. killed or unpicklable result)
+                        record(done, futures[future], None, f"{type(e).__name__}: {e}")
+        
+        self.hash_cache.flush()
+        if self.registry_entries:
+            self.save_registry()
+        
+        # Keep results in input order regardless of completion order
+        results = {a.id: generated[a.id] for a in pending if a.id in generated}
+        
+        logger.info(
+            f"Generated {len(results)} reproduction packs "
+            f"({len(self.unchanged)} unchanged, {len(self.failures)} failed, "
+            f"{len(pending)} attempted, {jobs} jobs) "
+            f"in {time.monotonic() - started:.1f}s"
+        )
         return results
     
-    def _create_pack_directory(self, artifact: KnowledgeArtifact) -> Path:
-        """Create the pack directory structure."""
+    def _create_pack_directory(self, artifact: KnowledgeArtifact) -> Path | None:
+        """Create the staging directory when requested, clearing any stale one."""
         pack_name = f"{artifact.id}_repro"
         pack_dir = self.output_dir / pack_name
         
         if pack_dir.exists():
             shutil.rmtree(pack_dir)
         
+        if not self.keep_staging:
+            return None
+        
         pack_dir.mkdir(parents=True)
         (pack_dir / "src").mkdir()
         (pack_dir / "data").mkdir()
@@ -96,25 +327,79 @@ class ReproPackGenerator:
         
         return pack_dir
     
-    def _copy_source(self, artifact: KnowledgeArtifact, pack_dir: Path) -> None:
-        """Copy the source artifact to the pack."""
+    def _source_members(self, artifact: KnowledgeArtifact) -> list[PackMember]:
+        """Pack members for the source artifact (a file or a directory tree)."""
         src_path = self.repo_root / artifact.path
         if not src_path.exists():
             logger.warning(f"Source not found: {src_path}")
-            return
-        
-        dest_path = pack_dir / "src" / src_path.name
+            return []
         
         if src_path.is_file():
-            shutil.copy2(src_path, dest_path)
-        elif src_path.is_dir():
-            shutil.copytree(src_path, dest_path)
+            return [PackMember(f"src/{src_path.name}", source=src_path)]
+        
+        return [
+            PackMember(f"src/{src_path.name}/{path.relative_to(src_path).as_posix()}", source=path)
+            for path in sorted(src_path.rglob("*"))
+            if path.is_file()
+        ]
+    
+    def _pack_fingerprint(
+        self,
+        artifact: KnowledgeArtifact,
+        sources: list[PackMember],
+        lock_data: dict,
+        include_data_stubs: bool,
+    ) -> str:
+        """Hash everything that determines a pack's contents."""
+        payload = {
+            "generator_version": self.GENERATOR_VERSION,
+            "runner_template_version": self.RUNNER_TEMPLATE_VERSION,
+            "include_data_stubs": include_data_stubs,
+            "compression": str(self.compression),
+            "keep_staging": self.keep_staging,
+            "artifact": {
+                "id": artifact.id,
+                "title": artifact.title,
+                "type": artifact.type.value,
+                "path": artifact.path,
+                "language": artifact.language,
+                "runtime": artifact.runtime,
+                "inputs": artifact.inputs,
+                "outputs": artifact.outputs,
+            },
+            "lock": lock_data,
+            "sources": {
+                m.path: [self._hash_file(m.source), bool(m.source.stat().st_mode & stat.S_IXUSR)]
+                for m in sources
+            },
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+    
+    def _existing_fingerprint(self, pack_path: Path, pack_name: str) -> str | None:
+        """Read the fingerprint recorded in an existing pack's manifest."""
+        if not pack_path.exists():
+            return None
+        if self.store:
+            manifest = load_pack_manifest(pack_path)
+            if not manifest or not all(self.store.has(o["sha256"]) for o in manifest["objects"]):
+                return None
+            return manifest.get("fingerprint")
+        try:
+            with zipfile.ZipFile(pack_path) as zf:
+                manifest = json.loads(zf.read(f"{pack_name}/manifest.json"))
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+        return manifest.get("fingerprint")
+    
+    def _hash_file(self, path: Path) -> str:
+        """Calculate SHA256 hash of file, reusing the cached digest if it is unchanged."""
+        return self.hash_cache.digest(path)
     
-    def _generate_lockfile(self, artifact: KnowledgeArtifact, pack_dir: Path) -> None:
-        """Generate dependency lock file."""
+    def _lock_data(self, artifact: KnowledgeArtifact) -> dict:
+        """Build the dependency lock for an artifact."""
         lock_data = {
             "artifact_id": artifact.id,
-            "generated_at": datetime.now().isoformat(),
             "language": artifact.language,
             "runtime": artifact.runtime,
             "dependencies": {},
@@ -131,19 +416,30 @@ class ReproPackGenerator:
         if artifact.language == "python":
             self._resolve_python_versions(lock_data, artifact)
         
-        lock_path = pack_dir / "deps" / "lock.json"
-        with open(lock_path, "w") as f:
-            json.dump(lock_data, f, indent=2)
+        return lock_data
+    
+    def _lockfile_members(self, artifact: KnowledgeArtifact, lock_data: dict) -> list[PackMember]:
+        """Generate dependency lock file (and requirements.txt for Python)."""
+        members = [PackMember("deps/lock.json", data=json.dumps(lock_data, indent=2).encode("utf-8"))]
         
         # Also generate requirements.txt for Python
         if artifact.language == "python":
-            req_path = pack_dir / "deps" / "requirements.txt"
-            with open(req_path, "w") as f:
-                for dep in artifact.dependencies:
-                    if dep.version:
-                        f.write(f"{dep.name}=={dep.version}\n")
-                    else:
-                        f.write(f"{dep.name}\n")
+            requirements = "".join(
+                f"{dep.name}=={dep.version}\n" if dep.version else f"{dep.name}\n"
+                for dep in artifact.dependencies
+            )
+            # Notebooks are executed by papermill inside the env, so it needs the runner's tools too
+            runner_requirements = ()
+            if artifact.type == ArtifactType.NOTEBOOK:
+                declared = {dep.name.lower().replace("_", "-") for dep in artifact.dependencies}
+                runner_requirements = NOTEBOOK_RUNNER_REQUIREMENTS
+                requirements += "".join(f"{name}\n" for name in runner_requirements if name not in declared)
+            members.append(PackMember("deps/requirements.txt", data=requirements.encode("utf-8")))
+            # run.sh keys its shared virtualenv on this
+            key = env_key(lock_data, runner_requirements)
+            members.append(PackMember("deps/env.key", data=f"{key}\n".encode("utf-8")))
+        
+        return members
     
     def _resolve_python_versions(
         self,
@@ -152,9 +448,12 @@ class ReproPackGenerator:
     ) -> None:
         """Attempt to resolve exact Python package versions."""
         try:
-            import pkg_resources
-            
-            installed = {d.key: d.version for d in pkg_resources.working_set}
+            if self._installed_versions is None:
+                import pkg_resources
+                
+                # Scanning the working set is slow; do it once per generator
+                self._installed_versions = {d.key: d.version for d in pkg_resources.working_set}
+            installed = self._installed_versions
             
             for dep_name in lock_data["dependencies"]:
                 key = dep_name.lower().replace("-", "_")
@@ -164,7 +463,7 @@ class ReproPackGenerator:
         except ImportError:
             logger.debug("pkg_resources not available, skipping version resolution")
     
-    def _generate_runner(self, artifact: KnowledgeArtifact, pack_dir: Path) -> None:
+    def _runner_members(self, artifact: KnowledgeArtifact) -> list[PackMember]:
         """Generate runner script for the artifact."""
         if artifact.type == ArtifactType.NOTEBOOK:
             runner = self._generate_notebook_runner(artifact)
@@ -173,15 +472,9 @@ class ReproPackGenerator:
         elif artifact.type == ArtifactType.RUNBOOK:
             runner = self._generate_runbook_runner(artifact)
         else:
-            return
+            return []
         
-        runner_path = pack_dir / "run.sh"
-        with open(runner_path, "w") as f:
-            f.write(runner)
-        
-        # Make executable on Unix
-        import stat
-        runner_path.chmod(runner_path.stat().st_mode | stat.S_IEXEC)
+        return [PackMember("run.sh", data=runner.encode("utf-8"), executable=True)]
     
     def _generate_notebook_runner(self, artifact: KnowledgeArtifact) -> str:
         """Generate runner script for notebook."""
@@ -199,21 +492,18 @@ echo ""
 echo "Checking dependencies..."
 python3 --version
 
-# Check if papermill is available for execution
-if ! command -v papermill &> /dev/null; then
+{self._venv_setup()}
+# Check if papermill is available for execution (in the env when there is one)
+if ! "$KEYS_PYTHON" -m papermill --version &> /dev/null; then
     echo "Warning: papermill not found. Install with: pip install papermill"
     echo "Notebook can be opened in Jupyter but not executed headlessly."
 fi
 
-# Install dependencies
-echo "Installing dependencies..."
-pip install -q -r deps/requirements.txt 2>/dev/null || echo "Some dependencies may need manual installation"
-
 # Run notebook
 echo ""
 echo "Running notebook..."
-if command -v papermill &> /dev/null; then
-    papermill "src/{src_file}" "outputs/notebook_output.ipynb" --log-output
+if "$KEYS_PYTHON" -m papermill --version &> /dev/null; then
+    "$KEYS_PYTHON" -m papermill ${{KEYS_KERNEL:+-k "$KEYS_KERNEL"}} "src/{src_file}" "outputs/notebook_output.ipynb" --log-output
 else
     echo "Open src/{src_file} in Jupyter Notebook/Lab to run interactively"
     echo "jupyter notebook src/{src_file}"
@@ -241,10 +531,7 @@ echo ""
 echo "Checking dependencies..."
 python3 --version
 
-# Install dependencies
-echo "Installing dependencies..."
-pip install -q -r deps/requirements.txt 2>/dev/null || echo "Some dependencies may need manual installation"
-
+{self._venv_setup()}
 # Run script
 echo ""
 echo "Running script..."
@@ -252,6 +539,63 @@ python3 "src/{src_file}" "$@"
 
 echo ""
 echo "=== Execution Complete ==="
+"""
+    
+    def _venv_setup(self) -> str:
+        """Runner snippet that activates the shared virtualenv for deps/env.key.
+        
+        The environment is built once per key (see venv_cache) and reused by
+        every later run and every pack with the same dependency set. The
+        runner holds a shared flock on ``<key>.lock`` until it exits
+        (exclusive while building), so ``--venv-gc`` never removes an
+        environment that is in use. Sets ``KEYS_PYTHON`` to the interpreter
+        to run with and, for notebook envs, ``KEYS_KERNEL`` to the kernel
+        registered inside the env.
+        """
+        kernel = kernel_name("$ENV_KEY")
+        return f"""# Use the shared virtualenv for this dependency set, building it on first use
+KEYS_PYTHON=python3
+KEYS_KERNEL=""
+if [ -f deps/env.key ] && [ -f deps/requirements.txt ]; then
+    KEYS_VENV_CACHE="${{KEYS_VENV_CACHE:-$HOME/.cache/keys/venvs}}"
+    KEYS_WHEELHOUSE="${{KEYS_WHEELHOUSE:-$HOME/.cache/keys/wheels}}"
+    ENV_KEY="$(cat deps/env.key)"
+    VENV="$KEYS_VENV_CACHE/$ENV_KEY"
+    mkdir -p "$KEYS_VENV_CACHE"
+    # Held (shared) until this script exits so --venv-gc leaves the env alone
+    exec 9>>"$KEYS_VENV_CACHE/$ENV_KEY.lock"
+    if command -v flock &> /dev/null; then flock -s 9; fi
+    if [ ! -f "$VENV/{COMPLETE_MARKER}" ]; then
+        echo "Creating environment $ENV_KEY..."
+        if command -v flock &> /dev/null; then flock 9; fi
+        if [ ! -f "$VENV/{COMPLETE_MARKER}" ]; then
+            (
+                rm -rf "$VENV"
+                python3 -m venv "$VENV" || exit 1
+                if [ -d "$KEYS_WHEELHOUSE" ]; then
+                    "$VENV/bin/python" -m pip install -q --no-index --find-links "$KEYS_WHEELHOUSE" -r deps/requirements.txt || exit 1
+                else
+                    "$VENV/bin/python" -m pip install -q -r deps/requirements.txt || exit 1
+                fi
+                if "$VENV/bin/python" -c "import ipykernel" &> /dev/null; then
+                    "$VENV/bin/python" -m ipykernel install --prefix "$VENV" --name "{kernel}" > /dev/null || exit 1
+                fi
+                touch "$VENV/{COMPLETE_MARKER}"
+            ) || echo "Some dependencies may need manual installation"
+        fi
+        if command -v flock &> /dev/null; then flock -s 9; fi
+    else
+        echo "Reusing environment $ENV_KEY"
+    fi
+    if [ -f "$VENV/{COMPLETE_MARKER}" ]; then
+        touch "$VENV/{LAST_USED_MARKER}"
+        export PATH="$VENV/bin:$PATH"
+        KEYS_PYTHON="$VENV/bin/python"
+        if [ -d "$VENV/share/jupyter/kernels/{kernel}" ]; then
+            KEYS_KERNEL="{kernel}"
+        fi
+    fi
+fi
 """
     
     def _generate_runbook_runner(self, artifact: KnowledgeArtifact) -> str:
@@ -282,23 +626,22 @@ echo ""
 echo "=== Open src/{src_file} to begin ==="
 """
     
-    def _create_data_stubs(self, artifact: KnowledgeArtifact, pack_dir: Path) -> None:
+    def _data_stub_members(self, artifact: KnowledgeArtifact) -> list[PackMember]:
         """Create data stub files based on artifact inputs."""
-        data_dir = pack_dir / "data"
+        members = []
         
         for input_desc in artifact.inputs:
             if "file" in input_desc.lower():
-                stub_file = data_dir / "input_data.stub"
-                stub_file.write_text(
+                stub = (
                     f"# Data Stub for: {input_desc}\n"
                     f"# Place your input data here\n"
                     f"# Expected by: {artifact.id}\n"
                 )
+                # Later inputs overwrite the same stub, as before
+                members = [PackMember("data/input_data.stub", data=stub.encode("utf-8"))]
         
         # Create README for data
-        readme = data_dir / "README.md"
-        readme.write_text(
-            f"""# Data Directory
+        readme = f"""# Data Directory
 
 This directory should contain input data for: {artifact.id}
 
@@ -310,16 +653,25 @@ Expected Outputs:
 
 Place your data files here before running.
 """
-        )
+        members.append(PackMember("data/README.md", data=readme.encode("utf-8")))
+        return members
     
-    def _generate_manifest(self, artifact: KnowledgeArtifact, pack_dir: Path) -> None:
-        """Generate pack manifest."""
+    def _manifest_member(
+        self,
+        artifact: KnowledgeArtifact,
+        checksums: dict[str, str],
+        fingerprint: str,
+        staging: dict[str, int] | None = None,
+    ) -> PackMember:
+        """Generate pack manifest from the checksums of the already-written members."""
         manifest = {
             "artifact_id": artifact.id,
             "title": artifact.title,
             "type": artifact.type.value,
             "language": artifact.language,
-            "generated_at": datetime.now().isoformat(),
+            "fingerprint": fingerprint,
+            "generator_version": self.GENERATOR_VERSION,
+            "runner_template_version": self.RUNNER_TEMPLATE_VERSION,
             "structure": {
                 "src": "Source artifact",
                 "data": "Input/output data directory",
@@ -330,39 +682,12 @@ Place your data files here before running.
                 "command": "./run.sh",
                 "prerequisites": ["bash", artifact.runtime] if artifact.runtime else ["bash"],
             },
-            "checksums": self._calculate_checksums(pack_dir),
+            "checksums": checksums,
+            # Single value covering every checksum; see integrity.verify_pack
+            "merkle_root": merkle_root(checksums),
         }
+        if staging is not None:
+            # How source files reached the unzipped pack directory (reflink/copy)
+            manifest["staging"] = {"methods": staging}
         
-        manifest_path = pack_dir / "manifest.json"
-        with open(manifest_path, "w") as f:
-            json.dump(manifest, f, indent=2)
-    
-    def _calculate_checksums(self, pack_dir: Path) -> dict[str, str]:
-        """Calculate checksums for pack contents."""
-        checksums = {}
-        
-        for path in pack_dir.rglob("*"):
-            if path.is_file():
-                rel_path = str(path.relative_to(pack_dir))
-                checksums[rel_path] = self._hash_file(path)
-        
-        return checksums
-    
-    def _hash_file(self, path: Path) -> str:
-        """Calculate SHA256 hash of file."""
-        h = hashlib.sha256()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        return h.hexdigest()
-    
-    def _create_zip(self, pack_dir: Path) -> Path:
-        """Create zip archive of pack."""
-        zip_path = pack_dir.parent / f"{pack_dir.name}.zip"
-        
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for path in pack_dir.rglob("*"):
-                if path.is_file():
-                    zf.write(path, path.relative_to(pack_dir.parent))
-        
-        return zip_path
+        return PackMember("manifest.json", data=json.dumps(manifest, indent=2).encode("utf-8"))
@@ -0,0 +1,39 @@
+"""Single-read file scanning: each artifact file is opened once per run.
+
+A ``ScannedFile`` carries the bytes, the stat taken from the same open file
+descriptor, decoded text and any parsed form (e.g. a notebook node) from
+stage to stage, so extraction, health checks and drift scans never reopen
+the file.
+"""
+
+import io
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(eq=False)
+class ScannedFile:
+    """One file's contents and stat, read once."""
+    path: Path
+    stat: os.stat_result
+    data: bytes
+    parsed: Any = None
+    _text: dict[str, str] = field(default_factory=dict, repr=False)
+
+    def text(self, errors: str = "strict") -> str:
+        """Contents decoded exactly as ``open(path, "r", encoding="utf-8", errors=errors)`` would."""
+        if errors not in self._text:
+            wrapper = io.TextIOWrapper(io.BytesIO(self.data), encoding="utf-8", errors=errors)
+            self._text[errors] = wrapper.read()
+        return self._text[errors]
+
+
+def read_file(path: Path) -> ScannedFile:
+    """Read a file and stat it through the same descriptor."""
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        data = f.read()
+    return ScannedFile(path=Path(path), stat=st, data=data)
+
@@ -0,0 +1,79 @@
+"""Cheap file staging: reflink, then hardlink, then a plain copy."""
+
+import errno
+import os
+import shutil
+import sys
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl(2) request for a copy-on-write clone (linux/fs.h); supported on Btrfs, XFS, bcachefs, ...
+FICLONE = 0x40049409
+
+STAGING_METHODS = ("reflink", "hardlink", "copy")
+# Methods that never share mutable storage with the source
+COPY_ON_WRITE_METHODS = ("reflink", "copy")
+
+# (method, source device, destination device) pairs known not to work, so a
+# large tree on e.g. ext4 costs one failed ioctl rather than one per file
+_unsupported: set[tuple[str, int, int]] = set()
+
+
+def reflink(src: Path, dst: Path) -> None:
+    """Clone ``src`` to ``dst`` sharing extents; raises OSError if unsupported."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink is not supported on this platform")
+    with open(src, "rb") as s:
+        with open(dst, "wb") as d:
+            try:
+                fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+            except OSError:
+                d.close()
+                os.unlink(dst)
+                raise
+
+
+def stage_file(src: Path, dst: Path, methods: tuple[str, ...] = STAGING_METHODS) -> str:
+    """Materialize ``src`` at ``dst`` with the first method that works; returns its name.
+
+    A hardlinked ``dst`` shares its inode with ``src``: writing to it changes
+    the source, so only allow "hardlink" for read-only staging areas.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+
+    devices = (os.stat(src).st_dev, os.stat(dst.parent).st_dev)
+    for method in methods:
+        key = (method, *devices)
+        if key in _unsupported and method != methods[-1]:
+            continue
+        try:
+            if method == "reflink":
+                reflink(src, dst)
+                shutil.copystat(src, dst)
+            elif method == "hardlink":
+                os.link(src, dst)
+            elif method == "copy":
+                shutil.copy2(src, dst)
+            else:
+                raise ValueError(f"Unknown staging method: {method}")
+            return method
+        except OSError as e:
+            if method == methods[-1]:
+                raise
+            if e.errno in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.EPERM, errno.ENOSYS):
+                _unsupported.add(key)
+    raise OSError(errno.EOPNOTSUPP, f"No staging method succeeded for {src}")
+
+
+def method_counts(staged: dict[str, str]) -> dict[str, int]:
+    """Summarize {path: method} as {method: count}."""
+    counts: dict[str, int] = {}
+    for method in staged.values():
+        counts[method] = counts.get(method, 0) + 1
+    return dict(sorted(counts.items()))
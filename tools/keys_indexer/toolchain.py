@@ -0,0 +1,160 @@
+"""Toolchain probes (``node --version``, ``jupyter kernelspec list``, ...) run once and cached."""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .checkpoint import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 24 * 3600
+
+
+def default_cache_path() -> Path:
+    """``$KEYS_TOOLCHAIN_CACHE`` or ``~/.cache/keys/toolchain.json``."""
+    return Path(os.environ.get("KEYS_TOOLCHAIN_CACHE") or Path.home() / ".cache" / "keys" / "toolchain.json")
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of running a probe command; ``returncode`` is None if it could not run."""
+    command: list[str]
+    binary: str | None
+    returncode: int | None
+    stdout: str = ""
+    stderr: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+    @property
+    def output(self) -> str:
+        return self.stdout.strip() or self.stderr.strip()
+
+
+class ToolchainProbe:
+    """Resolve binaries and run probe commands at most once per process.
+
+    Results are also persisted to a small JSON cache keyed by ``$PATH`` and
+    the command. An entry is reused by later runs while the resolved binary
+    and its mtime are unchanged and it is younger than ``ttl_seconds``; the
+    TTL covers state outside the binary, such as newly installed Jupyter
+    kernels. Missing binaries and timeouts are only remembered in memory.
+    """
+
+    def __init__(self, cache_path: Path | None = None, ttl_seconds: float = DEFAULT_TTL_SECONDS, timeout: float = 5):
+        self.cache_path = Path(cache_path) if cache_path else default_cache_path()
+        self.ttl_seconds = ttl_seconds
+        self.timeout = timeout
+        self._results: dict[str, ProbeResult] = {}
+        self._paths: dict[tuple[str, str], str | None] = {}
+        self._lock = threading.Lock()
+        self._persisted: dict[str, dict] | None = None
+
+    def __reduce__(self):
+        # Locks don't pickle; other processes start with an empty in-memory cache
+        return (ToolchainProbe, (self.cache_path, self.ttl_seconds, self.timeout))
+
+    def run(self, command: list[str]) -> ProbeResult:
+        """Run ``command`` (or reuse its cached result)."""
+        key = self._key(command)
+        with self._lock:
+            if key not in self._results:
+                self._results[key] = self._probe(key, command)
+            return self._results[key]
+
+    def which(self, binary: str) -> str | None:
+        """``shutil.which``, resolved once per ``$PATH``."""
+        key = (os.environ.get("PATH", ""), binary)
+        if key not in self._paths:
+            self._paths[key] = shutil.which(binary)
+        return self._paths[key]
+
+    def version(self, binary: str) -> str | None:
+        """``<binary> --version`` output, or None if it is missing or fails."""
+        result = self.run([binary, "--version"])
+        return result.output if result.ok else None
+
+    def available(self, binary: str) -> bool:
+        return self.run([binary, "--version"]).ok
+
+    def _key(self, command: list[str]) -> str:
+        encoded = json.dumps([os.environ.get("PATH", ""), command]).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:32]
+
+    def _probe(self, key: str, command: list[str]) -> ProbeResult:
+        binary = self.which(command[0])
+        if binary is None:
+            return ProbeResult(command=command, binary=None, returncode=None)
+        try:
+            mtime_ns = os.stat(binary).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        entry = self._load().get(key)
+        if (
+            entry
+            and entry.get("binary") == binary
+            and entry.get("mtime_ns") == mtime_ns
+            and time.time() - entry.get("probed_at", 0) < self.ttl_seconds
+        ):
+            return ProbeResult(**entry["result"])
+
+        try:
+            completed = subprocess.run(command, capture_output=True, text=True, timeout=self.timeout)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.debug(f"Probe {' '.join(command)} failed: {e}")
+            return ProbeResult(command=command, binary=binary, returncode=None)
+
+        result = ProbeResult(
+            command=command,
+            binary=binary,
+            returncode=completed.returncode,
+            stdout=completed.stdout,
+            stderr=completed.stderr,
+        )
+        self._persisted[key] = {
+            "binary": binary,
+            "mtime_ns": mtime_ns,
+            "probed_at": time.time(),
+            "result": asdict(result),
+        }
+        self._save()
+        return result
+
+    def _load(self) -> dict[str, dict]:
+        if self._persisted is None:
+            try:
+                with open(self.cache_path, encoding="utf-8") as f:
+                    self._persisted = json.load(f).get("probes", {})
+            except (OSError, ValueError):
+                self._persisted = {}
+        return self._persisted
+
+    def _save(self) -> None:
+        try:
+            atomic_write_json(self.cache_path, {"probes": self._persisted})
+        except OSError as e:
+            logger.debug(f"Could not write toolchain cache {self.cache_path}: {e}")
+
+
+_default_probe: ToolchainProbe | None = None
+_default_lock = threading.Lock()
+
+
+def default_toolchain_probe() -> ToolchainProbe:
+    """Process-wide shared probe at ``default_cache_path()``."""
+    global _default_probe
+    with _default_lock:
+        if _default_probe is None:
+            _default_probe = ToolchainProbe()
+        return _default_probe
@@ -5,15 +5,38 @@ import json
 import logging
 import subprocess
 import tempfile
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from .checkpoint import RunCheckpoint, run_fingerprint
 from .models import ArtifactType, KnowledgeArtifact, RunnableStatus
+from .toolchain import ToolchainProbe, default_toolchain_probe
 
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def _timed(checks: dict[str, Any], name: str):
+    """Accumulate monotonic wall time for a named check into checks["timings_ns"]."""
+    timings = checks.setdefault("timings_ns", {})
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0) + (time.perf_counter_ns() - start)
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
 class ValidationResult:
     """Result of artifact validation."""
     
@@ -44,19 +67,41 @@ class ValidationResult:
             "execution_time_ms": self.execution_time_ms,
             "validated_at": self.validated_at.isoformat(),
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "ValidationResult":
+        result = cls(
+            artifact_id=data["artifact_id"],
+            status=RunnableStatus(data["status"]),
+            checks=data.get("checks", {}),
+            errors=data.get("errors", []),
+            warnings=data.get("warnings", []),
+            execution_time_ms=data.get("execution_time_ms", 0.0),
+        )
+        if data.get("validated_at"):
+            result.validated_at = datetime.fromisoformat(data["validated_at"])
+        return result
 
 
 class ArtifactValidator:
     """Validate knowledge artifacts through static and dynamic checks."""
     
-    def __init__(self, repo_root: Path, dry_run: bool = True):
+    def __init__(
+        self,
+        repo_root: Path,
+        dry_run: bool = True,
+        toolchain: ToolchainProbe | None = None,
+        output_dir: Path | str | None = None,
+    ):
         self.repo_root = repo_root
+        self.output_dir = Path(output_dir) if output_dir else Path(repo_root) / "outputs" / "keys_index"
         self.dry_run = dry_run  # If True, don't actually execute code
+        self.toolchain = toolchain or default_toolchain_probe()
         self.results: list[ValidationResult] = []
     
     def validate(self, artifact: KnowledgeArtifact) -> ValidationResult:
         """Validate a single artifact."""
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         checks = {}
         errors = []
@@ -82,7 +127,7 @@ class ArtifactValidator:
         else:
             status = RunnableStatus.RUNNABLE
         
-        execution_time = (datetime.now() - start_time).total_seconds() * 1000
+        execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
         
         result = ValidationResult(
             artifact_id=artifact.id,
@@ -99,20 +144,43 @@ class ArtifactValidator:
     def validate_all(
         self,
         artifacts: list[KnowledgeArtifact],
+        resume: bool = False,
     ) -> dict[str, ValidationResult]:
-        """Validate multiple artifacts."""
+        """Validate multiple artifacts.
+        
+        With ``resume=True``, artifacts validated by an interrupted run (same
+        HEAD and dry-run mode) are restored from the checkpoint and skipped.
+        """
         results = {}
+        checkpoint = self._validation_checkpoint()
+        if resume:
+            checkpoint.load()
+        else:
+            checkpoint.clear()
         
         for artifact in artifacts:
-            result = self.validate(artifact)
+            if artifact.id in checkpoint:
+                result = ValidationResult.from_dict(checkpoint.get(artifact.id))
+                self.results.append(result)
+            else:
+                result = self.validate(artifact)
+                checkpoint.record(artifact.id, result.to_dict())
             results[artifact.id] = result
             
             # Update artifact status
             artifact.runnable_status = result.status
             artifact.last_verified = result.validated_at
         
+        checkpoint.clear()
         return results
     
+    def _validation_checkpoint(self) -> RunCheckpoint:
+        """Checkpoint for a validation run, keyed by HEAD and dry-run mode."""
+        return RunCheckpoint(
+            self.output_dir / ".validation_checkpoint.json",
+            run_fingerprint(self.repo_root, {"stage": "validate", "dry_run": self.dry_run}),
+        )
+    
     def _validate_notebook(
         self,
         artifact: KnowledgeArtifact,
@@ -135,29 +203,33 @@ class ArtifactValidator:
         try:
             import nbformat
             
-            with open(notebook_path, "r", encoding="utf-8") as f:
-                nb = nbformat.read(f, as_version=4)
+            with _timed(checks, "read"):
+                with open(notebook_path, "r", encoding="utf-8") as f:
+                    nb = nbformat.read(f, as_version=4)
             
             checks["syntax"] = True
             
             # Check kernel
             kernel_name = nb.metadata.get("kernelspec", {}).get("name", "python3")
-            checks["kernel_available"] = self._check_kernel(kernel_name)
+            with _timed(checks, "kernel"):
+                checks["kernel_available"] = self._check_kernel(kernel_name)
             
             if not checks["kernel_available"]:
                 warnings.append(f"Kernel '{kernel_name}' may not be available")
             
             # Check dependencies
-            checks["dependencies_resolvable"] = self._check_dependencies(
-                artifact.dependencies
-            )
+            with _timed(checks, "dependencies"):
+                checks["dependencies_resolvable"] = self._check_dependencies(
+                    artifact.dependencies
+                )
             
             if not checks["dependencies_resolvable"]:
                 warnings.append("Some dependencies may not be resolvable")
             
             # Dry-run cell validation (check Python syntax)
             if not self.dry_run:
-                syntax_errors = self._validate_notebook_cells(nb)
+                with _timed(checks, "ast_parse"):
+                    syntax_errors = self._validate_notebook_cells(nb)
                 if syntax_errors:
                     errors.extend(syntax_errors)
                     checks["syntax"] = False
@@ -186,25 +258,29 @@ class ArtifactValidator:
             return checks
         
         try:
-            with open(script_path, "r", encoding="utf-8") as f:
-                source = f.read()
+            with _timed(checks, "read"):
+                with open(script_path, "r", encoding="utf-8") as f:
+                    source = f.read()
             
             # Check Python syntax
             try:
-                ast.parse(source)
+                with _timed(checks, "ast_parse"):
+                    ast.parse(source)
                 checks["syntax"] = True
             except SyntaxError as e:
                 errors.append(f"Syntax error: {e}")
             
             # Check imports
-            checks["imports_resolvable"] = self._check_imports(source)
+            with _timed(checks, "imports"):
+                checks["imports_resolvable"] = self._check_imports(source)
             
             if not checks["imports_resolvable"]:
                 warnings.append("Some imports may not be resolvable")
             
             # Dry-run execution (if enabled and safe)
             if not self.dry_run and checks["syntax"]:
-                exec_result = self._safe_execute_script(script_path)
+                with _timed(checks, "execution"):
+                    exec_result = self._safe_execute_script(script_path)
                 if not exec_result["success"]:
                     errors.append(f"Execution failed: {exec_result['error']}")
             
@@ -235,8 +311,9 @@ class ArtifactValidator:
         checks["exists"] = True
         
         try:
-            with open(runbook_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            with _timed(checks, "read"):
+                with open(runbook_path, "r", encoding="utf-8") as f:
+                    content = f.read()
             
             # Check for standard sections
             required_sections = ["## Scope", "## When to Use"]
@@ -265,16 +342,9 @@ class ArtifactValidator:
     
     def _check_kernel(self, kernel_name: str) -> bool:
         """Check if Jupyter kernel is available."""
-        try:
-            result = subprocess.run(
-                ["jupyter", "kernelspec", "list"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            return kernel_name in result.stdout
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        # One `jupyter kernelspec list` per run (and per cache TTL), not per notebook
+        result = self.toolchain.run(["jupyter", "kernelspec", "list"])
+        return kernel_name in result.stdout
     
     def _check_dependencies(self, dependencies: list) -> bool:
         """Check if dependencies can be resolved."""
@@ -368,10 +438,50 @@ class ArtifactValidator:
         
         return result
     
-    def save_report(self, output_path: Path | None = None) -> Path:
+    def timing_summary(self, top_n: int = 10) -> dict[str, Any]:
+        """Aggregate per-check timings across results.
+        
+        Returns totals and p50/p95 per check type plus the ``top_n`` slowest
+        artifacts, so it is visible where validation time goes.
+        """
+        per_check: dict[str, list[float]] = {}
+        for result in self.results:
+            for name, ns in result.checks.get("timings_ns", {}).items():
+                per_check.setdefault(name, []).append(ns / 1_000_000)
+        
+        checks = {}
+        for name, values in per_check.items():
+            values.sort()
+            checks[name] = {
+                "count": len(values),
+                "total_ms": round(sum(values), 3),
+                "p50_ms": round(_percentile(values, 50), 3),
+                "p95_ms": round(_percentile(values, 95), 3),
+                "max_ms": round(values[-1], 3),
+            }
+        
+        slowest = sorted(self.results, key=lambda r: r.execution_time_ms, reverse=True)[:top_n]
+        
+        return {
+            "total_ms": round(sum(r.execution_time_ms for r in self.results), 3),
+            "checks": dict(sorted(checks.items(), key=lambda kv: kv[1]["total_ms"], reverse=True)),
+            "slowest_artifacts": [
+                {
+                    "artifact_id": r.artifact_id,
+                    "execution_time_ms": round(r.execution_time_ms, 3),
+                    "timings_ms": {
+                        name: round(ns / 1_000_000, 3)
+                        for name, ns in r.checks.get("timings_ns", {}).items()
+                    },
+                }
+                for r in slowest
+            ],
+        }
+    
+    def save_report(self, output_path: Path | None = None, top_n: int = 10) -> Path:
         """Save validation report to file."""
         if output_path is None:
-            output_path = self.repo_root / "outputs" / "keys_index" / "validation_report.json"
+            output_path = self.output_dir / "validation_report.json"
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
@@ -384,6 +494,7 @@ class ArtifactValidator:
                 "partial": sum(1 for r in self.results if r.status == RunnableStatus.PARTIAL),
                 "broken": sum(1 for r in self.results if r.status == RunnableStatus.BROKEN),
             },
+            "timings": self.timing_summary(top_n),
             "results": [r.to_dict() for r in self.results],
         }
         
@@ -0,0 +1,225 @@
+"""Shared virtualenv cache for reproduction pack runners.
+
+Packs carry ``deps/env.key``, a hash of the environment-relevant part of
+``deps/lock.json``. The generated ``run.sh`` looks the key up in
+``$KEYS_VENV_CACHE`` and builds the environment once (offline from
+``$KEYS_WHEELHOUSE`` when that directory exists); later runs reuse it.
+This module implements the same layout for prewarming and garbage collection.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import time
+import zipfile
+from pathlib import Path
+from typing import Any
+
+from .object_store import ObjectStore, load_pack_manifest
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Written last when an environment is fully built; run.sh checks for it too
+COMPLETE_MARKER = ".keys-env-complete"
+LAST_USED_MARKER = ".keys-env-last-used"
+
+# Installed alongside a notebook's own dependencies so run.sh executes it inside the env
+NOTEBOOK_RUNNER_REQUIREMENTS = ("papermill", "ipykernel")
+
+
+def default_cache_dir() -> Path:
+    return Path(os.environ.get("KEYS_VENV_CACHE") or Path.home() / ".cache" / "keys" / "venvs")
+
+
+def default_wheelhouse() -> Path:
+    return Path(os.environ.get("KEYS_WHEELHOUSE") or Path.home() / ".cache" / "keys" / "wheels")
+
+
+def kernel_name(key: str) -> str:
+    """Jupyter kernel registered inside the environment for ``key``."""
+    return f"keys-{key}"
+
+
+def env_key(lock_data: dict[str, Any], runner_requirements: tuple[str, ...] = ()) -> str:
+    """Hash the parts of a dependency lock that determine the environment.
+
+    Artifact identity and provenance fields are left out so that packs with
+    the same dependency set share one environment. ``runner_requirements``
+    (the runner's own tools, e.g. papermill for notebooks) are part of the
+    environment too.
+    """
+    relevant = {
+        "language": lock_data.get("language"),
+        "runtime": lock_data.get("runtime"),
+        "dependencies": {
+            name: {
+                "version": dep.get("version"),
+                "resolved_version": dep.get("resolved_version"),
+            }
+            for name, dep in lock_data.get("dependencies", {}).items()
+        },
+    }
+    if runner_requirements:
+        relevant["runner"] = sorted(runner_requirements)
+    encoded = json.dumps(relevant, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:24]
+
+
+class VenvCache:
+    """Build, reuse and garbage-collect virtualenvs keyed by ``env_key``."""
+
+    def __init__(self, root: Path | None = None, wheelhouse: Path | None = None, python: str = "python3"):
+        self.root = Path(root) if root else default_cache_dir()
+        self.wheelhouse = Path(wheelhouse) if wheelhouse else default_wheelhouse()
+        self.python = python if shutil.which(python) else sys.executable
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key
+
+    def is_ready(self, key: str) -> bool:
+        return (self.path_for(key) / COMPLETE_MARKER).exists()
+
+    def ensure(self, key: str, requirements: str) -> tuple[Path, bool]:
+        """Return (env path, built) for ``key``, building it if missing.
+
+        Takes the same ``<key>.lock`` flock as run.sh builds, so concurrent
+        runners and prewarming never build the same environment twice.
+        """
+        venv = self.path_for(key)
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / f"{key}.lock", "w") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            if self.is_ready(key):
+                (venv / LAST_USED_MARKER).touch()
+                return venv, False
+
+            # A directory without the marker is a build that died part-way
+            if venv.exists():
+                shutil.rmtree(venv)
+            try:
+                self._build(venv, requirements)
+            except (OSError, subprocess.CalledProcessError):
+                shutil.rmtree(venv, ignore_errors=True)
+                raise
+            (venv / LAST_USED_MARKER).touch()
+            (venv / COMPLETE_MARKER).touch()
+            return venv, True
+
+    def _build(self, venv: Path, requirements: str) -> None:
+        # Virtualenvs are not relocatable, so build in place rather than in a temp dir
+        subprocess.run([self.python, "-m", "venv", str(venv)], check=True, capture_output=True)
+        req_path = venv / "requirements.txt"
+        req_path.write_text(requirements)
+        if not requirements.strip():
+            return
+
+        python = str(venv / "bin" / "python")
+        cmd = [python, "-m", "pip", "install", "-q"]
+        if self.wheelhouse.is_dir():
+            cmd += ["--no-index", "--find-links", str(self.wheelhouse)]
+        else:
+            logger.warning(f"Wheelhouse {self.wheelhouse} not found, installing {venv.name} from the index")
+        subprocess.run(cmd + ["-r", str(req_path)], check=True, capture_output=True)
+
+        # Notebook envs: a kernel inside the env, so papermill runs the env's interpreter
+        if subprocess.run([python, "-c", "import ipykernel"], capture_output=True).returncode == 0:
+            subprocess.run(
+                [python, "-m", "ipykernel", "install", "--prefix", str(venv), "--name", kernel_name(venv.name)],
+                check=True,
+                capture_output=True,
+            )
+
+    def keys(self) -> list[str]:
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    def prewarm(self, packs_dir: Path) -> dict[str, str]:
+        """Build the environment for every distinct env.key among the packs.
+
+        Returns {key: "cached" | "built" | "failed: ..."}.
+        """
+        results = {}
+        for key, requirements in sorted(pack_environments(packs_dir).items()):
+            try:
+                _, built = self.ensure(key, requirements)
+                results[key] = "built" if built else "cached"
+            except subprocess.CalledProcessError as e:
+                stderr = e.stderr.decode(errors="replace").strip() if e.stderr else ""
+                results[key] = f"failed: {stderr.splitlines()[-1] if stderr else e}"
+            except OSError as e:
+                results[key] = f"failed: {e}"
+        return results
+
+    def gc(self, referenced: set[str] | None = None, max_age_days: float = 30) -> list[str]:
+        """Remove environments not in ``referenced`` or unused for ``max_age_days``.
+
+        run.sh holds a shared flock on ``<key>.lock`` for its whole run (and
+        an exclusive one while building), as does ``ensure``; environments
+        whose lock cannot be taken exclusively right away are skipped. Lock
+        files are never removed: a process could still lock the old file
+        while another creates and locks a new one.
+        """
+        cutoff = time.time() - max_age_days * 86400
+        removed = []
+        for key in self.keys():
+            venv = self.path_for(key)
+            marker = venv / LAST_USED_MARKER
+            last_used = marker.stat().st_mtime if marker.exists() else venv.stat().st_mtime
+            if (referenced is None or key in referenced) and last_used >= cutoff:
+                continue
+
+            lock_path = self.root / f"{key}.lock"
+            with open(lock_path, "w") as lock:
+                if fcntl:
+                    try:
+                        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except BlockingIOError:
+                        logger.info(f"Skipping {key}: in use")
+                        continue
+                shutil.rmtree(venv, ignore_errors=True)
+            removed.append(key)
+        return removed
+
+
+def pack_environments(packs_dir: Path) -> dict[str, str]:
+    """Collect {env key: requirements.txt} from the repro packs in ``packs_dir``.
+
+    Reads both zip packs and object-store pack manifests.
+    """
+    environments = {}
+    for zip_path in sorted(packs_dir.glob("*_repro.zip")):
+        root = zip_path.stem
+        try:
+            with zipfile.ZipFile(zip_path) as zf:
+                key = zf.read(f"{root}/deps/env.key").decode("utf-8").strip()
+                requirements = zf.read(f"{root}/deps/requirements.txt").decode("utf-8")
+        except (OSError, KeyError, zipfile.BadZipFile):
+            continue
+        environments[key] = requirements
+
+    manifests = sorted(packs_dir.glob("*_repro.json"))
+    store = ObjectStore(packs_dir / "objects") if manifests else None
+    for manifest_path in manifests:
+        manifest = load_pack_manifest(manifest_path)
+        if not manifest:
+            continue
+        objects = {o["path"]: o["sha256"] for o in manifest.get("objects", [])}
+        if "deps/env.key" not in objects or "deps/requirements.txt" not in objects:
+            continue
+        try:
+            key = store.path_for(objects["deps/env.key"]).read_text().strip()
+            environments[key] = store.path_for(objects["deps/requirements.txt"]).read_text()
+        except OSError:
+            continue
+    return environments
@@ -15,6 +15,7 @@ Quick Start:
 
 Modules:
     models                  - Data models for health metrics, alerts, recommendations
+    index_repository        - Shared, mtime-invalidated view of kb_index.json
     health_monitor          - Core health monitoring and scoring
     drift_detector          - Knowledge drift detection engine
     curation_engine         - Intelligent curation recommendations
@@ -64,6 +65,7 @@ from .models import (
     SystemHealthConfig,
 )
 
+from .index_repository import IndexRepository
 from .health_monitor import HealthMonitor
 from .drift_detector import DriftDetector
 from .curation_engine import CurationEngine
@@ -76,6 +78,7 @@ __all__ = [
     "DriftDetector",
     "CurationEngine",
     "RevalidationScheduler",
+    "IndexRepository",
     
     # Configuration
     "SystemHealthConfig",
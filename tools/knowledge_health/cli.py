@@ -18,11 +18,23 @@ import sys
 from pathlib import Path
 from typing import Any
 
-from .health_monitor import HealthMonitor
+from .health_monitor import HEALTH_STATE_NAME, HealthMonitor
 from .drift_detector import DriftDetector
 from .revalidation_scheduler import RevalidationScheduler
 from .curation_engine import CurationEngine
 from .models import SystemHealthConfig, KnowledgeHealthReport
+from .score_history import SCORE_HISTORY_DIR, HealthScoreHistory
+from .symbol_index import SYMBOL_CACHE_NAME
+
+
+def _health_monitor(args: argparse.Namespace, config: SystemHealthConfig) -> HealthMonitor:
+    """HealthMonitor that keeps its incremental state in the output directory."""
+    return HealthMonitor(args.repo_root, config, state_path=Path(args.output_dir) / HEALTH_STATE_NAME)
+
+
+def _drift_detector(args: argparse.Namespace, config: SystemHealthConfig) -> DriftDetector:
+    """DriftDetector that caches symbol indexes in the output directory."""
+    return DriftDetector(args.repo_root, config, symbol_cache_path=Path(args.output_dir) / SYMBOL_CACHE_NAME)
 
 
 def run_health_check(args: argparse.Namespace) -> int:
@@ -30,9 +42,9 @@ def run_health_check(args: argparse.Namespace) -> int:
     print("[SCAN] Running health check on all artifacts...")
     
     config = SystemHealthConfig()
-    monitor = HealthMonitor(args.repo_root, config)
+    monitor = _health_monitor(args, config)
     
-    health_metrics = monitor.check_all_health()
+    health_metrics = monitor.check_all_health(max_workers=args.jobs, incremental=not args.full)
     
     if not health_metrics:
         print("[!] No artifacts found. Run indexer first:")
@@ -44,6 +56,7 @@ def run_health_check(args: argparse.Namespace) -> int:
     
     print(f"\n[RESULTS] Health Check Results:")
     print(f"   Total Artifacts: {summary['total']}")
+    print(f"   Rechecked: {len(monitor.recomputed)} (unchanged inputs reused: {summary['total'] - len(monitor.recomputed)})")
     print(f"   Average Health Score: {summary['average_score']:.1f}/100")
     print(f"\n   Status Distribution:")
     print(f"      [OK] Healthy:   {summary['healthy']} ({summary['healthy']/max(summary['total'],1)*100:.1f}%)")
@@ -68,6 +81,11 @@ def run_health_check(args: argparse.Namespace) -> int:
     with open(health_file, "w", encoding="utf-8") as f:
         json.dump(health_data, f, indent=2)
     
+    history = HealthScoreHistory(output_dir / SCORE_HISTORY_DIR)
+    history.append({aid: m.health_score for aid, m in health_metrics.items()})
+    trends = history.trends()
+    print(f"   Health Trend: {trends.repo_trend.title()} ({trends.repo_slope:+.2f} points/day)")
+    
     print(f"\n[SAVED] Health metrics saved to: {health_file}")
     
     return 0
@@ -78,11 +96,11 @@ def run_drift_detection(args: argparse.Namespace) -> int:
     print("[SCAN] Detecting knowledge drift...")
     
     config = SystemHealthConfig()
-    monitor = HealthMonitor(args.repo_root, config)
-    detector = DriftDetector(args.repo_root, config)
+    monitor = _health_monitor(args, config)
+    detector = _drift_detector(args, config)
     
     # Check health first
-    health_metrics = monitor.check_all_health()
+    health_metrics = monitor.check_all_health(max_workers=args.jobs, incremental=not args.full)
     
     if not health_metrics:
         print("[!] No artifacts found. Run indexer first.")
@@ -143,7 +161,7 @@ def run_revalidation(args: argparse.Namespace) -> int:
     else:
         # Revalidate all due artifacts
         print("   Checking for artifacts due for revalidation...")
-        results = scheduler.run_all_due(dry_run=args.dry_run)
+        results = scheduler.run_all_due(dry_run=args.dry_run, resume=args.resume)
         
         print(f"\n📊 Revalidation Results:")
         print(f"   Artifacts Due: {results['total_due']}")
@@ -165,12 +183,12 @@ def run_curation(args: argparse.Namespace) -> int:
     print("[CURATE] Generating curation recommendations...")
     
     config = SystemHealthConfig()
-    monitor = HealthMonitor(args.repo_root, config)
-    detector = DriftDetector(args.repo_root, config)
+    monitor = _health_monitor(args, config)
+    detector = _drift_detector(args, config)
     engine = CurationEngine(args.repo_root, config)
     
     # Get health metrics and alerts
-    health_metrics = monitor.check_all_health()
+    health_metrics = monitor.check_all_health(max_workers=args.jobs, incremental=not args.full)
     alerts = detector.detect_all_drift(health_metrics)
     recommendations = engine.generate_recommendations(health_metrics, alerts)
     
@@ -211,7 +229,9 @@ def run_report(args: argparse.Namespace) -> int:
     config = SystemHealthConfig()
     scheduler = RevalidationScheduler(args.repo_root, config)
     
-    json_path, md_path = scheduler.generate_health_reports(Path(args.output_dir))
+    json_path, md_path = scheduler.generate_health_reports(
+        Path(args.output_dir), max_workers=args.jobs, incremental=not args.full, fused=args.fused
+    )
     
     print(f"\n[DONE] Reports generated:")
     print(f"   JSON: {json_path}")
@@ -242,8 +262,8 @@ def run_demo(args: argparse.Namespace) -> int:
     print("PHASE 1: DECAY DETECTION")
     print("-" * 40)
     
-    monitor = HealthMonitor(args.repo_root, config)
-    health_metrics = monitor.check_all_health()
+    monitor = _health_monitor(args, config)
+    health_metrics = monitor.check_all_health(max_workers=args.jobs, incremental=not args.full)
     
     if not health_metrics:
         print("[!] No artifacts found. Creating synthetic demo data...")
@@ -368,7 +388,7 @@ def run_demo(args: argparse.Namespace) -> int:
         print("        └─ Excellent health metrics, candidate for gold standard")
     else:
         # Real curation
-        detector = DriftDetector(args.repo_root, config)
+        detector = _drift_detector(args, config)
         engine = CurationEngine(args.repo_root, config)
         
         alerts = detector.detect_all_drift(health_metrics)
@@ -438,6 +458,17 @@ Examples:
         default=Path("outputs/knowledge_health"),
         help="Output directory for reports (default: outputs/knowledge_health)",
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Threads for per-artifact health checks (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Recheck every artifact instead of reusing metrics whose inputs are unchanged",
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -457,12 +488,18 @@ Examples:
     reval_parser.add_argument("--artifact", help="Specific artifact ID to revalidate")
     reval_parser.add_argument("--dry-run", action="store_true", default=True, help="Dry run mode (default)")
     reval_parser.add_argument("--no-dry-run", dest="dry_run", action="store_false", help="Actually execute code")
+    reval_parser.add_argument("--resume", action="store_true", help="Resume an interrupted revalidation run")
     
     # Curate command
     curate_parser = subparsers.add_parser("curate", help="Generate curation recommendations")
     
     # Report command
     report_parser = subparsers.add_parser("report", help="Generate comprehensive health report")
+    report_parser.add_argument(
+        "--fused",
+        action="store_true",
+        help="Re-index and run health and drift checks in one pass that reads each file once",
+    )
     
     # Demo command
     demo_parser = subparsers.add_parser("demo", help="Run demonstration of decay detection")
@@ -7,11 +7,12 @@ Provides intelligent recommendations for knowledge curation:
 - Gold standard promotions (high quality, well-used artifacts)
 """
 
-import json
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from .index_repository import IndexRepository, default_index_path, shared_index
 from .models import (
     CurationAction,
     CurationRecommendation,
@@ -24,6 +25,7 @@ from .models import (
     RelevanceStatus,
     SystemHealthConfig,
 )
+from .similarity import CONTENT_SIMILARITY_THRESHOLD, ContentLSHIndex, TitleTokenIndex
 
 
 class CurationEngine:
@@ -33,26 +35,15 @@ class CurationEngine:
         self,
         repo_root: Path,
         config: Optional[SystemHealthConfig] = None,
+        index: Optional[IndexRepository] = None,
     ):
         self.repo_root = Path(repo_root)
         self.config = config or SystemHealthConfig()
-        self._index_cache: Optional[dict] = None
+        self.index = index or shared_index(default_index_path(self.repo_root))
     
     def _load_index(self) -> Optional[dict]:
         """Load the knowledge index."""
-        if self._index_cache is not None:
-            return self._index_cache
-        
-        index_path = self.repo_root / "outputs" / "keys_index" / "kb_index.json"
-        if not index_path.exists():
-            return None
-        
-        try:
-            with open(index_path, "r", encoding="utf-8") as f:
-                self._index_cache = json.load(f)
-                return self._index_cache
-        except Exception:
-            return None
+        return self.index.load()
     
     def generate_recommendations(
         self,
@@ -74,6 +65,10 @@ class CurationEngine:
             artifact_alerts = alerts_by_artifact.get(artifact_id, [])
             rec = self._analyze_artifact(artifact_id, metrics, artifact_alerts)
             if rec:
+                if not rec.related_artifacts:
+                    # Neighbours found at index time, superseding ones first
+                    relevance = metrics.relevance_health
+                    rec.related_artifacts = list(dict.fromkeys(relevance.superseded_by + relevance.related_artifacts))
                 recommendations.append(rec)
         
         # Sort by priority and confidence
@@ -93,13 +88,7 @@ class CurationEngine:
         """Analyze a single artifact and generate recommendation."""
         
         # Load artifact metadata
-        index = self._load_index()
-        artifact = None
-        if index:
-            for art in index.get("artifacts", []):
-                if art.get("id") == artifact_id:
-                    artifact = art
-                    break
+        artifact = self.index.get(artifact_id)
         
         # Decision tree for recommendations
         
@@ -357,44 +346,33 @@ class CurationEngine:
         seen_pairs = set()
         
         # Group by type
-        by_type: dict[str, list[dict]] = {}
-        for art in index.get("artifacts", []):
-            art_type = art.get("type", "unknown")
-            if art_type not in by_type:
-                by_type[art_type] = []
-            by_type[art_type].append(art)
-        
-        # Find similar pairs
-        import re
-        
-        for art_type, artifacts in by_type.items():
-            for i, art1 in enumerate(artifacts):
-                for j, art2 in enumerate(artifacts):
-                    if i >= j:
-                        continue
-                    
-                    id1 = art1.get("id", "")
-                    id2 = art2.get("id", "")
-                    
+        by_type = self.index.by_type()
+        
+        for artifacts in by_type.values():
+            # Find similar pairs among those sharing a title word (see TitleTokenIndex)
+            word_sets = [set(re.findall(r'\b\w+\b', art.get("title", "").lower())) for art in artifacts]
+            token_index = TitleTokenIndex([sorted(words) for words in word_sets])
+            for i, j, similarity in token_index.similar_pairs(0.6):
+                id1 = artifacts[i].get("id", "")
+                id2 = artifacts[j].get("id", "")
+                pair_key = tuple(sorted([id1, id2]))
+                if id1 == id2 or pair_key in seen_pairs:
+                    continue
+                seen_pairs.add(pair_key)
+                candidates.append((id1, id2, similarity))
+            
+            # Near-duplicate bodies, paired with the first artifact of their cluster
+            content_index = ContentLSHIndex([art.get("content_fingerprint", "") for art in artifacts])
+            for cluster in content_index.clusters(CONTENT_SIMILARITY_THRESHOLD):
+                first = cluster[0]
+                for k in cluster[1:]:
+                    id1 = artifacts[first].get("id", "")
+                    id2 = artifacts[k].get("id", "")
                     pair_key = tuple(sorted([id1, id2]))
-                    if pair_key in seen_pairs:
+                    if id1 == id2 or pair_key in seen_pairs:
                         continue
                     seen_pairs.add(pair_key)
-                    
-                    # Compare titles
-                    title1 = art1.get("title", "").lower()
-                    title2 = art2.get("title", "").lower()
-                    
-                    # Extract words
-                    words1 = set(re.findall(r'\b\w+\b', title1))
-                    words2 = set(re.findall(r'\b\w+\b', title2))
-                    
-                    if len(words1) > 0 and len(words2) > 0:
-                        overlap = len(words1 & words2)
-                        similarity = overlap / max(len(words1), len(words2))
-                        
-                        if similarity > 0.6:
-                            candidates.append((id1, id2, similarity))
+                    candidates.append((id1, id2, content_index.similarity(first, k)))
         
         # Sort by similarity
         candidates.sort(key=lambda x: x[2], reverse=True)
@@ -0,0 +1,252 @@
+"""Versioned deprecation rule packs, evaluated against a file's symbol index.
+
+A rule pack groups the deprecations of one library under a version, so
+alerts can say which pack (and which revision of it) flagged an artifact.
+Each rule matches one kind of symbol from ``symbol_index.FileSymbols``:
+
+- ``imports``: an imported module or name equal to, or inside, one of the
+  given modules (``sklearn.cross_validation`` also matches
+  ``sklearn.cross_validation.KFold``)
+- ``references``: a resolved name matching one of the given patterns, where
+  ``*`` matches within a single name segment (``pandas.read_*().append``
+  matches ``df.append`` for ``df = pd.read_csv(...)``, but not
+  ``rows.append`` for ``rows = pd.read_csv(...).to_dict()``)
+- ``calls``: a call to a name matching one of the patterns, optionally only
+  if one of its string arguments contains ``arg_contains`` (case-insensitive)
+
+Extra packs can be loaded from JSON files with the same fields
+(``load_rule_pack``).
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from .symbol_index import FileSymbols
+
+
+@lru_cache(maxsize=None)
+def _pattern_regex(pattern: str) -> re.Pattern:
+    """Regex for a rule pattern, with ``*`` limited to one segment (no ``.``, ``(`` or ``)``)."""
+    return re.compile(r"[^.()]*".join(re.escape(part) for part in pattern.split("*")))
+
+
+def _matches(name: str, pattern: str) -> bool:
+    return _pattern_regex(pattern).fullmatch(name) is not None
+
+
+@dataclass
+class DeprecationRule:
+    """One deprecated API and what to use instead."""
+    id: str
+    message: str
+    imports: list[str] = field(default_factory=list)
+    references: list[str] = field(default_factory=list)
+    calls: list[str] = field(default_factory=list)
+    arg_contains: str = ""
+    since: str = ""
+
+    def match(self, symbols: FileSymbols) -> tuple[Optional[str], list[int]]:
+        """The first matching symbol and its lines (``(None, [])`` if the rule does not match)."""
+        for name in symbols.imports:
+            if any(name == module or name.startswith(module + ".") for module in self.imports):
+                return name, []
+        for name, lines in symbols.references.items():
+            if any(_matches(name, pattern) for pattern in self.references):
+                return name, sorted(set(lines))
+        needle = self.arg_contains.lower()
+        for name, calls in symbols.calls.items():
+            if not any(_matches(name, pattern) for pattern in self.calls):
+                continue
+            lines = [line for line, strings in calls if not needle or any(needle in s.lower() for s in strings)]
+            if lines:
+                return name, sorted(set(lines))
+        return None, []
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DeprecationRule":
+        return cls(
+            id=data["id"],
+            message=data["message"],
+            imports=data.get("imports", []),
+            references=data.get("references", []),
+            calls=data.get("calls", []),
+            arg_contains=data.get("arg_contains", ""),
+            since=data.get("since", ""),
+        )
+
+
+@dataclass
+class RulePack:
+    """The deprecation rules for one library, at one version of the pack."""
+    name: str
+    version: str
+    rules: list[DeprecationRule] = field(default_factory=list)
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}@{self.version}"
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RulePack":
+        return cls(
+            name=data["name"],
+            version=str(data["version"]),
+            rules=[DeprecationRule.from_dict(r) for r in data.get("rules", [])],
+        )
+
+
+@dataclass
+class RuleHit:
+    """A rule that matched a file."""
+    pack: RulePack
+    rule: DeprecationRule
+    symbol: str
+    lines: list[int]
+
+
+def load_rule_pack(path: Path) -> RulePack:
+    with open(path, "r", encoding="utf-8") as f:
+        return RulePack.from_dict(json.load(f))
+
+
+def evaluate(symbols: FileSymbols, packs: list[RulePack]) -> list[RuleHit]:
+    """Every rule of ``packs`` that matches ``symbols``, in pack and rule order."""
+    hits = []
+    for pack in packs:
+        for rule in pack.rules:
+            symbol, lines = rule.match(symbols)
+            if symbol is not None:
+                hits.append(RuleHit(pack=pack, rule=rule, symbol=symbol, lines=lines))
+    return hits
+
+
+BUILTIN_RULE_PACKS = [
+    RulePack.from_dict({
+        "name": "pandas",
+        "version": "2.2",
+        "rules": [
+            {
+                "id": "pandas-append",
+                "message": "DataFrame.append is deprecated, use concat",
+                "references": [
+                    "pandas.DataFrame.append",
+                    "pandas.Series.append",
+                    "pandas.DataFrame().append",
+                    "pandas.Series().append",
+                    "pandas.read_*().append",
+                    "pandas.concat().append",
+                ],
+                "since": "1.4",
+            },
+            {
+                "id": "pandas-iteritems",
+                "message": "iteritems is deprecated, use items",
+                "references": [
+                    "pandas.DataFrame.iteritems",
+                    "pandas.Series.iteritems",
+                    "pandas.DataFrame().iteritems",
+                    "pandas.Series().iteritems",
+                    "pandas.read_*().iteritems",
+                    "pandas.concat().iteritems",
+                ],
+                "since": "1.5",
+            },
+            {
+                "id": "pandas-panel",
+                "message": "pandas.Panel was removed, use a MultiIndex DataFrame",
+                "imports": ["pandas.Panel"],
+                "references": ["pandas.Panel"],
+                "since": "0.20",
+            },
+        ],
+    }),
+    RulePack.from_dict({
+        "name": "scikit-learn",
+        "version": "1.5",
+        "rules": [
+            {
+                "id": "sklearn-cross-validation",
+                "message": "sklearn.cross_validation was removed, use sklearn.model_selection",
+                "imports": ["sklearn.cross_validation"],
+                "since": "0.18",
+            },
+            {
+                "id": "sklearn-grid-search",
+                "message": "sklearn.grid_search was removed, use sklearn.model_selection",
+                "imports": ["sklearn.grid_search"],
+                "since": "0.18",
+            },
+            {
+                "id": "sklearn-externals-joblib",
+                "message": "sklearn.externals.joblib was removed, import joblib directly",
+                "imports": ["sklearn.externals.joblib"],
+                "since": "0.21",
+            },
+        ],
+    }),
+    RulePack.from_dict({
+        "name": "flask",
+        "version": "1",
+        "rules": [
+            {
+                "id": "flask-route-decorator",
+                "message": "Flask route decorators may indicate outdated patterns",
+                "references": ["flask.Flask().route", "flask.Blueprint().route"],
+            },
+        ],
+    }),
+    RulePack.from_dict({
+        "name": "python",
+        "version": "3.12",
+        "rules": [
+            {
+                "id": "deprecated-package",
+                "message": "Explicit deprecated import detected",
+                "imports": ["deprecated"],
+            },
+            {
+                "id": "deprecation-warning",
+                "message": "Deprecation warning in code",
+                "calls": ["warnings.warn"],
+                "arg_contains": "deprecat",
+            },
+            {
+                "id": "collections-abc",
+                "message": "ABCs in collections were removed, import them from collections.abc",
+                "imports": [
+                    "collections.Mapping",
+                    "collections.MutableMapping",
+                    "collections.Sequence",
+                    "collections.MutableSequence",
+                    "collections.Iterable",
+                    "collections.Callable",
+                ],
+                "references": [
+                    "collections.Mapping",
+                    "collections.MutableMapping",
+                    "collections.Sequence",
+                    "collections.MutableSequence",
+                    "collections.Iterable",
+                    "collections.Callable",
+                ],
+                "since": "3.3",
+            },
+            {
+                "id": "removed-stdlib-modules",
+                "message": "imp and distutils were removed in Python 3.12",
+                "imports": ["imp", "distutils"],
+                "since": "3.12",
+            },
+            {
+                "id": "datetime-utcnow",
+                "message": "datetime.utcnow is deprecated, use datetime.now(timezone.utc)",
+                "references": ["datetime.datetime.utcnow", "datetime.datetime.utcfromtimestamp"],
+                "since": "3.12",
+            },
+        ],
+    }),
+]
@@ -7,12 +7,13 @@ Detects various forms of knowledge drift:
 - Superseded artifacts (duplicates, better alternatives)
 """
 
-import json
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
+from .index_repository import IndexRepository, default_index_path, shared_index
+from .deprecation_rules import BUILTIN_RULE_PACKS, RulePack, evaluate
 from .models import (
     CurationAction,
     DependencyStatus,
@@ -23,12 +24,15 @@ from .models import (
     RelevanceStatus,
     SystemHealthConfig,
 )
+from .similarity import CONTENT_SIMILARITY_THRESHOLD, ContentLSHIndex, TitleTokenIndex
+from .symbol_index import SymbolCache
 
 
 class DriftDetector:
     """Detects knowledge drift in artifacts."""
     
-    # Patterns that indicate deprecated APIs or features
+    # Patterns that indicate deprecated APIs or features, for Python that
+    # does not parse (parsed code is matched against rule packs instead)
     DEPRECATED_PATTERNS = [
         (r"pandas\.DataFrame\.append", "DataFrame.append is deprecated, use concat"),
         (r"sklearn\.\w+\.\w+\(.*deprecated", "scikit-learn deprecated API usage"),
@@ -53,27 +57,20 @@ class DriftDetector:
         self,
         repo_root: Path,
         config: Optional[SystemHealthConfig] = None,
+        index: Optional[IndexRepository] = None,
+        symbol_cache_path: Optional[Path] = None,
+        rule_packs: Optional[list[RulePack]] = None,
     ):
         self.repo_root = Path(repo_root)
         self.config = config or SystemHealthConfig()
+        self.index = index or shared_index(default_index_path(self.repo_root))
+        self.symbol_cache = SymbolCache(symbol_cache_path)
+        self.rule_packs = rule_packs if rule_packs is not None else BUILTIN_RULE_PACKS
         self._alerts: list[DriftAlert] = []
-        self._index_cache: Optional[dict] = None
     
     def _load_index(self) -> Optional[dict]:
         """Load the knowledge index."""
-        if self._index_cache is not None:
-            return self._index_cache
-        
-        index_path = self.repo_root / "outputs" / "keys_index" / "kb_index.json"
-        if not index_path.exists():
-            return None
-        
-        try:
-            with open(index_path, "r", encoding="utf-8") as f:
-                self._index_cache = json.load(f)
-                return self._index_cache
-        except Exception:
-            return None
+        return self.index.load()
     
     def detect_all_drift(
         self,
@@ -90,27 +87,46 @@ class DriftDetector:
         superseded_alerts = self._detect_superseded_artifacts(health_metrics)
         alerts.extend(superseded_alerts)
         
+        self.symbol_cache.save()
         return alerts
     
     def detect_drift(
         self,
         artifact_id: str,
         metrics: HealthMetrics,
+        artifact: Optional[dict] = None,
+        content: Optional[str] = None,
     ) -> list[DriftAlert]:
-        """Detect drift for a single artifact."""
-        alerts = []
+        """Detect drift for a single artifact.
         
+        ``artifact`` (its index entry) and ``content`` (the file's text) can
+        be passed in when already loaded; otherwise they are looked up in
+        the index and read from disk.
+        """
         # Load artifact data
-        index = self._load_index()
-        artifact = None
-        if index:
-            for art in index.get("artifacts", []):
-                if art.get("id") == artifact_id:
-                    artifact = art
-                    break
+        if artifact is None:
+            artifact = self.index.get(artifact_id)
         
         if not artifact:
-            return alerts
+            return []
+        
+        alerts = self.detect_metric_drift(artifact_id, metrics, artifact)
+        
+        artifact_path = self.repo_root / artifact.get("path", "")
+        if content is None and artifact_path.exists():
+            try:
+                with open(artifact_path, "r", encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+            except Exception:
+                pass
+        if content is not None:
+            alerts.extend(self.detect_content_drift(artifact_id, artifact, content))
+        
+        return alerts
+    
+    def detect_metric_drift(self, artifact_id: str, metrics: HealthMetrics, artifact: dict) -> list[DriftAlert]:
+        """Drift visible from the index entry and health metrics alone."""
+        alerts = []
         
         # Check for broken status
         if artifact.get("runnable_status") == "broken":
@@ -186,15 +202,17 @@ class DriftDetector:
                 recommended_action=CurationAction.REFACTOR,
             ))
         
+        return alerts
+    
+    def detect_content_drift(self, artifact_id: str, artifact: dict, content: str) -> list[DriftAlert]:
+        """Drift found in the artifact file's text: deprecated APIs and stale runbooks."""
         # Check for deprecated APIs in code
         artifact_path = self.repo_root / artifact.get("path", "")
-        if artifact_path.exists():
-            api_alerts = self._scan_for_deprecated_apis(artifact_id, artifact_path)
-            alerts.extend(api_alerts)
+        alerts = self._scan_for_deprecated_apis(artifact_id, artifact_path, content)
         
         # Check runbook staleness
         if artifact.get("type") == "runbook":
-            runbook_alert = self._check_runbook_staleness(artifact_id, artifact)
+            runbook_alert = self._check_runbook_staleness(artifact_id, artifact, content)
             if runbook_alert:
                 alerts.append(runbook_alert)
         
@@ -204,16 +222,50 @@ class DriftDetector:
         self,
         artifact_id: str,
         artifact_path: Path,
+        content: Optional[str] = None,
     ) -> list[DriftAlert]:
-        """Scan artifact content for deprecated API usage."""
+        """Scan artifact content for deprecated API usage.
+        
+        Rule packs are matched against the file's symbol index (imports and
+        resolved names in its Python code), so usage in comments and strings
+        is ignored. Python files that do not parse fall back to the legacy
+        text patterns.
+        """
         alerts = []
         
-        try:
-            with open(artifact_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-        except Exception:
-            return alerts
+        if content is None:
+            try:
+                with open(artifact_path, "r", encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+            except Exception:
+                return alerts
+        
+        symbols = self.symbol_cache.symbols(artifact_path, content)
+        if symbols.sources and symbols.unparsed == symbols.sources and artifact_path.suffix.lower() == ".py":
+            return self._scan_deprecated_patterns(artifact_id, content)
+        
+        for hit in evaluate(symbols, self.rule_packs):
+            alerts.append(DriftAlert(
+                artifact_id=artifact_id,
+                drift_type=DriftType.DEPRECATED_API,
+                severity="warning",
+                message=hit.rule.message,
+                detected_at=datetime.now(),
+                details={
+                    "rule": hit.rule.id,
+                    "rule_pack": hit.pack.label,
+                    "symbol": hit.symbol,
+                    "lines": hit.lines,
+                    "since": hit.rule.since,
+                },
+                recommended_action=CurationAction.UPDATE,
+            ))
         
+        return alerts
+    
+    def _scan_deprecated_patterns(self, artifact_id: str, content: str) -> list[DriftAlert]:
+        """Text-pattern scan, for code the symbol index cannot parse."""
+        alerts = []
         for pattern, message in self.DEPRECATED_PATTERNS:
             if re.search(pattern, content, re.IGNORECASE):
                 alerts.append(DriftAlert(
@@ -232,18 +284,20 @@ class DriftDetector:
         self,
         artifact_id: str,
         artifact: dict,
+        content: Optional[str] = None,
     ) -> Optional[DriftAlert]:
         """Check if a runbook is outdated."""
-        artifact_path = self.repo_root / artifact.get("path", "")
-        
-        if not artifact_path.exists():
-            return None
-        
-        try:
-            with open(artifact_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-        except Exception:
-            return None
+        if content is None:
+            artifact_path = self.repo_root / artifact.get("path", "")
+            
+            if not artifact_path.exists():
+                return None
+            
+            try:
+                with open(artifact_path, "r", encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+            except Exception:
+                return None
         
         # Check for required sections
         missing_sections = []
@@ -304,73 +358,79 @@ class DriftDetector:
         if not index:
             return alerts
         
-        artifacts_by_type: dict[str, list[dict]] = {}
-        for art in index.get("artifacts", []):
-            art_type = art.get("type", "unknown")
-            if art_type not in artifacts_by_type:
-                artifacts_by_type[art_type] = []
-            artifacts_by_type[art_type].append(art)
+        artifacts_by_type = self.index.by_type()
         
         # Check for potential duplicates or superseded artifacts
         for art_type, artifacts in artifacts_by_type.items():
             if len(artifacts) < 2:
                 continue
             
-            # Simple similarity check based on title keywords
-            titles = [(art.get("id", ""), art.get("title", "").lower().split()) for art in artifacts]
+            # Simple similarity check based on title keywords; only pairs
+            # sharing a rare-enough word are compared (see TitleTokenIndex)
+            token_index = TitleTokenIndex([art.get("title", "").lower().split() for art in artifacts])
+            
+            for i, j, similarity in token_index.similar_pairs(0.7):  # 70% word overlap
+                newer, older = self._rank_pair(artifacts[i], artifacts[j], health_metrics)
+                alerts.append(self._superseded_alert(older, newer, similarity, "title"))
             
-            for i, (id1, words1) in enumerate(titles):
-                for j, (id2, words2) in enumerate(titles):
-                    if i >= j:
+            # Near-duplicate bodies, whatever their titles (MinHash fingerprints from the index)
+            flagged = {(a.artifact_id, a.details["similar_to"]) for a in alerts}
+            content_index = ContentLSHIndex([art.get("content_fingerprint", "") for art in artifacts])
+            for cluster in content_index.clusters(CONTENT_SIMILARITY_THRESHOLD):
+                best = cluster[0]
+                for k in cluster[1:]:
+                    if self._rank_pair(artifacts[best], artifacts[k], health_metrics)[0] != artifacts[best].get("id", ""):
+                        best = k
+                newer = artifacts[best].get("id", "")
+                for k in cluster:
+                    older = artifacts[k].get("id", "")
+                    if k == best or older == newer or (older, newer) in flagged:
                         continue
-                    
-                    # Check for significant word overlap
-                    if len(words1) > 0 and len(words2) > 0:
-                        overlap = len(set(words1) & set(words2))
-                        similarity = overlap / max(len(words1), len(words2))
-                        
-                        if similarity > 0.7:  # 70% word overlap
-                            # Determine which one is newer/better
-                            art1 = artifacts[i]
-                            art2 = artifacts[j]
-                            
-                            # Prefer artifacts with more recent verification
-                            ver1 = art1.get("last_verified")
-                            ver2 = art2.get("last_verified")
-                            
-                            if ver1 and not ver2:
-                                newer = id1
-                                older = id2
-                            elif ver2 and not ver1:
-                                newer = id2
-                                older = id1
-                            else:
-                                # Check health scores
-                                score1 = health_metrics.get(id1, HealthMetrics(artifact_id=id1)).health_score
-                                score2 = health_metrics.get(id2, HealthMetrics(artifact_id=id2)).health_score
-                                
-                                if score1 >= score2:
-                                    newer = id1
-                                    older = id2
-                                else:
-                                    newer = id2
-                                    older = id1
-                            
-                            alerts.append(DriftAlert(
-                                artifact_id=older,
-                                drift_type=DriftType.SUPERSEDED_ARTIFACT,
-                                severity="info",
-                                message=f"Similar to {newer} ({similarity:.0%} title overlap)",
-                                detected_at=datetime.now(),
-                                details={
-                                    "similar_to": newer,
-                                    "similarity_score": round(similarity, 2),
-                                },
-                                recommended_action=CurationAction.MERGE,
-                            ))
+                    alerts.append(self._superseded_alert(older, newer, content_index.similarity(k, best), "content"))
         
         return alerts
     
+    def _rank_pair(
+        self,
+        art1: dict,
+        art2: dict,
+        health_metrics: dict[str, HealthMetrics],
+    ) -> tuple[str, str]:
+        """Ids of two similar artifacts as (newer/better, older)."""
+        id1 = art1.get("id", "")
+        id2 = art2.get("id", "")
+        
+        # Prefer artifacts with more recent verification
+        ver1 = art1.get("last_verified")
+        ver2 = art2.get("last_verified")
+        
+        if ver1 and not ver2:
+            return id1, id2
+        if ver2 and not ver1:
+            return id2, id1
+        
+        # Check health scores
+        score1 = health_metrics.get(id1, HealthMetrics(artifact_id=id1)).health_score
+        score2 = health_metrics.get(id2, HealthMetrics(artifact_id=id2)).health_score
+        if score1 >= score2:
+            return id1, id2
+        return id2, id1
+    
+    def _superseded_alert(self, older: str, newer: str, similarity: float, basis: str) -> DriftAlert:
+        return DriftAlert(
+            artifact_id=older,
+            drift_type=DriftType.SUPERSEDED_ARTIFACT,
+            severity="info",
+            message=f"Similar to {newer} ({similarity:.0%} {basis} overlap)",
+            detected_at=datetime.now(),
+            details={
+                "similar_to": newer,
+                "similarity_score": round(similarity, 2),
+                "basis": basis,
+            },
+            recommended_action=CurationAction.MERGE,
+        )
+    
     def analyze_error_logs(self, artifact_id: str, log_content: str) -> list[DriftAlert]:
         """Analyze error logs for drift patterns."""
         alerts = []
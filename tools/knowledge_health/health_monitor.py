@@ -7,13 +7,22 @@ This module provides the core health monitoring functionality including:
 - Relevance decay tracking
 """
 
+import hashlib
 import json
-import subprocess
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
+import numpy as np
+
+from ..keys_indexer.checkpoint import atomic_write_json
+from ..keys_indexer.execution_log import ExecutionLogStore, default_log_path
+from ..keys_indexer.toolchain import ToolchainProbe, default_toolchain_probe
+from .index_repository import IndexRepository, default_index_path, shared_index
 from .models import (
     DependencyHealth,
     DependencyStatus,
@@ -26,6 +35,49 @@ from .models import (
     RelevanceStatus,
     SystemHealthConfig,
 )
+from .scoring import HealthScoreMatrix
+
+
+# check_all_health state (metrics + input fingerprints), kept next to health_metrics.json
+HEALTH_STATE_NAME = "health_state.json"
+
+# Metadata cosine similarity from which a more recently modified neighbour supersedes an artifact
+SUPERSEDED_SIMILARITY = 0.9
+
+
+@dataclass
+class StatBatch:
+    """File stats gathered up front for a batch of health checks.
+    
+    ``stats`` maps artifact paths to their stat results (missing files are
+    absent), ``execution_summaries`` holds every artifact's summary from the
+    execution log store and ``execution_logs`` the names of legacy
+    per-artifact log files, so per-artifact checks need no I/O of their own.
+    """
+    stats: dict[Path, os.stat_result] = field(default_factory=dict)
+    execution_summaries: dict[str, dict] = field(default_factory=dict)
+    execution_logs: set[str] = field(default_factory=set)
+
+
+def _scan_stats(paths: list[Path]) -> dict[Path, os.stat_result]:
+    """Stat many files with one directory scan per parent directory."""
+    by_dir: dict[Path, set[str]] = {}
+    for path in paths:
+        by_dir.setdefault(path.parent, set()).add(path.name)
+    
+    stats = {}
+    for directory, names in by_dir.items():
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in names:
+                        try:
+                            stats[directory / entry.name] = entry.stat()
+                        except OSError:
+                            pass
+        except OSError:
+            continue
+    return stats
 
 
 class HealthMonitor:
@@ -36,32 +88,38 @@ class HealthMonitor:
         repo_root: Path,
         config: Optional[SystemHealthConfig] = None,
         index_path: Optional[Path] = None,
+        toolchain: Optional[ToolchainProbe] = None,
+        execution_log: Optional[ExecutionLogStore] = None,
+        state_path: Optional[Path] = None,
+        index: Optional[IndexRepository] = None,
     ):
         self.repo_root = Path(repo_root)
         self.config = config or SystemHealthConfig()
-        self.index_path = index_path or self.repo_root / "outputs" / "keys_index" / "kb_index.json"
-        self._cached_artifacts: Optional[list[dict]] = None
-        self._cached_index: Optional[dict] = None
+        self.index = index or shared_index(index_path or default_index_path(self.repo_root))
+        self.index_path = self.index.path
+        self.toolchain = toolchain or default_toolchain_probe()
+        self._execution_log = execution_log
+        # Metrics and input fingerprints from the previous check_all_health run
+        self.state_path = state_path
+        self.recomputed: set[str] = set()
+        self.score_matrix: Optional[HealthScoreMatrix] = None
     
     def _load_index(self) -> Optional[dict]:
         """Load the knowledge index."""
-        if self._cached_index is not None:
-            return self._cached_index
-        
-        if not self.index_path.exists():
-            return None
-        
-        try:
-            with open(self.index_path, "r", encoding="utf-8") as f:
-                self._cached_index = json.load(f)
-                self._cached_artifacts = self._cached_index.get("artifacts", [])
-                return self._cached_index
-        except Exception as e:
-            print(f"Error loading index: {e}")
-            return None
+        return self.index.load()
+    
+    def check_health(self, artifact: dict, batch: Optional[StatBatch] = None) -> HealthMetrics:
+        """Check health for a single artifact.
+        
+        ``batch`` supplies prefetched file stats (see ``check_all_health``);
+        without it the artifact's files are checked directly.
+        """
+        metrics = self._check_components(artifact, batch)
+        HealthScoreMatrix.from_metrics([metrics]).apply([metrics], self.config)
+        return metrics
     
-    def check_health(self, artifact: dict) -> HealthMetrics:
-        """Check health for a single artifact."""
+    def _check_components(self, artifact: dict, batch: Optional[StatBatch] = None) -> HealthMetrics:
+        """Per-component checks for an artifact, without the overall score."""
         artifact_id = artifact.get("id", "unknown")
         
         # Initialize metrics
@@ -75,30 +133,221 @@ class HealthMonitor:
         # Check component health
         metrics.dependency_health = self._check_dependencies(artifact)
         metrics.environment_health = self._check_environment(artifact)
-        metrics.relevance_health = self._check_relevance(artifact)
-        metrics.execution_history = self._check_execution_history(artifact)
-        
-        # Calculate overall health score
-        metrics.health_score = self._calculate_health_score(metrics)
-        metrics.status = self._health_score_to_status(metrics.health_score)
-        
+        metrics.relevance_health = self._check_relevance(artifact, batch)
+        metrics.execution_history = self._check_execution_history(artifact, batch)
         return metrics
     
-    def check_all_health(self) -> dict[str, HealthMetrics]:
-        """Check health for all artifacts in the index."""
+    def check_all_health(self, max_workers: int = 1, incremental: bool = True) -> dict[str, HealthMetrics]:
+        """Check health for all artifacts in the index.
+        
+        Artifact files are stat'ed up front with one directory scan per
+        directory, and execution summaries for all artifacts are read from
+        the execution log store in one go. With ``max_workers > 1`` (or ``0`` for
+        one thread per CPU) the per-artifact checks run on a thread pool;
+        results are collected in index order, so they match the serial run.
+        
+        With a ``state_path``, each artifact's metrics are saved along with a
+        fingerprint of its inputs (see ``_input_fingerprint``). On the next
+        run an artifact whose fingerprint is unchanged reuses its previous
+        metrics instead of being rechecked (unless ``incremental=False``),
+        and ``first_seen`` is carried forward either way. IDs of the
+        artifacts actually rechecked are left in ``self.recomputed``.
+        
+        Scores and statuses are computed for all artifacts at once from a
+        ``HealthScoreMatrix``, kept in ``self.score_matrix`` for ``rescore``.
+        """
         index = self._load_index()
         if not index:
             return {}
         
         artifacts = index.get("artifacts", [])
-        results = {}
+        return self.check_artifacts(artifacts, self._stat_batch(artifacts), max_workers, incremental)
+    
+    def check_artifacts(
+        self,
+        artifacts: list[dict],
+        batch: StatBatch,
+        max_workers: int = 1,
+        incremental: bool = True,
+    ) -> dict[str, HealthMetrics]:
+        """``check_all_health`` for index entries whose stats are already in ``batch``.
+        
+        The fused pipeline calls this with the stats taken while scanning,
+        so it shares the incremental state and score matrix of a normal run.
+        """
+        now = datetime.now()
+        previous = self._load_state()
+        config_hash = self._config_hash()
+        
+        fingerprints = [self._input_fingerprint(a, batch, config_hash, now) for a in artifacts]
+        checked: list[Optional[HealthMetrics]] = []
+        pending = []
+        for artifact, fingerprint in zip(artifacts, fingerprints):
+            prior = previous.get(artifact.get("id", "unknown"))
+            if incremental and prior and prior["fingerprint"] == fingerprint:
+                metrics = HealthMetrics.from_dict(prior["metrics"])
+                metrics.last_health_check = now
+                checked.append(metrics)
+            else:
+                checked.append(None)
+                pending.append(artifact)
+        
+        if max_workers <= 0:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(pending)) or 1
+        
+        if max_workers == 1:
+            fresh = [self._check_components(artifact, batch) for artifact in pending]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                fresh = list(pool.map(lambda artifact: self._check_components(artifact, batch), pending))
+        
+        self.recomputed = set()
+        fresh_iter = iter(fresh)
+        for i, metrics in enumerate(checked):
+            if metrics is None:
+                metrics = next(fresh_iter)
+                prior = previous.get(metrics.artifact_id)
+                if prior and prior["metrics"].get("first_seen"):
+                    metrics.first_seen = datetime.fromisoformat(prior["metrics"]["first_seen"])
+                self.recomputed.add(metrics.artifact_id)
+                checked[i] = metrics
+        
+        # Score everything in one vectorized pass
+        self.score_matrix = HealthScoreMatrix.from_metrics(checked, now)
+        self.score_matrix.apply(checked, self.config)
         
-        for artifact in artifacts:
-            metrics = self.check_health(artifact)
+        results = {}
+        for metrics in checked:
             results[metrics.artifact_id] = metrics
         
+        if self.state_path:
+            self._save_state(results, dict(zip((m.artifact_id for m in checked), fingerprints)))
+        
         return results
     
+    def _config_hash(self) -> str:
+        """Hash of everything global that feeds into every artifact's metrics."""
+        payload = {
+            "config": self.config.to_dict(),
+            "python": list(sys.version_info[:3]),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+    
+    def _input_fingerprint(self, artifact: dict, batch: StatBatch, config_hash: str, now: datetime) -> str:
+        """Hash every input ``check_health`` reads for an artifact.
+        
+        Covers the index entry and related neighbours, the file's
+        mtime/ctime/size, its execution log summary, the config and,
+        instead of the raw ages, which side of each time-based scoring
+        threshold the artifact is on. Time passing
+        alone therefore only forces a recheck when a threshold is crossed;
+        day counts in reused metrics are as of their last recheck.
+        """
+        artifact_id = artifact.get("id", "unknown")
+        stat = batch.stats.get(self.repo_root / artifact.get("path", ""))
+        log_data = batch.execution_summaries.get(artifact_id)
+        if log_data is None:
+            log_data = self._read_legacy_log(artifact_id, batch)
+        
+        # Neighbours, and the mtimes that decide whether they supersede it
+        related = []
+        for neighbour, similarity in self.index.related(artifact_id):
+            entry = self.index.get(neighbour) if similarity >= SUPERSEDED_SIMILARITY else None
+            neighbour_stat = batch.stats.get(self.repo_root / entry.get("path", "")) if entry else None
+            related.append([neighbour, similarity, neighbour_stat.st_mtime_ns if neighbour_stat else None])
+        
+        language = artifact.get("language", "").lower()
+        payload = {
+            "config": config_hash,
+            "artifact": artifact,
+            "related": related,
+            "file": [stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size] if stat else None,
+            "execution_log": log_data,
+            "time_buckets": self._time_buckets(artifact, stat, log_data, now),
+            "node": self.toolchain.available("node") if language in ["javascript", "typescript", "node"] else None,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+    
+    def _time_buckets(
+        self,
+        artifact: dict,
+        stat: Optional[os.stat_result],
+        log_data: Optional[dict],
+        now: datetime,
+    ) -> list:
+        """Position relative to each age threshold used by the relevance and execution checks."""
+        days_since_update = (now - datetime.fromtimestamp(stat.st_mtime)).days if stat else 0
+        days_since_creation = (now - datetime.fromtimestamp(stat.st_ctime)).days if stat else 0
+        
+        days_since_verification = 0
+        if artifact.get("last_verified"):
+            try:
+                days_since_verification = (now - datetime.fromisoformat(artifact["last_verified"])).days
+            except ValueError:
+                pass
+        
+        failure_bucket = None
+        if log_data and log_data.get("last_failure"):
+            try:
+                days_since_failure = (now - datetime.fromisoformat(log_data["last_failure"])).days
+                failure_bucket = [days_since_failure < 7, days_since_failure < 30]
+            except (TypeError, ValueError):
+                pass
+        
+        update_thresholds = (
+            self.config.relevance_aging_days,
+            self.config.relevance_stale_days,
+            self.config.relevance_deprecated_days,
+            365,
+        )
+        return [
+            [days_since_update > t for t in update_thresholds],
+            days_since_creation > 30,
+            days_since_verification > 180,
+            failure_bucket,
+        ]
+    
+    def _load_state(self) -> dict[str, dict]:
+        """Previous run's {artifact_id: {"fingerprint", "metrics"}}."""
+        if not self.state_path or not self.state_path.exists():
+            return {}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("artifacts", {})
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable health state {self.state_path}: {e}")
+            return {}
+    
+    def _save_state(self, results: dict[str, HealthMetrics], fingerprints: dict[str, str]) -> None:
+        atomic_write_json(self.state_path, {
+            "schema_version": 1,
+            "generated_at": datetime.now().isoformat(),
+            "artifacts": {
+                artifact_id: {"fingerprint": fingerprints[artifact_id], "metrics": metrics.to_dict()}
+                for artifact_id, metrics in results.items()
+            },
+        })
+    
+    def _stat_batch(self, artifacts: list[dict]) -> StatBatch:
+        """Prefetch the file stats ``check_health`` needs for ``artifacts``."""
+        batch = StatBatch(
+            stats=_scan_stats([self.repo_root / a.get("path", "") for a in artifacts]),
+        )
+        store = self._execution_store()
+        if store:
+            batch.execution_summaries = store.summaries()
+        try:
+            with os.scandir(self._execution_log_dir()) as entries:
+                batch.execution_logs = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            pass
+        return batch
+    
+    def _execution_log_dir(self) -> Path:
+        return self.repo_root / "outputs" / "execution_logs"
+    
     def _check_dependencies(self, artifact: dict) -> DependencyHealth:
         """Check dependency health for an artifact."""
         deps = artifact.get("dependencies", [])
@@ -181,23 +430,13 @@ class HealthMonitor:
         if language and language not in ["python", "", "shell", "bash"]:
             if language in ["javascript", "typescript", "node"]:
                 # Check if node is available
-                try:
-                    result = subprocess.run(
-                        ["node", "--version"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    if result.returncode != 0:
-                        health.missing_binaries.append("node")
-                        health.status = EnvironmentStatus.INCOMPATIBLE
-                except (subprocess.TimeoutExpired, FileNotFoundError):
+                if not self.toolchain.available("node"):
                     health.missing_binaries.append("node")
                     health.status = EnvironmentStatus.INCOMPATIBLE
         
         return health
     
-    def _check_relevance(self, artifact: dict) -> RelevanceHealth:
+    def _check_relevance(self, artifact: dict, batch: Optional[StatBatch] = None) -> RelevanceHealth:
         """Check relevance health for an artifact."""
         health = RelevanceHealth(
             status=RelevanceStatus.CURRENT,
@@ -205,9 +444,8 @@ class HealthMonitor:
         )
         
         # Get file path for age calculation
-        artifact_path = self.repo_root / artifact.get("path", "")
-        if artifact_path.exists():
-            stat = artifact_path.stat()
+        stat = self._artifact_stat(artifact, batch)
+        if stat is not None:
             creation_time = datetime.fromtimestamp(stat.st_ctime)
             modification_time = datetime.fromtimestamp(stat.st_mtime)
             
@@ -243,149 +481,112 @@ class HealthMonitor:
         if runnable_status == "broken":
             health.issues.append("Artifact marked as broken")
         
+        self._check_related(artifact, health, batch)
         return health
     
-    def _check_execution_history(self, artifact: dict) -> ExecutionHistory:
-        """Check execution history for an artifact."""
-        history = ExecutionHistory()
+    def _check_related(self, artifact: dict, health: RelevanceHealth, batch: Optional[StatBatch] = None) -> None:
+        """Fill ``related_artifacts`` and ``superseded_by`` from the neighbours found at index time.
+        
+        A near-identical neighbour (``SUPERSEDED_SIMILARITY``) that was
+        modified more recently than the artifact supersedes it.
+        """
+        related = self.index.related(artifact.get("id", ""))
+        health.related_artifacts = [neighbour for neighbour, _ in related]
+        health.superseded_by = []
+        stat = self._artifact_stat(artifact, batch)
+        if stat is None:
+            return
+        for neighbour, similarity in related:
+            if similarity < SUPERSEDED_SIMILARITY:
+                continue
+            entry = self.index.get(neighbour)
+            neighbour_stat = self._artifact_stat(entry, batch) if entry else None
+            if neighbour_stat is not None and neighbour_stat.st_mtime > stat.st_mtime:
+                health.superseded_by.append(neighbour)
+    
+    def _artifact_stat(self, artifact: dict, batch: Optional[StatBatch] = None) -> Optional[os.stat_result]:
+        """Stat of an artifact's file, from ``batch`` if given (None if missing)."""
+        artifact_path = self.repo_root / artifact.get("path", "")
+        if batch is not None:
+            return batch.stats.get(artifact_path)
+        return artifact_path.stat() if artifact_path.exists() else None
+    
+    def _check_execution_history(self, artifact: dict, batch: Optional[StatBatch] = None) -> ExecutionHistory:
+        """Check execution history for an artifact.
         
-        # Load from stored execution history if available
-        execution_log_path = (
-            self.repo_root / "outputs" / "execution_logs" / f"{artifact.get('id', 'unknown')}.json"
-        )
+        Reads the shared execution log store, falling back to a legacy
+        per-artifact ``<id>.json`` log for artifacts the store has no runs for.
+        """
+        artifact_id = artifact.get("id", "unknown")
+        
+        if batch is not None:
+            log_data = batch.execution_summaries.get(artifact_id)
+        else:
+            store = self._execution_store()
+            log_data = store.summary(artifact_id) if store else None
         
-        if execution_log_path.exists():
+        if log_data is None:
+            log_data = self._read_legacy_log(artifact_id, batch)
+        
+        history = ExecutionHistory()
+        if log_data:
             try:
-                with open(execution_log_path, "r", encoding="utf-8") as f:
-                    log_data = json.load(f)
-                    history.total_attempts = log_data.get("total_attempts", 0)
-                    history.successful_runs = log_data.get("successful_runs", 0)
-                    history.failed_runs = log_data.get("failed_runs", 0)
-                    history.last_success = (
-                        datetime.fromisoformat(log_data["last_success"])
-                        if log_data.get("last_success") else None
-                    )
-                    history.last_failure = (
-                        datetime.fromisoformat(log_data["last_failure"])
-                        if log_data.get("last_failure") else None
-                    )
-                    history.execution_history = log_data.get("execution_history", [])
+                history.total_attempts = log_data.get("total_attempts", 0)
+                history.successful_runs = log_data.get("successful_runs", 0)
+                history.failed_runs = log_data.get("failed_runs", 0)
+                history.last_success = (
+                    datetime.fromisoformat(log_data["last_success"])
+                    if log_data.get("last_success") else None
+                )
+                history.last_failure = (
+                    datetime.fromisoformat(log_data["last_failure"])
+                    if log_data.get("last_failure") else None
+                )
+                history.last_error_message = log_data.get("last_error_message", "")
+                history.average_duration_ms = log_data.get("average_duration_ms", 0.0)
+                history.execution_history = log_data.get("execution_history", [])
             except Exception:
                 pass
         
         return history
     
-    def _calculate_health_score(self, metrics: HealthMetrics) -> float:
-        """Calculate overall health score from component scores."""
-        # Component scores (0-100)
-        dep_score = self._dependency_score(metrics.dependency_health)
-        env_score = self._environment_score(metrics.environment_health)
-        rel_score = self._relevance_score(metrics.relevance_health)
-        exec_score = self._execution_score(metrics.execution_history)
-        
-        # Weighted average
-        score = (
-            dep_score * self.config.dependency_weight +
-            env_score * self.config.environment_weight +
-            rel_score * self.config.relevance_weight +
-            exec_score * self.config.execution_weight
-        )
+    def _read_legacy_log(self, artifact_id: str, batch: Optional[StatBatch] = None) -> Optional[dict]:
+        log_name = f"{artifact_id}.json"
+        execution_log_path = self._execution_log_dir() / log_name
         
-        return max(0.0, min(100.0, score))
-    
-    def _dependency_score(self, health: DependencyHealth) -> float:
-        """Calculate dependency health score (0-100)."""
-        if health.total_deps == 0:
-            return 100.0  # No dependencies = no issues
-        
-        # Penalize broken and unknown dependencies
-        broken_penalty = health.broken_deps * 30
-        stale_penalty = health.stale_deps * 20
-        outdated_penalty = health.outdated_deps * 10
-        unknown_penalty = health.unknown_deps * 5
-        
-        score = 100 - broken_penalty - stale_penalty - outdated_penalty - unknown_penalty
-        
-        # Status-based minimums
-        if health.status == DependencyStatus.BROKEN:
-            score = min(score, 20)
-        elif health.status == DependencyStatus.STALE:
-            score = min(score, 50)
-        elif health.status == DependencyStatus.UNKNOWN:
-            score = min(score, 70)
-        
-        return max(0.0, score)
-    
-    def _environment_score(self, health: EnvironmentHealth) -> float:
-        """Calculate environment health score (0-100)."""
-        if health.status == EnvironmentStatus.INCOMPATIBLE:
-            return 0.0
-        elif health.status == EnvironmentStatus.DRIFTED:
-            return 60.0
-        elif health.status == EnvironmentStatus.COMPATIBLE:
-            return 100.0
+        if batch is not None:
+            log_exists = log_name in batch.execution_logs
         else:
-            return 75.0  # Unknown is moderately concerning
-    
-    def _relevance_score(self, health: RelevanceHealth) -> float:
-        """Calculate relevance health score (0-100)."""
-        score = 100.0
-        
-        # Penalize based on status
-        if health.status == RelevanceStatus.DEPRECATED:
-            score = 10.0
-        elif health.status == RelevanceStatus.SUPERSEDED:
-            score = 20.0
-        elif health.status == RelevanceStatus.STALE:
-            score = 50.0
-        elif health.status == RelevanceStatus.AGING:
-            score = 80.0
-        
-        # Additional age penalty
-        if health.days_since_update > 365:
-            score -= 10
-        if health.days_since_verification > 180:
-            score -= 5
-        
-        # Usage bonus
-        if health.usage_count > 10:
-            score += 5
-        
-        return max(0.0, min(100.0, score))
+            log_exists = execution_log_path.exists()
+        if not log_exists:
+            return None
+        
+        try:
+            with open(execution_log_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return None
     
-    def _execution_score(self, history: ExecutionHistory) -> float:
-        """Calculate execution health score (0-100)."""
-        if history.total_attempts == 0:
-            return 75.0  # No attempts yet is neutral
-        
-        # Success rate
-        success_rate = history.successful_runs / history.total_attempts
-        score = success_rate * 100
-        
-        # Penalize recent failures
-        if history.last_failure:
-            days_since_failure = (datetime.now() - history.last_failure).days
-            if days_since_failure < 7:
-                score -= 20
-            elif days_since_failure < 30:
-                score -= 10
-        
-        # Consecutive failures penalty
-        if history.failed_runs >= self.config.auto_flag_broken_after_failures:
-            score = min(score, 30)
-        
-        return max(0.0, min(100.0, score))
+    def _execution_store(self) -> Optional[ExecutionLogStore]:
+        """The repo's execution log store, if anything has been recorded yet."""
+        if self._execution_log is None:
+            path = default_log_path(self.repo_root)
+            if not path.exists():
+                return None
+            self._execution_log = ExecutionLogStore(path)
+        return self._execution_log
     
-    def _health_score_to_status(self, score: float) -> HealthStatus:
-        """Convert health score to status enum."""
-        if score >= self.config.degraded_threshold:
-            return HealthStatus.HEALTHY
-        elif score >= self.config.critical_threshold:
-            return HealthStatus.DEGRADED
-        elif score >= self.config.decayed_threshold:
-            return HealthStatus.CRITICAL
-        else:
-            return HealthStatus.DECAYED
+    def rescore(self, config: SystemHealthConfig) -> tuple[np.ndarray, np.ndarray]:
+        """Re-evaluate the last ``check_all_health`` results under another config.
+        
+        Returns scores and status codes (indices into ``STATUS_BY_CODE``) in
+        the order of ``self.score_matrix.artifact_ids``. Only weights,
+        status thresholds and ``auto_flag_broken_after_failures`` apply;
+        settings that affect the checks themselves need a new check.
+        """
+        if self.score_matrix is None:
+            raise ValueError("rescore() needs a prior check_all_health() run")
+        return self.score_matrix.rescore(config)
     
     def get_health_summary(self, metrics: dict[str, HealthMetrics]) -> dict[str, Any]:
         """Generate summary statistics from health metrics."""
@@ -0,0 +1,118 @@
+"""Shared, invalidating access to the knowledge index (kb_index.json).
+
+HealthMonitor, DriftDetector, CurationEngine and RevalidationScheduler all
+read the same index. ``IndexRepository`` parses it once, builds the lookup
+tables they need (by id, by type, related neighbours), and reloads only
+when the file's mtime or size changes.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from ..keys_indexer.models import KnowledgeArtifact
+
+
+def default_index_path(repo_root: Path) -> Path:
+    return Path(repo_root) / "outputs" / "keys_index" / "kb_index.json"
+
+
+class IndexRepository:
+    """The parsed knowledge index plus id and type views over its artifacts."""
+
+    def __init__(self, index_path: Path):
+        self.path = Path(index_path)
+        self._lock = threading.Lock()
+        self._signature: Optional[tuple[int, int]] = None
+        self._index: Optional[dict] = None
+        self._by_id: dict[str, dict] = {}
+        self._by_type: dict[str, list[dict]] = {}
+        self._typed: dict[str, KnowledgeArtifact] = {}
+
+    def load(self) -> Optional[dict]:
+        """The index, re-read if the file changed since the last load (None if missing or unreadable)."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            with self._lock:
+                self._set(None, None)
+            return None
+
+        signature = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if signature != self._signature:
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        index = json.load(f)
+                except Exception as e:
+                    print(f"Error loading index: {e}")
+                    index = None
+                self._set(index, signature)
+            return self._index
+
+    def _set(self, index: Optional[dict], signature: Optional[tuple[int, int]]) -> None:
+        self._index = index
+        self._signature = signature
+        self._by_id = {}
+        self._by_type = {}
+        self._typed = {}
+        for artifact in (index or {}).get("artifacts", []):
+            # Duplicate ids resolve to the first entry, as a linear scan would
+            self._by_id.setdefault(artifact.get("id"), artifact)
+            self._by_type.setdefault(artifact.get("type", "unknown"), []).append(artifact)
+
+    def artifacts(self) -> list[dict]:
+        index = self.load()
+        return index.get("artifacts", []) if index else []
+
+    def get(self, artifact_id: str) -> Optional[dict]:
+        """Index entry for ``artifact_id``."""
+        self.load()
+        return self._by_id.get(artifact_id)
+
+    def by_id(self) -> dict[str, dict]:
+        self.load()
+        return self._by_id
+
+    def by_type(self) -> dict[str, list[dict]]:
+        """Artifacts grouped by type, each group in index order."""
+        self.load()
+        return self._by_type
+
+    def related(self, artifact_id: str) -> list[tuple[str, float]]:
+        """Precomputed ``(neighbour id, cosine similarity)`` pairs for ``artifact_id``, most similar first.
+
+        Written by the indexer (see ``keys_indexer.related``); empty for
+        indexes saved before neighbours were computed.
+        """
+        index = self.load()
+        entries = (index or {}).get("related", {}).get(artifact_id, [])
+        return [(neighbour, similarity) for neighbour, similarity in entries]
+
+    def typed(self, artifact_id: str) -> Optional[KnowledgeArtifact]:
+        """The entry as a ``KnowledgeArtifact`` (None if missing or not parseable)."""
+        entry = self.get(artifact_id)
+        if entry is None:
+            return None
+        with self._lock:
+            if artifact_id not in self._typed:
+                try:
+                    self._typed[artifact_id] = KnowledgeArtifact.from_dict(entry)
+                except (KeyError, ValueError):
+                    return None
+            return self._typed[artifact_id]
+
+
+_shared: dict[Path, IndexRepository] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_index(index_path: Path) -> IndexRepository:
+    """Process-wide repository for ``index_path``, so components share one parsed index."""
+    key = Path(os.path.abspath(index_path))
+    with _shared_lock:
+        if key not in _shared:
+            _shared[key] = IndexRepository(index_path)
+        return _shared[key]
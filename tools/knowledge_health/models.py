@@ -231,7 +231,11 @@ class HealthMetrics:
             **{k: v for k, v in data["relevance_health"].items() if k != "status" and k != "last_assessed"},
             last_assessed=datetime.fromisoformat(data["relevance_health"]["last_assessed"]) if data["relevance_health"].get("last_assessed") else None,
         )
-        exec_hist = ExecutionHistory(**data["execution_history"])
+        exec_hist = ExecutionHistory(
+            **{k: v for k, v in data["execution_history"].items() if k not in ("last_success", "last_failure")},
+            last_success=datetime.fromisoformat(data["execution_history"]["last_success"]) if data["execution_history"].get("last_success") else None,
+            last_failure=datetime.fromisoformat(data["execution_history"]["last_failure"]) if data["execution_history"].get("last_failure") else None,
+        )
         
         return cls(
             artifact_id=data["artifact_id"],
@@ -338,6 +342,10 @@ class KnowledgeHealthReport:
     # Summary statistics
     average_health_score: float = 0.0
     health_score_trend: str = "stable"  # improving, stable, declining
+    health_score_slope: float = 0.0  # Points per day over the trend window
+    
+    # Score slopes (points per day) of artifacts that are improving or declining
+    artifact_trends: dict[str, float] = field(default_factory=dict)
     
     def to_dict(self) -> dict:
         return {
@@ -355,6 +363,8 @@ class KnowledgeHealthReport:
             "curation_recommendations": [r.to_dict() for r in self.curation_recommendations],
             "average_health_score": round(self.average_health_score, 2),
             "health_score_trend": self.health_score_trend,
+            "health_score_slope": round(self.health_score_slope, 4),
+            "artifact_trends": {k: round(v, 4) for k, v in self.artifact_trends.items()},
         }
     
     def to_markdown(self) -> str:
@@ -369,7 +379,7 @@ class KnowledgeHealthReport:
             "",
             f"- **Total Artifacts**: {self.total_artifacts}",
             f"- **Average Health Score**: {self.average_health_score:.1f}/100",
-            f"- **Health Trend**: {self.health_score_trend.title()}",
+            f"- **Health Trend**: {self.health_score_trend.title()} ({self.health_score_slope:+.2f} points/day)",
             "",
             "### Health Distribution",
             "",
@@ -410,6 +420,20 @@ class KnowledgeHealthReport:
         else:
             lines.append("No curation recommendations at this time.")
         
+        declining = sorted((v, k) for k, v in self.artifact_trends.items() if v < 0)
+        if declining:
+            lines.extend([
+                "",
+                "## Declining Artifacts",
+                "",
+                f"| Artifact | Score | Trend (points/day) |",
+                f"|----------|-------|--------------------|",
+            ])
+            for slope, aid in declining[:15]:
+                metrics = self.health_metrics.get(aid)
+                score = f"{metrics.health_score:.0f}" if metrics else "-"
+                lines.append(f"| {aid[:40]}... | {score} | {slope:+.2f} |")
+        
         lines.extend([
             "",
             "## Critical Artifacts (Score < 50)",
@@ -0,0 +1,83 @@
+"""Fused scan pipeline: index, health and drift in one pass over the files.
+
+A normal report run touches every artifact file several times: the indexer
+extracts it, the health check stats it and drift detection reads it again
+for deprecated APIs and runbook sections. The fused pipeline chains those
+stages as generators over ``KeysIndexer.scan``, so each file is opened once:
+its stat is kept for the health checks and its text is scanned for content
+drift while still in memory.
+"""
+
+from typing import Iterator
+
+from ..keys_indexer.indexer import KeysIndexer
+from ..keys_indexer.scan import ScannedFile
+from .drift_detector import DriftDetector
+from .health_monitor import HealthMonitor, StatBatch
+from .models import DriftAlert, HealthMetrics
+
+
+def extract_stage(indexer: KeysIndexer) -> Iterator[tuple[dict, ScannedFile]]:
+    """Index entries (validated) with the file each came from."""
+    for artifact, scanned in indexer.scan(validate=True):
+        yield artifact.to_dict(), scanned
+
+
+def stat_stage(
+    items: Iterator[tuple[dict, ScannedFile]],
+    batch: StatBatch,
+) -> Iterator[tuple[dict, ScannedFile]]:
+    """Record the stat taken when each file was read in ``batch``, for the health checks."""
+    for artifact, scanned in items:
+        batch.stats[scanned.path] = scanned.stat
+        yield artifact, scanned
+
+
+def content_drift_stage(
+    items: Iterator[tuple[dict, ScannedFile]],
+    detector: DriftDetector,
+) -> Iterator[tuple[str, list[DriftAlert]]]:
+    """Content drift alerts per artifact id, scanning the text already in memory.
+
+    Duplicate ids are scanned once, for their first entry, as the index
+    repository resolves them.
+    """
+    seen = set()
+    for artifact, scanned in items:
+        if artifact["id"] in seen:
+            continue
+        seen.add(artifact["id"])
+        yield artifact["id"], detector.detect_content_drift(artifact["id"], artifact, scanned.text(errors="ignore"))
+
+
+def run_fused_scan(
+    indexer: KeysIndexer,
+    monitor: HealthMonitor,
+    detector: DriftDetector,
+    max_workers: int = 1,
+    incremental: bool = True,
+) -> tuple[dict[str, HealthMetrics], list[DriftAlert]]:
+    """Re-index the repository and compute health and drift in one streaming pass.
+
+    The fresh index is saved (where the monitor and detector read it), then
+    health is checked with ``HealthMonitor.check_artifacts`` over the stats
+    taken during the scan, so the incremental state and score matrix are
+    the same as for ``check_all_health``. Returns the same metrics and
+    alerts as running the indexer, ``check_all_health`` and
+    ``detect_all_drift`` one after another.
+    """
+    batch = monitor._stat_batch([])
+    content_alerts = dict(content_drift_stage(stat_stage(extract_stage(indexer), batch), detector))
+
+    indexer.save_index(detector.index.path.name)
+    health_metrics = monitor.check_artifacts(monitor.index.artifacts(), batch, max_workers, incremental)
+
+    alerts: list[DriftAlert] = []
+    for artifact_id, metrics in health_metrics.items():
+        artifact = detector.index.get(artifact_id)
+        if artifact:
+            alerts.extend(detector.detect_metric_drift(artifact_id, metrics, artifact))
+            alerts.extend(content_alerts.get(artifact_id, []))
+    alerts.extend(detector._detect_superseded_artifacts(health_metrics))
+    detector.symbol_cache.save()
+    return health_metrics, alerts
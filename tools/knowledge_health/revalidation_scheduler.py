@@ -14,12 +14,17 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
+from ..keys_indexer.checkpoint import RunCheckpoint, run_fingerprint
+from ..keys_indexer.execution_log import record_execution
 from .models import (
     HealthMetrics,
     RevalidationSchedule,
     SystemHealthConfig,
 )
-from .health_monitor import HealthMonitor
+from .health_monitor import HEALTH_STATE_NAME, HealthMonitor
+from .index_repository import IndexRepository, default_index_path, shared_index
+from .score_history import SCORE_HISTORY_DIR, HealthScoreHistory, classify_slope
+from .symbol_index import SYMBOL_CACHE_NAME
 
 
 class RevalidationScheduler:
@@ -30,11 +35,13 @@ class RevalidationScheduler:
         repo_root: Path,
         config: Optional[SystemHealthConfig] = None,
         schedules_path: Optional[Path] = None,
+        index: Optional[IndexRepository] = None,
     ):
         self.repo_root = Path(repo_root)
         self.config = config or SystemHealthConfig()
         self.schedules_path = schedules_path or self.repo_root / "outputs" / "knowledge_health" / "schedules.json"
-        self.health_monitor = HealthMonitor(repo_root, config)
+        self.index = index or shared_index(default_index_path(self.repo_root))
+        self.health_monitor = HealthMonitor(repo_root, config, index=self.index)
         self._schedules: dict[str, RevalidationSchedule] = {}
         self._load_schedules()
     
@@ -115,16 +122,7 @@ class RevalidationScheduler:
     ) -> dict[str, Any]:
         """Run revalidation for a single artifact."""
         # Load artifact from index
-        index_path = self.repo_root / "outputs" / "keys_index" / "kb_index.json"
-        artifact = None
-        
-        if index_path.exists():
-            with open(index_path, "r", encoding="utf-8") as f:
-                index = json.load(f)
-                for art in index.get("artifacts", []):
-                    if art.get("id") == artifact_id:
-                        artifact = art
-                        break
+        artifact = self.index.get(artifact_id)
         
         if not artifact:
             return {
@@ -140,6 +138,14 @@ class RevalidationScheduler:
         validation_result = None
         if not dry_run:
             validation_result = self._execute_validation(artifact)
+            record_execution(
+                self.repo_root,
+                artifact_id,
+                validation_result.get("success", False),
+                "revalidation",
+                duration_ms=validation_result.get("execution_time_ms", 0.0),
+                error="; ".join(validation_result.get("errors", [])),
+            )
         
         # Update schedule
         schedule = self._schedules.get(artifact_id)
@@ -336,16 +342,7 @@ class RevalidationScheduler:
     ) -> dict[str, Any]:
         """Check dependencies for updates or issues."""
         # Load artifact
-        index_path = self.repo_root / "outputs" / "keys_index" / "kb_index.json"
-        artifact = None
-        
-        if index_path.exists():
-            with open(index_path, "r", encoding="utf-8") as f:
-                index = json.load(f)
-                for art in index.get("artifacts", []):
-                    if art.get("id") == artifact_id:
-                        artifact = art
-                        break
+        artifact = self.index.get(artifact_id)
         
         if not artifact:
             return {
@@ -380,20 +377,38 @@ class RevalidationScheduler:
             "unknown": unknown,
         }
     
-    def run_all_due(self, dry_run: bool = True) -> dict[str, Any]:
-        """Run revalidation for all artifacts that are due."""
-        due_artifacts = self.get_due_artifacts()
+    def run_all_due(self, dry_run: bool = True, resume: bool = False) -> dict[str, Any]:
+        """Run revalidation for all artifacts that are due.
+        
+        With ``resume=True``, artifacts already revalidated by an interrupted
+        run (same HEAD, config and dry-run mode) are taken from the checkpoint
+        instead of being revalidated again.
+        """
+        checkpoint = RunCheckpoint(
+            self.schedules_path.parent / ".revalidation_checkpoint.json",
+            run_fingerprint(
+                self.repo_root,
+                {"stage": "revalidate", "dry_run": dry_run, "config": self.config.to_dict()},
+            ),
+        )
+        if resume:
+            checkpoint.load()
+        else:
+            checkpoint.clear()
+        
+        # Schedules are flushed alongside the checkpoint, so artifacts finished
+        # before an interruption are no longer due; report them from the checkpoint.
+        due_artifacts = [a for a in self.get_due_artifacts() if a not in checkpoint]
         
         results = {
-            "total_due": len(due_artifacts),
+            "total_due": len(due_artifacts) + len(checkpoint),
             "processed": 0,
             "successful": 0,
             "failed": 0,
             "details": [],
         }
         
-        for artifact_id in due_artifacts:
-            result = self.run_revalidation(artifact_id, dry_run=dry_run)
+        def tally(result: dict[str, Any]) -> None:
             results["details"].append(result)
             results["processed"] += 1
             
@@ -402,31 +417,70 @@ class RevalidationScheduler:
             else:
                 results["failed"] += 1
         
+        for _, result in checkpoint.items():
+            tally(result)
+        
+        for artifact_id in due_artifacts:
+            result = self.run_revalidation(artifact_id, dry_run=dry_run)
+            tally(result)
+            
+            if checkpoint.record(artifact_id, result):
+                self._save_schedules()
+        
         # Save updated schedules
         self._save_schedules()
+        checkpoint.clear()
         
         return results
     
     def generate_health_reports(
         self,
         output_dir: Optional[Path] = None,
+        max_workers: int = 1,
+        incremental: bool = True,
+        fused: bool = False,
     ) -> tuple[Path, Path]:
-        """Generate both JSON and Markdown health reports."""
+        """Generate both JSON and Markdown health reports.
+        
+        ``max_workers`` and ``incremental`` are passed to
+        ``HealthMonitor.check_all_health``; unless the monitor already has a
+        state file, its incremental state is kept in ``output_dir``.
+        
+        With ``fused``, the repository is re-indexed first, in one streaming
+        pass that reads each artifact file once and feeds its stat and text
+        to the health and drift checks (see ``pipeline.run_fused_scan``).
+        """
         from .drift_detector import DriftDetector
         from .curation_engine import CurationEngine
         
         output_dir = output_dir or self.repo_root / "outputs" / "knowledge_health"
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Check health for all artifacts
-        health_metrics = self.health_monitor.check_all_health()
-        
-        # Detect drift
-        drift_detector = DriftDetector(self.repo_root, self.config)
-        alerts = drift_detector.detect_all_drift(health_metrics)
+        drift_detector = DriftDetector(
+            self.repo_root,
+            self.config,
+            index=self.index,
+            symbol_cache_path=output_dir / SYMBOL_CACHE_NAME,
+        )
+        if self.health_monitor.state_path is None:
+            self.health_monitor.state_path = output_dir / HEALTH_STATE_NAME
+        if fused:
+            from ..keys_indexer.indexer import KeysIndexer
+            from .pipeline import run_fused_scan
+            
+            indexer = KeysIndexer(self.repo_root, output_dir=self.index.path.parent)
+            health_metrics, alerts = run_fused_scan(
+                indexer, self.health_monitor, drift_detector, max_workers=max_workers, incremental=incremental
+            )
+        else:
+            # Check health for all artifacts
+            health_metrics = self.health_monitor.check_all_health(max_workers=max_workers, incremental=incremental)
+            
+            # Detect drift
+            alerts = drift_detector.detect_all_drift(health_metrics)
         
         # Generate curation recommendations
-        curation = CurationEngine(self.repo_root, self.config)
+        curation = CurationEngine(self.repo_root, self.config, index=self.index)
         recommendations = curation.generate_recommendations(health_metrics, alerts)
         
         # Build report
@@ -450,6 +504,17 @@ class RevalidationScheduler:
             average_health_score=summary["average_score"],
         )
         
+        # Record this run's scores and derive trends from the history
+        history = HealthScoreHistory(output_dir / SCORE_HISTORY_DIR)
+        history.append({aid: m.health_score for aid, m in health_metrics.items()}, report.generated_at)
+        trends = history.trends(now=report.generated_at)
+        report.health_score_trend = trends.repo_trend
+        report.health_score_slope = trends.repo_slope
+        report.artifact_trends = {
+            aid: slope for aid, slope in trends.artifact_slopes.items()
+            if aid in health_metrics and classify_slope(slope) != "stable"
+        }
+        
         # Save JSON report
         json_path = output_dir / "knowledge_health.json"
         with open(json_path, "w", encoding="utf-8") as f:
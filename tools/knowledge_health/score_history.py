@@ -0,0 +1,227 @@
+"""Time series of per-artifact health scores, for real health trends.
+
+Every health check appends its scores to a small columnar store: one raw
+binary file per column (timestamp, artifact code, score) plus the list of
+artifact ids the codes refer to. Appends only ever extend the column files.
+Retention runs on append: raw samples older than ``raw_days`` are rolled up
+into daily means, daily means older than ``daily_days`` into weekly means,
+and weekly means older than ``weekly_days`` are dropped.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from ..keys_indexer.checkpoint import atomic_write_json
+
+
+DAY = 86400
+WEEK = 7 * DAY
+
+# (file suffix, dtype) per column; a tier is a directory of these files
+COLUMNS = (
+    ("t", np.dtype("<i8")),  # Unix seconds (start of the UTC day/week for rollups)
+    ("artifact", np.dtype("<i4")),  # Index into artifacts.json
+    ("score", np.dtype("<f4")),
+)
+TIERS = ("raw", "daily", "weekly")
+
+# Store directory under the knowledge_health output directory
+SCORE_HISTORY_DIR = "score_history"
+
+# Slope (score points per day) beyond which a trend is improving/declining
+TREND_THRESHOLD = 0.1
+
+
+@dataclass
+class HealthTrends:
+    """Least-squares score slopes (points per day) over a window."""
+    repo_slope: float = 0.0
+    repo_trend: str = "stable"
+    artifact_slopes: dict[str, float] = field(default_factory=dict)
+
+    def artifact_trend(self, artifact_id: str) -> str:
+        return classify_slope(self.artifact_slopes.get(artifact_id, 0.0))
+
+
+def classify_slope(slope: float) -> str:
+    if slope > TREND_THRESHOLD:
+        return "improving"
+    if slope < -TREND_THRESHOLD:
+        return "declining"
+    return "stable"
+
+
+class HealthScoreHistory:
+    """Append-only columnar store of health scores under ``path``."""
+
+    def __init__(
+        self,
+        path: Path,
+        raw_days: int = 30,
+        daily_days: int = 180,
+        weekly_days: int = 730,
+    ):
+        self.path = Path(path)
+        self.raw_days = raw_days
+        self.daily_days = daily_days
+        self.weekly_days = weekly_days
+        self._ids: Optional[list[str]] = None
+
+    # Artifact ids
+
+    def _ids_path(self) -> Path:
+        return self.path / "artifacts.json"
+
+    def artifact_ids(self) -> list[str]:
+        if self._ids is None:
+            try:
+                with open(self._ids_path(), "r", encoding="utf-8") as f:
+                    self._ids = json.load(f)
+            except FileNotFoundError:
+                self._ids = []
+        return self._ids
+
+    def _codes(self, artifact_ids: list[str]) -> np.ndarray:
+        """Codes for ``artifact_ids``, registering new ids first."""
+        ids = self.artifact_ids()
+        index = {aid: i for i, aid in enumerate(ids)}
+        new = [aid for aid in dict.fromkeys(artifact_ids) if aid not in index]
+        if new:
+            for aid in new:
+                index[aid] = len(ids)
+                ids.append(aid)
+            # Written before any sample can refer to the new codes
+            atomic_write_json(self._ids_path(), ids)
+        return np.fromiter((index[aid] for aid in artifact_ids), dtype=np.int32, count=len(artifact_ids))
+
+    # Column files
+
+    def _read_tier(self, tier: str) -> dict[str, np.ndarray]:
+        columns = {}
+        for name, dtype in COLUMNS:
+            path = self.path / tier / f"{name}.bin"
+            columns[name] = np.fromfile(path, dtype=dtype) if path.exists() else np.empty(0, dtype=dtype)
+        # An interrupted append can leave columns of different lengths
+        n = min(len(c) for c in columns.values())
+        return {name: c[:n] for name, c in columns.items()}
+
+    def _append_tier(self, tier: str, columns: dict[str, np.ndarray]) -> None:
+        directory = self.path / tier
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, dtype in COLUMNS:
+            with open(directory / f"{name}.bin", "ab") as f:
+                columns[name].astype(dtype, copy=False).tofile(f)
+
+    def _write_tier(self, tier: str, columns: dict[str, np.ndarray]) -> None:
+        directory = self.path / tier
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, dtype in COLUMNS:
+            tmp = directory / f"{name}.bin.tmp"
+            columns[name].astype(dtype, copy=False).tofile(tmp)
+            tmp.replace(directory / f"{name}.bin")
+
+    # Public API
+
+    def append(self, scores: dict[str, float], timestamp: Optional[datetime] = None) -> None:
+        """Record one run's scores, then apply retention."""
+        if not scores:
+            return
+        now = int((timestamp or datetime.now()).timestamp())
+        ids = list(scores)
+        self._append_tier("raw", {
+            "t": np.full(len(ids), now, dtype=np.int64),
+            "artifact": self._codes(ids),
+            "score": np.fromiter(scores.values(), dtype=np.float32, count=len(ids)),
+        })
+        self.compact(now)
+
+    def compact(self, now: Optional[int] = None) -> None:
+        """Roll expired raw samples into daily means and expired daily means into weekly ones.
+
+        Rows are appended in time order, so expired rows are always a prefix
+        of their tier; a tier is only rewritten when it has expired rows. The
+        cutoff is rounded down to a whole day (week), so each rollup period
+        is written exactly once.
+        """
+        now = int(datetime.now().timestamp()) if now is None else now
+        for tier, next_tier, keep_days, period in (
+            ("raw", "daily", self.raw_days, DAY),
+            ("daily", "weekly", self.daily_days, WEEK),
+        ):
+            columns = self._read_tier(tier)
+            cutoff = now - keep_days * DAY
+            expired = int(np.searchsorted(columns["t"], cutoff - cutoff % period))
+            if not expired:
+                continue
+            old = {name: c[:expired] for name, c in columns.items()}
+            self._append_tier(next_tier, _rollup(old, period))
+            self._write_tier(tier, {name: c[expired:] for name, c in columns.items()})
+
+        weekly = self._read_tier("weekly")
+        expired = int(np.searchsorted(weekly["t"], now - self.weekly_days * DAY))
+        if expired:
+            self._write_tier("weekly", {name: c[expired:] for name, c in weekly.items()})
+
+    def load(self, since: Optional[int] = None) -> dict[str, np.ndarray]:
+        """All samples (rollups first, then raw) as columns, optionally from ``since`` on."""
+        tiers = [self._read_tier(tier) for tier in reversed(TIERS)]
+        columns = {name: np.concatenate([t[name] for t in tiers]) for name, _ in COLUMNS}
+        if since is not None:
+            keep = columns["t"] >= since
+            columns = {name: c[keep] for name, c in columns.items()}
+        return columns
+
+    def trends(self, window_days: int = 30, now: Optional[datetime] = None) -> HealthTrends:
+        """Score slopes over the last ``window_days`` for every artifact and the repo.
+
+        All artifact slopes come from one grouped least-squares fit over the
+        window's samples. The repo slope is the mean slope of the artifacts
+        sampled at two or more times, so artifacts added or removed during
+        the window do not register as a trend.
+        """
+        now_ts = int((now or datetime.now()).timestamp())
+        columns = self.load(since=now_ts - window_days * DAY)
+        if not len(columns["t"]):
+            return HealthTrends()
+
+        ids = self.artifact_ids()
+        x = (columns["t"] - now_ts) / DAY
+        y = columns["score"].astype(np.float64)
+        slopes, fitted = _grouped_slopes(columns["artifact"], x, y, len(ids))
+        repo_slope = float(slopes[fitted].mean()) if fitted.any() else 0.0
+
+        present = np.unique(columns["artifact"])
+        return HealthTrends(
+            repo_slope=repo_slope,
+            repo_trend=classify_slope(repo_slope),
+            artifact_slopes={ids[code]: float(slopes[code]) for code in present.tolist()},
+        )
+
+
+def _rollup(columns: dict[str, np.ndarray], period: int) -> dict[str, np.ndarray]:
+    """Mean score per (artifact, period), stamped with the period start, in time order."""
+    bucket = columns["t"] - columns["t"] % period
+    keys = np.stack([bucket, columns["artifact"].astype(np.int64)], axis=1)
+    unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    sums = np.bincount(inverse, weights=columns["score"], minlength=len(unique))
+    counts = np.bincount(inverse, minlength=len(unique))
+    return {"t": unique[:, 0], "artifact": unique[:, 1], "score": sums / counts}
+
+
+def _grouped_slopes(groups: np.ndarray, x: np.ndarray, y: np.ndarray, n_groups: int) -> tuple[np.ndarray, np.ndarray]:
+    """Least-squares slope of y over x per group, and which groups had x vary (others get 0)."""
+    n = np.bincount(groups, minlength=n_groups)
+    sx = np.bincount(groups, weights=x, minlength=n_groups)
+    sy = np.bincount(groups, weights=y, minlength=n_groups)
+    sxy = np.bincount(groups, weights=x * y, minlength=n_groups)
+    sxx = np.bincount(groups, weights=x * x, minlength=n_groups)
+    denominator = n * sxx - sx * sx
+    numerator = n * sxy - sx * sy
+    valid = denominator > 1e-9 * np.maximum(n, 1) ** 2
+    return np.divide(numerator, denominator, out=np.zeros(n_groups), where=valid), valid
@@ -0,0 +1,156 @@
+"""Vectorized health scoring.
+
+Component scores for all artifacts are kept in one NumPy array (a row per
+artifact, a column per component) and combined with the configured weights
+in a single pass, so scores and statuses can be re-evaluated under another
+``SystemHealthConfig`` without re-checking any artifact.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from .models import (
+    DependencyStatus,
+    EnvironmentStatus,
+    HealthMetrics,
+    HealthStatus,
+    RelevanceStatus,
+    SystemHealthConfig,
+)
+
+
+COMPONENTS = ("dependency", "environment", "relevance", "execution")
+
+# Index returned by np.digitize over (decayed, critical, degraded) thresholds
+STATUS_BY_CODE = (HealthStatus.DECAYED, HealthStatus.CRITICAL, HealthStatus.DEGRADED, HealthStatus.HEALTHY)
+
+_DEPENDENCY_CAPS = {
+    DependencyStatus.BROKEN: 20.0,
+    DependencyStatus.STALE: 50.0,
+    DependencyStatus.UNKNOWN: 70.0,
+}
+
+_ENVIRONMENT_SCORES = {
+    EnvironmentStatus.INCOMPATIBLE: 0.0,
+    EnvironmentStatus.DRIFTED: 60.0,
+    EnvironmentStatus.COMPATIBLE: 100.0,
+    EnvironmentStatus.UNKNOWN: 75.0,  # Unknown is moderately concerning
+}
+
+_RELEVANCE_SCORES = {
+    RelevanceStatus.DEPRECATED: 10.0,
+    RelevanceStatus.SUPERSEDED: 20.0,
+    RelevanceStatus.STALE: 50.0,
+    RelevanceStatus.AGING: 80.0,
+    RelevanceStatus.CURRENT: 100.0,
+}
+
+
+class HealthScoreMatrix:
+    """Component scores (0-100) for a set of artifacts.
+
+    The execution column is stored before the consecutive-failure cap, which
+    depends on ``auto_flag_broken_after_failures``; the cap is applied when
+    scoring so that setting can be tuned too.
+    """
+
+    def __init__(self, artifact_ids: list[str], components: np.ndarray, failed_runs: np.ndarray, attempted: np.ndarray):
+        self.artifact_ids = artifact_ids
+        self.components = components
+        self.failed_runs = failed_runs
+        self.attempted = attempted
+
+    def __len__(self) -> int:
+        return len(self.artifact_ids)
+
+    @classmethod
+    def from_metrics(cls, metrics: list[HealthMetrics], now: Optional[datetime] = None) -> "HealthScoreMatrix":
+        """Compute component scores from checked metrics."""
+        now = now or datetime.now()
+        n = len(metrics)
+
+        dep = np.empty((n, 5))  # total, broken, stale, outdated, unknown
+        dep_cap = np.full(n, np.inf)
+        env = np.empty(n)
+        rel = np.empty(n)
+        rel_age = np.empty((n, 3))  # days since update, days since verification, usage count
+        runs = np.empty((n, 3))  # attempts, successful, failed
+        days_since_failure = np.full(n, np.nan)
+
+        for i, m in enumerate(metrics):
+            d = m.dependency_health
+            dep[i] = (d.total_deps, d.broken_deps, d.stale_deps, d.outdated_deps, d.unknown_deps)
+            dep_cap[i] = _DEPENDENCY_CAPS.get(d.status, np.inf)
+            env[i] = _ENVIRONMENT_SCORES.get(m.environment_health.status, 75.0)
+            r = m.relevance_health
+            rel[i] = _RELEVANCE_SCORES.get(r.status, 100.0)
+            rel_age[i] = (r.days_since_update, r.days_since_verification, r.usage_count)
+            h = m.execution_history
+            runs[i] = (h.total_attempts, h.successful_runs, h.failed_runs)
+            if h.last_failure:
+                days_since_failure[i] = (now - h.last_failure).days
+
+        components = np.empty((n, len(COMPONENTS)))
+
+        # Dependencies: penalties per problem dependency, capped by overall status
+        penalised = 100 - dep[:, 1] * 30 - dep[:, 2] * 20 - dep[:, 3] * 10 - dep[:, 4] * 5
+        penalised = np.maximum(0.0, np.minimum(penalised, dep_cap))
+        components[:, 0] = np.where(dep[:, 0] == 0, 100.0, penalised)
+
+        components[:, 1] = env
+
+        # Relevance: status base score, age penalties and a usage bonus
+        rel = rel - np.where(rel_age[:, 0] > 365, 10, 0)
+        rel = rel - np.where(rel_age[:, 1] > 180, 5, 0)
+        rel = rel + np.where(rel_age[:, 2] > 10, 5, 0)
+        components[:, 2] = np.clip(rel, 0.0, 100.0)
+
+        # Execution: success rate minus a recent-failure penalty (no runs yet is neutral)
+        attempted = runs[:, 0] > 0
+        success_rate = np.divide(runs[:, 1], runs[:, 0], out=np.zeros(n), where=attempted)
+        execution = success_rate * 100
+        execution = execution - np.where(days_since_failure < 7, 20, np.where(days_since_failure < 30, 10, 0))
+        components[:, 3] = np.where(attempted, np.clip(execution, 0.0, 100.0), 75.0)
+
+        return cls([m.artifact_id for m in metrics], components, runs[:, 2], attempted)
+
+    def scores(self, config: SystemHealthConfig) -> np.ndarray:
+        """Weighted overall score per artifact under ``config``."""
+        execution = self.components[:, 3]
+        flagged = self.attempted & (self.failed_runs >= config.auto_flag_broken_after_failures)
+        execution = np.where(flagged, np.minimum(execution, 30.0), execution)
+
+        # Summed term by term, in the same order as a scalar weighted average
+        score = (
+            self.components[:, 0] * config.dependency_weight +
+            self.components[:, 1] * config.environment_weight +
+            self.components[:, 2] * config.relevance_weight +
+            execution * config.execution_weight
+        )
+        return np.clip(score, 0.0, 100.0)
+
+    def status_codes(self, config: SystemHealthConfig, scores: Optional[np.ndarray] = None) -> np.ndarray:
+        """Index into ``STATUS_BY_CODE`` per artifact (a score on a threshold gets the better status)."""
+        if scores is None:
+            scores = self.scores(config)
+        bins = [config.decayed_threshold, config.critical_threshold, config.degraded_threshold]
+        return np.digitize(scores, bins)
+
+    def rescore(self, config: SystemHealthConfig) -> tuple[np.ndarray, np.ndarray]:
+        """Scores and status codes under an alternative config, without re-checking anything."""
+        scores = self.scores(config)
+        return scores, self.status_codes(config, scores)
+
+    def status_counts(self, config: SystemHealthConfig) -> dict[str, int]:
+        """Number of artifacts per status under ``config``."""
+        counts = np.bincount(self.status_codes(config), minlength=len(STATUS_BY_CODE))
+        return {status.value: int(count) for status, count in zip(STATUS_BY_CODE, counts)}
+
+    def apply(self, metrics: list[HealthMetrics], config: SystemHealthConfig) -> None:
+        """Set ``health_score`` and ``status`` on the metrics this matrix was built from."""
+        scores, codes = self.rescore(config)
+        for m, score, code in zip(metrics, scores.tolist(), codes.tolist()):
+            m.health_score = score
+            m.status = STATUS_BY_CODE[code]
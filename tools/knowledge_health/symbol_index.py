@@ -0,0 +1,269 @@
+"""Per-file Python symbol index for deprecated-API detection.
+
+One AST pass over an artifact's Python code records what it imports and
+every dotted name it uses, resolved through import aliases and simple
+local types: after ``import pandas as pd`` and ``df = pd.read_csv(...)``,
+``df.append(...)`` is recorded as a call to ``pandas.read_csv().append``
+(``X()`` stands for "a value returned by X"). Comments and strings are
+never symbols, so rules evaluated against the index (see
+``deprecation_rules``) do not fire on them.
+
+Python code is taken from ``.py`` files, notebook code cells and fenced
+``python`` blocks in Markdown. Symbols are cached by content hash in
+``SymbolCache``, so unchanged files are not parsed again.
+"""
+
+import ast
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from ..keys_indexer.checkpoint import atomic_write_json
+
+
+# Bump when what is recorded changes, to invalidate cached symbols
+SYMBOL_INDEX_VERSION = 1
+
+# Symbol cache file, kept in the knowledge_health output directory
+SYMBOL_CACHE_NAME = "symbol_index.json"
+
+# String arguments kept per call (for rules like "warnings.warn mentioning deprecation")
+_MAX_CALL_STRINGS = 3
+_MAX_STRING_LENGTH = 200
+
+_FENCE_RE = re.compile(r"^```[ \t]*(?:python|py|python3)[ \t]*\n(.*?)^```", re.MULTILINE | re.DOTALL)
+
+
+@dataclass
+class FileSymbols:
+    """Imports, resolved references and calls (with line numbers) of one file's Python code."""
+    imports: list[str] = field(default_factory=list)
+    references: dict[str, list[int]] = field(default_factory=dict)
+    calls: dict[str, list[list]] = field(default_factory=dict)  # name -> [[line, [strings]], ...]
+    sources: int = 0  # Python sources found
+    unparsed: int = 0  # ... of which had syntax errors
+
+    def to_dict(self) -> dict:
+        return {
+            "imports": self.imports,
+            "references": self.references,
+            "calls": self.calls,
+            "sources": self.sources,
+            "unparsed": self.unparsed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FileSymbols":
+        return cls(
+            imports=data.get("imports", []),
+            references=data.get("references", {}),
+            calls=data.get("calls", {}),
+            sources=data.get("sources", 0),
+            unparsed=data.get("unparsed", 0),
+        )
+
+
+class _SymbolVisitor(ast.NodeVisitor):
+    """Collects symbols across one or more sources sharing a namespace (e.g. notebook cells).
+
+    Scoping is flat: a name bound anywhere keeps its meaning until rebound.
+    """
+
+    def __init__(self):
+        self.names: dict[str, str] = {}
+        self.imports: dict[str, None] = {}
+        self.references: dict[str, list[int]] = {}
+        self.calls: dict[str, list[list]] = {}
+        self.offset = 0
+
+    def resolve(self, node: ast.AST) -> Optional[str]:
+        """Qualified name of an expression, if it derives from an import or a typed local."""
+        if isinstance(node, ast.Name):
+            return self.names.get(node.id)
+        if isinstance(node, ast.Attribute):
+            base = self.resolve(node.value)
+            return f"{base}.{node.attr}" if base else None
+        if isinstance(node, ast.Call):
+            base = self.resolve(node.func)
+            return f"{base}()" if base else None
+        return None
+
+    def _line(self, node: ast.AST) -> int:
+        return getattr(node, "lineno", 0) + self.offset
+
+    def _bind(self, target: ast.AST, value: Optional[str]) -> None:
+        if isinstance(target, ast.Name):
+            if value:
+                self.names[target.id] = value
+            else:
+                self.names.pop(target.id, None)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.imports[alias.name] = None
+            if alias.asname:
+                self.names[alias.asname] = alias.name
+            else:
+                top = alias.name.split(".")[0]
+                self.names[top] = top
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.level or not node.module:
+            return  # Relative imports are the repo's own code
+        self.imports[node.module] = None
+        for alias in node.names:
+            if alias.name == "*":
+                continue
+            qualified = f"{node.module}.{alias.name}"
+            self.imports[qualified] = None
+            self.names[alias.asname or alias.name] = qualified
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        self.visit(node.value)
+        value = self.resolve(node.value)
+        for target in node.targets:
+            self.visit(target)
+            self._bind(target, value)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        self.visit(node.annotation)
+        if node.value is not None:
+            self.visit(node.value)
+        self.visit(node.target)
+        annotation = self.resolve(node.annotation)
+        value = self.resolve(node.value) if node.value is not None else None
+        self._bind(node.target, value or (f"{annotation}()" if annotation else None))
+
+    def visit_arg(self, node: ast.arg) -> None:
+        if node.annotation is not None:
+            self.visit(node.annotation)
+            annotation = self.resolve(node.annotation)
+            if annotation:
+                self.names[node.arg] = f"{annotation}()"
+                return
+        self.names.pop(node.arg, None)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if isinstance(node.ctx, ast.Load):
+            qualified = self.names.get(node.id)
+            if qualified:
+                self.references.setdefault(qualified, []).append(self._line(node))
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        qualified = self.resolve(node)
+        if qualified:
+            self.references.setdefault(qualified, []).append(self._line(node))
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        qualified = self.resolve(node.func)
+        if qualified:
+            strings = [
+                arg.value[:_MAX_STRING_LENGTH]
+                for arg in [*node.args, *(k.value for k in node.keywords)]
+                if isinstance(arg, ast.Constant) and isinstance(arg.value, str)
+            ]
+            self.calls.setdefault(qualified, []).append([self._line(node), strings[:_MAX_CALL_STRINGS]])
+        self.generic_visit(node)
+
+
+def python_sources(path: Path, content: str) -> list[tuple[str, int]]:
+    """Python code in an artifact file, as ``(source, line offset)`` pairs."""
+    suffix = path.suffix.lower()
+    if suffix == ".py":
+        return [(content, 0)]
+    if suffix == ".ipynb":
+        try:
+            notebook = json.loads(content)
+        except ValueError:
+            return []
+        sources = []
+        for cell in notebook.get("cells", []):
+            if cell.get("cell_type") != "code":
+                continue
+            source = cell.get("source", "")
+            if isinstance(source, list):
+                source = "".join(source)
+            # IPython magics and shell escapes are not Python
+            lines = ["" if line.lstrip().startswith(("%", "!")) else line for line in source.split("\n")]
+            sources.append(("\n".join(lines), 0))
+        return sources
+    if suffix == ".md":
+        return [
+            (match.group(1), content.count("\n", 0, match.start(1)))
+            for match in _FENCE_RE.finditer(content)
+        ]
+    return []
+
+
+def build_symbols(sources: list[tuple[str, int]]) -> FileSymbols:
+    """Symbols of ``sources``, parsed in order into one namespace; sources that fail to parse are skipped."""
+    visitor = _SymbolVisitor()
+    unparsed = 0
+    for source, offset in sources:
+        try:
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError):
+            unparsed += 1
+            continue
+        visitor.offset = offset
+        visitor.visit(tree)
+    return FileSymbols(
+        imports=list(visitor.imports),
+        references=visitor.references,
+        calls=visitor.calls,
+        sources=len(sources),
+        unparsed=unparsed,
+    )
+
+
+class SymbolCache:
+    """``FileSymbols`` by content hash, optionally persisted to ``path``.
+
+    ``save`` keeps only the entries used since the cache was loaded, so
+    symbols of deleted or changed files do not accumulate.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict] = {}
+        self._used: set[str] = set()
+        self._dirty = False
+        if self.path:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == SYMBOL_INDEX_VERSION:
+            self._entries = data.get("files", {})
+
+    def symbols(self, path: Path, content: str) -> FileSymbols:
+        """Symbols of an artifact file's Python code, parsed only if this content was not seen before."""
+        digest = hashlib.sha256(f"{path.suffix.lower()}\0{content}".encode("utf-8", "surrogatepass")).hexdigest()
+        self._used.add(digest)
+        entry = self._entries.get(digest)
+        if entry is not None:
+            self.hits += 1
+            return FileSymbols.from_dict(entry)
+        self.misses += 1
+        symbols = build_symbols(python_sources(path, content))
+        self._entries[digest] = symbols.to_dict()
+        self._dirty = True
+        return symbols
+
+    def save(self) -> None:
+        if not self.path or not (self._dirty or set(self._entries) - self._used):
+            return
+        files = {digest: entry for digest, entry in self._entries.items() if digest in self._used}
+        atomic_write_json(self.path, {"version": SYMBOL_INDEX_VERSION, "files": files}, indent=None)
+        self._entries = files
+        self._dirty = False